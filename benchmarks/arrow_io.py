@@ -0,0 +1,52 @@
+""" Benchmark of reading unit-tagged Parquet columns, with and without conversion on read.
+
+Writes a Parquet file with a speed column in m/s and a temperature column in °C, then times reading both columns
+as they were written, reading them converted to km/h and °F (one multiply, and one add for the temperatures,
+per record batch), and reading them as written and converting the resulting arrays afterwards.
+
+    python benchmarks/arrow_io.py --rows 10000000
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+import numpy as np
+from ucalcx import MeasurementArray, Unit
+from ucalcx.interop import arrow
+from ucalcx.temperature import celsius, fahrenheit
+
+
+def timed(function, repeat: int = 3) -> float:
+    """ The shortest time of a few calls of a function. """
+
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reading unit-tagged Parquet columns.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="The number of rows in the file.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    columns = {"speed": MeasurementArray(rng.uniform(0, 40, arguments.rows), Unit.from_string("m/s")),
+               "temperature": MeasurementArray(rng.normal(20, 5, arguments.rows), celsius)}
+    units = {"speed": Unit.from_string("km/h"), "temperature": fahrenheit}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "readings.parquet")
+        written = timed(lambda: arrow.write_parquet(path, columns))
+        as_written = timed(lambda: arrow.read_parquet(path))
+        converted = timed(lambda: arrow.read_parquet(path, units=units))
+        afterwards = timed(lambda: [array.convert_to(units[name]) for name, array in arrow.read_parquet(path).items()])
+        size = os.path.getsize(path)
+
+    print(f"rows:               {arguments.rows:,}, {size / 2**20:,.1f} MiB on disk")
+    print(f"write:              {written * 1e3:,.1f} ms")
+    print(f"read:               {as_written * 1e3:,.1f} ms")
+    print(f"read, converted:    {converted * 1e3:,.1f} ms")
+    print(f"read, then convert: {afterwards * 1e3:,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+""" Benchmark of the first conversions of a fresh process, with and without the on-disk cache.
+
+Starts worker processes that import ucalcx, optionally load the cache file, and then parse and convert between a
+set of unit strings, and reports the time the workers spend on the conversions, with a cold cache and with a cache
+file written by an earlier worker.
+
+    python benchmarks/cache_startup.py --workers 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+
+WORKER = r'''
+import sys, time
+from ucalcx import Unit, cache
+start = time.perf_counter()
+if sys.argv[1] != "cold":
+    cache.load()
+loaded = time.perf_counter()
+for source, target in [("km", "m"), ("mi/h", "km/h"), ("°C", "°F"), ("kg*m/s^2", "g*cm/s^2"), ("ft^2", "m^2"),
+                       ("m/s", "ft/min"), ("g/cm^3", "kg/m^3"), ("nmi", "km"), ("lb", "kg"), ("K", "°C")]:
+    Unit.from_string(source).conversion_factors(Unit.from_string(target))
+done = time.perf_counter()
+if sys.argv[1] == "save":
+    cache.save()
+print(loaded - start, done - loaded)
+'''
+
+
+def run(mode: str, environment: dict) -> tuple[float, float]:
+    output = subprocess.run([sys.executable, "-c", WORKER, mode], capture_output=True, text=True, check=True, env=environment).stdout
+    load, convert = output.split()
+    return float(load), float(convert)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark starting workers with and without the on-disk cache.")
+    parser.add_argument("--workers", type=int, default=5, help="The number of workers started for each mode.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        environment = {**os.environ, "XDG_CACHE_HOME": directory}
+        run("save", environment)
+        for mode in ("cold", "warm"):
+            times = [run(mode, environment) for _ in range(arguments.workers)]
+            load = min(load for load, _ in times)
+            convert = min(convert for _, convert in times)
+            print(f"{mode}: load {load * 1e3:6.2f} ms, first conversions {convert * 1e3:6.2f} ms, total {(load + convert) * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+""" Benchmark of compiled converters against the generic conversion path.
+
+Times converting single values with `Unit.convert_to`, which resolves the cached factors on every call, against the
+function returned by `compile_converter`, which has the factors folded in as constants.
+
+    python benchmarks/converters.py --number 200000
+"""
+
+import argparse
+import timeit
+from ucalcx import compile_converter, Unit
+from ucalcx.length import meter, kilometer
+from ucalcx.length.imperial import foot
+from ucalcx.time_quantity import second, minute
+from ucalcx.temperature import celsius, fahrenheit
+
+
+CONVERSIONS = [
+    ("ft -> m", Unit.from_fundamental_units((foot, 1,)), Unit.from_fundamental_units((meter, 1,))),
+    ("m/s^2 -> ft/min^2", meter / second ** 2, foot / minute ** 2),
+    ("°F -> °C", Unit.from_fundamental_units((fahrenheit, 1,)), Unit.from_fundamental_units((celsius, 1,))),
+    ("km^2 -> m^2", kilometer ** 2, meter ** 2),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled unit converters.")
+    parser.add_argument("--number", type=int, default=200_000, help="The number of conversions timed for each pair of units.")
+    arguments = parser.parse_args()
+
+    print(f"{'conversion':<20} {'convert_to':>14} {'compiled':>14} {'speedup':>8}")
+    for label, source, target in CONVERSIONS:
+        converter = compile_converter(source, target)
+        assert converter(12.5) == source.convert_to(target, 12.5)
+        generic = min(timeit.repeat(lambda: source.convert_to(target, 12.5), number=arguments.number, repeat=5))
+        compiled = min(timeit.repeat(lambda: converter(12.5), number=arguments.number, repeat=5))
+        print(f"{label:<20} {generic / arguments.number * 1e9:>11.0f} ns {compiled / arguments.number * 1e9:>11.0f} ns "\
+              f"{generic / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
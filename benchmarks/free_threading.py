@@ -0,0 +1,116 @@
+""" Benchmark of the throughput of conversions, parsing and array operations run from several threads at once.
+
+Every thread runs the same amount of work, so with perfect scaling the wall time stays flat as threads are added
+and the throughput grows with the number of threads. On the free-threaded build of CPython (3.13t, started with
+the GIL disabled) the pure Python workloads scale across cores. With the GIL they run one thread at a time, and
+only the NumPy array workload, which releases the GIL inside its loops, gains from more threads.
+
+Before timing, the same unit strings are parsed from all threads at once on cold caches, and the units the threads
+get back are checked to be the same instances, which is what the unit caches and flyweights promise.
+
+    python -X gil=0 benchmarks/free_threading.py --threads 1 2 4 8 --operations 20000
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from ucalcx import Measurement, MeasurementArray, Unit
+from ucalcx.input import clear_unit_cache, parse_unit
+
+
+TEXTS = ["km/h", "m/s", "kg*m^2/s^3", "lb", "°F", "ft", "g*cm/s^2", "mi/h", "mm^2", "μs"]
+
+
+def convert(operations: int):
+    """ Convert measurements between units whose factors are cached. """
+
+    measurement = Measurement.from_string("100 km/h")
+    target = Unit.from_string("m/s")
+    for _ in range(operations):
+        measurement.convert_to(target)
+
+
+def parse(operations: int):
+    """ Lex and parse unit strings without the string cache. """
+
+    for index in range(operations):
+        parse_unit(TEXTS[index % len(TEXTS)])
+
+
+def arrays(operations: int):
+    """ Convert arrays of 10,000 values with a multiply and an add, counting every 1,000 values as an operation. """
+
+    array = MeasurementArray(np.linspace(0, 100, 10_000), Unit.from_string("km/h"))
+    target = Unit.from_string("m/s")
+    for _ in range(operations // 10):
+        array.convert_to(target)
+
+
+WORKLOADS = {"convert": convert, "parse": parse, "arrays": arrays}
+
+
+def run(workload, threads: int, operations: int) -> float:
+    """ Run a workload on a number of threads, all started together, and return the wall time in seconds. """
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        workload(operations)
+
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(worker) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        return time.perf_counter() - start
+
+
+def check_shared_instances(threads: int):
+    """ Parse the same unit strings from every thread on cold caches, and check that all threads get the same units. """
+
+    clear_unit_cache()
+    Unit._construction_cache.clear()
+    Unit._conversion_cache.clear()
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        return [Unit.from_string(text) for text in TEXTS]
+
+    with ThreadPoolExecutor(threads) as executor:
+        results = [future.result() for future in [executor.submit(worker) for _ in range(threads)]]
+    for units in results[1:]:
+        if any(unit is not first for unit, first in zip(units, results[0])):
+            raise AssertionError("Threads parsing the same unit string got different unit instances.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scaling of ucalcx workloads across threads.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="The numbers of threads to run.")
+    parser.add_argument("--operations", type=int, default=20_000, help="The number of operations run by each thread.")
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS), help="The workloads to run.")
+    arguments = parser.parse_args()
+
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    check_shared_instances(max(arguments.threads))
+
+    for name in arguments.workloads:
+        workload = WORKLOADS[name]
+        workload(arguments.operations // 10)
+        baseline = None
+        for threads in arguments.threads:
+            seconds = run(workload, threads, arguments.operations)
+            throughput = threads * arguments.operations / seconds
+            baseline = baseline or throughput
+            print(f"{name:<10}{threads:>4} threads{seconds * 1e3:>10,.1f} ms{throughput:>14,.0f} ops/s{throughput / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+""" Benchmark of formatting arrays of values with their best metric prefix.
+
+Formats values spread over many orders of magnitude with `MeasurementArray.humanize`, which picks the prefixes
+from a table indexed by the decimal exponent of every value with vectorized NumPy operations, against a loop that
+searches the `MetricPrefix` enum for every value.
+
+    python benchmarks/humanize.py --size 1000000
+"""
+
+import argparse
+import time
+import numpy as np
+from ucalcx import MeasurementArray, MetricPrefix
+from ucalcx.length import meter
+
+
+def search(values: np.ndarray) -> list[str]:
+    """ Format every value by searching the prefixes for the largest one that keeps it at or above 1. """
+
+    prefixes = sorted((prefix for prefix in MetricPrefix if prefix.exponent % 3 == 0), key=lambda prefix: -prefix.exponent)
+    formatted = []
+    for value in values.tolist():
+        for prefix in prefixes:
+            if abs(value) >= 10.0 ** prefix.exponent:
+                break
+        formatted.append(f"{value / 10.0 ** prefix.exponent:.3g} {prefix.symbol}m")
+    return formatted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark formatting values with their best metric prefix.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="The number of values to format.")
+    arguments = parser.parse_args()
+
+    values = 10 ** np.random.default_rng(0).uniform(-12, 12, arguments.size)
+    array = MeasurementArray(values, meter)
+    for name, function in (("per-value enum search", lambda: search(values)), ("humanize", array.humanize)):
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        print(f"{name:<24}{seconds * 1e3:>10,.1f} ms{seconds / arguments.size * 1e9:>8,.0f} ns/value")
+    start = time.perf_counter()
+    array.to_best_prefix()
+    print(f"{'to_best_prefix':<24}{(time.perf_counter() - start) * 1e3:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
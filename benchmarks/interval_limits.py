@@ -0,0 +1,41 @@
+""" Benchmark of checking interval readings against unit-tagged limits.
+
+Builds an array of sensor readings in °F with a measurement tolerance, and times checking which of them are
+certainly and possibly above a limit given in °C, a conversion with an offset, against the same check on point
+values without bounds.
+
+    python benchmarks/interval_limits.py --size 1000000
+"""
+
+import argparse
+import timeit
+import numpy as np
+from ucalcx import IntervalMeasurementArray, Measurement, MeasurementArray
+from ucalcx.temperature import celsius, fahrenheit
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark checking interval readings against limits.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="The number of readings checked.")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="The tolerance of each reading, in °F.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(140, 6, arguments.size)
+    limit = Measurement(65, celsius)
+    points = MeasurementArray(values, fahrenheit)
+    intervals = IntervalMeasurementArray.from_readings(values, fahrenheit, arguments.tolerance)
+    point_limit = limit.convert_to(fahrenheit).value
+
+    plain = min(timeit.repeat(lambda: points.values > point_limit, number=10, repeat=3)) / 10
+    certain = min(timeit.repeat(lambda: intervals.certainly_above(limit), number=10, repeat=3)) / 10
+    possible = min(timeit.repeat(lambda: intervals.possibly_above(limit), number=10, repeat=3)) / 10
+
+    print(f"readings:        {arguments.size:,}")
+    print(f"points:          {plain * 1e3:.2f} ms, {np.count_nonzero(points.values > point_limit):,} above")
+    print(f"certainly above: {certain * 1e3:.2f} ms, {np.count_nonzero(intervals.certainly_above(limit)):,} readings")
+    print(f"possibly above:  {possible * 1e3:.2f} ms, {np.count_nonzero(intervals.possibly_above(limit)):,} readings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+""" Benchmark of the memory used by many measurements in ad hoc prefixed units.
+
+Creates measurements the way user code often does, constructing the prefixed unit of every reading on the spot
+(`Measurement(value, Meter(MetricPrefix.Kilo))`), and reports the memory allocated per measurement and the number
+of distinct unit instances that end up being held, traced with `tracemalloc`.
+
+    python benchmarks/measurement_memory.py --size 1000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from ucalcx import Measurement, MetricPrefix
+from ucalcx.length import Meter
+from ucalcx.mass.metric import Gram
+from ucalcx.time_quantity.time_unit import Second
+from ucalcx.electric_current import Ampere
+
+
+UNITS = [(Meter, MetricPrefix.Kilo), (Meter, MetricPrefix.Milli), (Meter, MetricPrefix.Base), (Gram, MetricPrefix.Kilo),
+         (Gram, MetricPrefix.Milli), (Second, MetricPrefix.Nano), (Second, MetricPrefix.Base), (Ampere, MetricPrefix.Milli)]
+" The unit classes and prefixes the readings are taken in. "
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory used by measurements in prefixed units.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="The number of measurements created.")
+    arguments = parser.parse_args()
+
+    rng = random.Random(0)
+    readings = [(rng.random(), *rng.choice(UNITS)) for _ in range(arguments.size)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    measurements = [Measurement(value, unit_class(prefix)) for value, unit_class, prefix in readings]
+    seconds = time.perf_counter() - start
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    units = {id(measurement.unit) for measurement in measurements}
+    fundamental_units = {id(component["unit"]) for measurement in measurements for component in measurement.unit.components}
+    print(f"measurements:      {len(measurements):,} in {seconds:.2f} s, {seconds / len(measurements) * 1e6:.2f} us each")
+    print(f"allocated:         {allocated / 2**20:,.1f} MiB, {allocated / len(measurements):.0f} bytes per measurement")
+    print(f"peak:              {peak / 2**20:,.1f} MiB")
+    print(f"unit instances:    {len(units):,} units of {len(fundamental_units):,} fundamental units")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+""" Benchmark of the memory and speed of a columnar measurement table against a list of records.
+
+Builds the same readings as a list of dictionaries of `Measurement` objects and as a `MeasurementTable`, and
+compares their memory, filtering the rows by a threshold, and converting a column to another unit.
+
+    python benchmarks/measurement_table.py --rows 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from ucalcx import Measurement, MeasurementArray, MeasurementTable, Unit
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a columnar measurement table against a list of records.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="The number of rows.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    speed, temperature, distance = Unit.from_string("km/h"), Unit.from_string("°C"), Unit.from_string("km")
+    columns = {"speed": rng.uniform(0, 120, arguments.rows), "temperature": rng.normal(20, 5, arguments.rows),
+               "distance": rng.uniform(0, 50, arguments.rows)}
+    units = {"speed": speed, "temperature": temperature, "distance": distance}
+
+    tracemalloc.start()
+    records = [{name: Measurement(value, units[name]) for name, value in zip(columns, row)}
+               for row in zip(*(values.tolist() for values in columns.values()))]
+    records_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    table = MeasurementTable({name: MeasurementArray(values, units[name]) for name, values in columns.items()})
+
+    limit = Measurement(100, speed)
+    meters_per_second = Unit.from_string("m/s")
+    print(f"rows: {arguments.rows:,}")
+    print(f"{'':<22}{'records':>12}{'table':>12}")
+    print(f"{'bytes per row':<22}{records_bytes / arguments.rows:>12,.0f}{table.nbytes / arguments.rows:>12,.0f}")
+    print(f"{'filter speed > limit':<22}"
+          f"{timed(lambda: [record for record in records if record['speed'] > limit]) * 1e3:>9,.1f} ms"
+          f"{timed(lambda: table.filter(table['speed'] > limit)) * 1e3:>9,.1f} ms")
+    print(f"{'convert speed to m/s':<22}"
+          f"{timed(lambda: [record['speed'].convert_to(meters_per_second) for record in records]) * 1e3:>9,.1f} ms"
+          f"{timed(lambda: table.convert_to({'speed': meters_per_second})) * 1e3:>9,.1f} ms")
+    print(f"{'from records':<22}{'':>12}{timed(lambda: MeasurementTable.from_records(records)) * 1e3:>9,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+""" Benchmark of converting a column of masses of mixed species to amounts of substance.
+
+Converts masses of a few dozen species, given by their species code, to moles with `SpeciesTable.to_amount`,
+which gathers the molar masses by code and divides in one vectorized pass, against converting every row by
+looking up the molar mass of its formula and dividing.
+
+    python benchmarks/molar_mass.py --rows 1000000
+"""
+
+import argparse
+import time
+import numpy as np
+from ucalcx import MeasurementArray
+from ucalcx.chemistry import SpeciesTable, molar_mass
+from ucalcx.mass.metric import milligram
+
+
+SPECIES = ["H2O", "NaCl", "KCl", "CaCl2", "MgSO4·7H2O", "C6H12O6", "C12H22O11", "NaHCO3", "Na2CO3", "CuSO4·5H2O",
+           "Ca(OH)2", "NH4Cl", "(NH4)2SO4", "KNO3", "H2SO4", "HCl", "NaOH", "KMnO4", "K2Cr2O7", "Fe2O3", "CH3COOH",
+           "C2H5OH", "C8H10N4O2", "K4[Fe(CN)6]", "Al2(SO4)3·18H2O", "AgNO3", "BaSO4", "ZnCl2", "CO2", "NH3"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark converting masses of mixed species to amounts.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="The number of rows in the column.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    formulas = rng.choice(SPECIES, arguments.rows).tolist()
+    masses = MeasurementArray(rng.uniform(1, 1000, arguments.rows), milligram)
+
+    start = time.perf_counter()
+    per_row = [mass / 1000 / molar_mass(formula) for mass, formula in zip(masses.values.tolist(), formulas)]
+    per_row_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = SpeciesTable(SPECIES)
+    codes = table.encode(formulas)
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    amounts = table.to_amount(masses, codes)
+    vectorized_seconds = time.perf_counter() - start
+    assert np.allclose(amounts.values, per_row)
+
+    print(f"rows: {arguments.rows:,}, species: {len(SPECIES)}")
+    print(f"per row:           {per_row_seconds * 1e3:10,.1f} ms")
+    print(f"encode species:    {encode_seconds * 1e3:10,.1f} ms")
+    print(f"to_amount:         {vectorized_seconds * 1e3:10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+""" Benchmark of NumPy functions and ufuncs applied to measurement arrays.
+
+Times a few ufuncs and functions on `MeasurementArray` operands, which dispatch through `__array_ufunc__` and
+`__array_function__` and work out the unit of the result once per call, against the same calls on the bare float
+arrays, for a small and a large array. The difference is the fixed cost of tracking the unit.
+
+    python benchmarks/numpy_protocol.py --size 1000000
+"""
+
+import argparse
+import timeit
+import numpy as np
+from ucalcx import MeasurementArray
+from ucalcx.length import meter, kilometer
+from ucalcx.time_quantity import second
+
+
+def best(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NumPy dispatch on measurement arrays.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="The number of values in the large arrays.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'call':<28}{'size':>10}{'floats':>12}{'measurements':>15}")
+    for size, number in ((10, 10_000), (arguments.size, 10)):
+        distances, more, times = rng.uniform(1, 10, size), rng.uniform(1, 10, size), rng.uniform(1, 10, size)
+        a, b, t = MeasurementArray(distances, kilometer), MeasurementArray(more, meter), MeasurementArray(times, second)
+        calls = [("np.add (km + m)", lambda: np.add(a, b), lambda: np.add(distances, more * 0.001)),
+                 ("np.divide (km / s)", lambda: np.divide(a, t), lambda: np.divide(distances, times)),
+                 ("np.sqrt (km^2)", lambda: np.sqrt(a * a), lambda: np.sqrt(distances * distances)),
+                 ("np.mean", lambda: np.mean(a), lambda: np.mean(distances)),
+                 ("np.concatenate (km, m)", lambda: np.concatenate([a, b]), lambda: np.concatenate([distances, more * 0.001]))]
+        for name, measurements, floats in calls:
+            print(f"{name:<28}{size:>10,}{best(floats, number) * 1e6:>10.1f} us{best(measurements, number) * 1e6:>12.1f} us")
+
+
+if __name__ == "__main__":
+    main()
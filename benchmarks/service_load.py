@@ -0,0 +1,91 @@
+""" Load test for the ucalcx conversion service.
+
+Starts the service in-process (or connects to a running one with --port/--unix and --external), then runs a number
+of concurrent clients that each keep a window of requests in flight. Reports throughput and the p50 and p99
+latency of individual requests, along with how many requests the service coalesced into each batch.
+
+    python benchmarks/service_load.py --clients 32 --requests 2000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import statistics
+import time
+from ucalcx.service import ConversionBatcher, ConversionService, serve
+
+
+UNIT_PAIRS = [("km", "m"), ("m/s", "km/h"), ("lb", "kg"), ("°F", "°C"), ("ft", "m"), ("kg*m/s^2", "g*cm/s^2")]
+
+
+async def client(connect, requests: int, window: int, latencies: list[float], errors: list[str]):
+    reader, writer = await connect()
+    sent = {}
+    identifiers = itertools.count()
+    semaphore = asyncio.Semaphore(window)
+
+    async def receive():
+        for _ in range(requests):
+            response = json.loads(await reader.readline())
+            if "error" in response:
+                errors.append(response["error"])
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+            semaphore.release()
+
+    receiver = asyncio.create_task(receive())
+    for _ in range(requests):
+        await semaphore.acquire()
+        identifier = next(identifiers)
+        source, target = random.choice(UNIT_PAIRS)
+        request = {"id": identifier, "op": "convert", "value": random.random() * 100, "from": source, "to": target}
+        sent[identifier] = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+    await receiver
+    writer.close()
+
+
+async def run(arguments):
+    service = ConversionService(ConversionBatcher(delay=arguments.batch_delay))
+    server = None
+    if not arguments.external:
+        server = await serve(port=arguments.port, path=arguments.unix, service=service)
+    if arguments.unix:
+        connect = lambda: asyncio.open_unix_connection(arguments.unix)
+    else:
+        connect = lambda: asyncio.open_connection("127.0.0.1", arguments.port)
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(connect, arguments.requests, arguments.window, latencies, errors) for _ in range(arguments.clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"requests:   {len(latencies)} from {arguments.clients} clients")
+    print(f"throughput: {len(latencies) / elapsed:,.0f} requests/s")
+    print(f"latency:    p50 {quantiles[49] * 1e3:.3f} ms, p99 {quantiles[98] * 1e3:.3f} ms")
+    if errors:
+        print(f"errors:     {len(errors)}, e.g. {errors[0]}")
+    if server is not None:
+        print(f"batching:   {service.batcher.conversions / max(service.batcher.batches, 1):.1f} conversions per batch")
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the ucalcx conversion service.")
+    parser.add_argument("--clients", type=int, default=16, help="The number of concurrent client connections.")
+    parser.add_argument("--requests", type=int, default=1000, help="The number of requests sent by each client.")
+    parser.add_argument("--window", type=int, default=32, help="The number of requests each client keeps in flight.")
+    parser.add_argument("--port", type=int, default=8765, help="The TCP port of the service.")
+    parser.add_argument("--unix", default=None, help="The path of a Unix socket to use instead of a TCP port.")
+    parser.add_argument("--batch-delay", type=float, default=0.0, help="The batching delay of the in-process service.")
+    parser.add_argument("--external", action="store_true", help="Connect to an already running service.")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
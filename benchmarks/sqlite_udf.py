@@ -0,0 +1,54 @@
+""" Benchmark of converting and aggregating readings with mixed units inside SQLite queries.
+
+Fills an in-memory table with readings in meters, kilometers, feet and miles, then totals them in meters by calling
+`ucalcx_convert` on every row, with the `ucalcx_sum` aggregate, and by fetching the rows and converting them in
+Python with `Measurement`, and converts every row in a query that returns them all.
+
+    python benchmarks/sqlite_udf.py --rows 1000000
+"""
+
+import argparse
+import sqlite3
+import timeit
+import numpy as np
+from ucalcx import Measurement, Unit
+from ucalcx.interop import sqlite
+
+
+def timed(function, repeat: int = 3) -> float:
+    """ The shortest time of a few calls of a function. """
+
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark unit conversion inside SQLite queries.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="The number of rows in the table.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    units = rng.choice(["m", "km", "ft", "mi"], arguments.rows).tolist()
+    connection = sqlite3.connect(":memory:")
+    sqlite.register(connection)
+    connection.execute("CREATE TABLE readings (value REAL, unit TEXT)")
+    connection.executemany("INSERT INTO readings VALUES (?, ?)", zip(rng.uniform(0, 100, arguments.rows).tolist(), units))
+
+    meter = Unit.from_string("m")
+
+    def in_python():
+        rows = connection.execute("SELECT value, unit FROM readings")
+        return sum(Measurement(value, Unit.from_string(unit)).convert_to(meter).value for value, unit in rows)
+
+    calls = [("SUM(ucalcx_convert(...))", lambda: connection.execute("SELECT SUM(ucalcx_convert(value, unit, 'm')) FROM readings").fetchone()),
+             ("ucalcx_sum(...)", lambda: connection.execute("SELECT ucalcx_sum(value, unit, 'm') FROM readings").fetchone()),
+             ("fetch and convert in Python", in_python),
+             ("SELECT ucalcx_convert(...)", lambda: connection.execute("SELECT ucalcx_convert(value, unit, 'm') FROM readings").fetchall()),
+             ("SELECT value", lambda: connection.execute("SELECT value FROM readings").fetchall())]
+    print(f"rows: {arguments.rows:,}")
+    for name, function in calls:
+        seconds = timed(function)
+        print(f"{name:<30}{seconds * 1e3:>10,.1f} ms{seconds / arguments.rows * 1e9:>10,.0f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
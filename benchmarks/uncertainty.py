@@ -0,0 +1,41 @@
+""" Benchmark of the overhead of propagating uncertainties through array arithmetic.
+
+Times the same chain of conversions and arithmetic (a speed from distances and times, converted to km/h) on a
+`MeasurementArray` and on an `UncertainMeasurementArray` of the same size, and reports the overhead of tracking
+the uncertainties.
+
+    python benchmarks/uncertainty.py --size 1000000
+"""
+
+import argparse
+import timeit
+import numpy as np
+from ucalcx import MeasurementArray, UncertainMeasurementArray
+from ucalcx.length import meter, kilometer
+from ucalcx.time_quantity import second, hour
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark uncertainty propagation over arrays.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="The number of readings in each array.")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    distances = rng.uniform(100, 1000, arguments.size)
+    times = rng.uniform(10, 100, arguments.size)
+    speed_unit = kilometer / hour
+
+    plain_distances, plain_times = MeasurementArray(distances, meter), MeasurementArray(times, second)
+    uncertain_distances = UncertainMeasurementArray(distances, meter, 0.5)
+    uncertain_times = UncertainMeasurementArray(times, second, 0.01)
+
+    plain = min(timeit.repeat(lambda: (plain_distances / plain_times).convert_to(speed_unit), number=10, repeat=3)) / 10
+    uncertain = min(timeit.repeat(lambda: (uncertain_distances / uncertain_times).convert_to(speed_unit), number=10, repeat=3)) / 10
+
+    print(f"readings:  {arguments.size:,}")
+    print(f"plain:     {plain * 1e3:.2f} ms")
+    print(f"uncertain: {uncertain * 1e3:.2f} ms, {uncertain / plain:.1f}x the plain time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+""" Benchmark of converting a column of readings in mixed units, stored as integer unit codes.
+
+Builds a column of length readings in random metric, imperial and nautical units, and times converting it to
+meters three ways: a `Measurement` per row, `MeasurementArray.from_measurements` which groups the rows by unit,
+and `codes.convert` on the values and an integer code per row.
+
+    python benchmarks/unit_codes.py --rows 1000000
+"""
+
+import argparse
+import time
+import numpy as np
+from ucalcx import FundamentalQuantity, Measurement, MeasurementArray, codes
+from ucalcx.length import meter
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark converting integer-coded mixed-unit columns.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="The number of readings in the column.")
+    arguments = parser.parse_args()
+
+    units = codes.conversions(FundamentalQuantity.Length).units
+    rng = np.random.default_rng(0)
+    positions = rng.integers(0, len(units), arguments.rows)
+    values = rng.uniform(0, 100, arguments.rows)
+    column = codes.encode(units)[positions]
+    measurements = [Measurement(value, units[position]) for value, position in zip(values.tolist(), positions.tolist())]
+
+    per_row, converted = timed(lambda: [measurement.convert_to(meter).value for measurement in measurements])
+    grouped, array = timed(lambda: MeasurementArray.from_measurements(measurements, meter))
+    coded, result = timed(lambda: codes.convert(values, column, meter))
+    assert np.allclose(result, converted) and np.allclose(result, array.values)
+
+    print(f"rows:      {arguments.rows:,} in {len(units)} length units")
+    print(f"per row:   {per_row * 1e3:,.1f} ms")
+    print(f"grouped:   {grouped * 1e3:,.1f} ms")
+    print(f"codes:     {coded * 1e3:,.1f} ms, {per_row / coded:,.0f}x faster than per row")
+
+
+if __name__ == "__main__":
+    main()
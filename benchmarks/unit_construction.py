@@ -0,0 +1,52 @@
+""" Benchmark of building compound units.
+
+Builds common compound units like newtons (kg*m/s^2) both with the unit operators and with
+`Unit.from_fundamental_units`, checks that every construction produces the expected unit, and reports the time
+taken by each.
+
+    python benchmarks/unit_construction.py --number 100000
+"""
+
+import argparse
+import timeit
+from ucalcx import Unit
+from ucalcx.length import meter
+from ucalcx.mass import kilogram
+from ucalcx.time_quantity import second
+from ucalcx.electric_current import ampere
+
+
+CONSTRUCTIONS = [
+    ("kg*m/s^2 (operators)", lambda: kilogram * meter / second ** 2,
+     "kg*m/s^2"),
+    ("kg*m/s^2 (fundamental)", lambda: Unit.from_fundamental_units((kilogram, 1), (meter, 1), (second, -2)),
+     "kg*m/s^2"),
+    ("kg*m^2/s^3 (operators)", lambda: kilogram * meter ** 2 / second ** 3,
+     "kg*m^2/s^3"),
+    ("kg*m^2/(s^3*A) (fundamental)", lambda: Unit.from_fundamental_units((kilogram, 1), (meter, 2), (second, -3), (ampere, -1)),
+     "kg*m^2/s^3*A"),
+    ("m/s (operators)", lambda: meter / second,
+     "m/s"),
+    ("m*m/m (operators)", lambda: meter * meter / meter,
+     "m"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark building compound units.")
+    parser.add_argument("--number", type=int, default=100_000, help="The number of units built for each construction.")
+    arguments = parser.parse_args()
+
+    for label, build, symbol in CONSTRUCTIONS:
+        unit = build()
+        assert unit.symbol == symbol, f"{label} built {unit.symbol}, expected {symbol}"
+        assert unit.dimensionality == build().dimensionality
+
+    print(f"{'construction':<30} {'time':>10}")
+    for label, build, _ in CONSTRUCTIONS:
+        elapsed = min(timeit.repeat(build, number=arguments.number, repeat=5))
+        print(f"{label:<30} {elapsed / arguments.number * 1e9:>7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
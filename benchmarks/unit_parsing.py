@@ -0,0 +1,79 @@
+""" Benchmark of parsing unit strings from a corpus of CSV headers.
+
+Builds a corpus of column headers like `speed [km/h]`, where a few dozen unit strings, written with different
+spacing, repeat with a skewed (Zipf-like) frequency as they do across real data files. It then times resolving the
+unit of every header with the uncached parser and with `Unit.from_string`, and reports the statistics of the cache.
+
+    python benchmarks/unit_parsing.py --headers 200000
+"""
+
+import argparse
+import random
+import re
+import time
+from ucalcx import Unit
+from ucalcx.input import parse_unit, unit_cache_info, clear_unit_cache
+
+
+COLUMNS = [
+    ("distance", "m"), ("distance", "km"), ("depth", "ft"), ("range", "nmi"), ("width", "mm"), ("height", "in"),
+    ("speed", "km/h"), ("speed", "m/s"), ("speed", "mi/h"), ("flow", "m^3/s"), ("flow", "ft^3/min"),
+    ("acceleration", "m/s^2"), ("acceleration", "ft/s^2"), ("force", "kg*m/s^2"), ("force", "lb*ft/s^2"),
+    ("energy", "kg*m^2/s^2"), ("power", "kg*m^2/s^3"), ("pressure", "kg/(m*s^2)"), ("density", "kg/m^3"),
+    ("density", "g/cm^3"), ("mass", "kg"), ("mass", "lb"), ("mass", "oz"), ("temperature", "°C"), ("temperature", "°F"),
+    ("temperature", "K"), ("duration", "s"), ("duration", "min"), ("duration", "h"), ("current", "mA"),
+    ("concentration", "mol/m^3"), ("molar flow", "mmol/s"), ("luminous intensity", "cd"), ("area", "km^2"),
+    ("area", "ft^2"), ("frequency", "1/s"), ("angular momentum", "kg*m^2/s"), ("heat capacity", "kg*m^2/(s^2*K)"),
+]
+" The quantities and units of the columns in the corpus. "
+
+
+def respace(unit: str, rng: random.Random) -> str:
+    """ Write a unit string with the spacing of a random author. """
+
+    return rng.choice([unit, re.sub(r"([*/])", r" \1 ", unit), f" {unit} "])
+
+
+def build_corpus(headers: int, seed: int) -> list[str]:
+    """ Build a list of headers, with the unit of each column in square brackets. """
+
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, len(COLUMNS) + 1)]
+    columns = rng.choices(COLUMNS, weights=weights, k=headers)
+    return [f"{name} [{respace(unit, rng)}]" for name, unit in columns]
+
+
+def resolve(corpus: list[str], parse) -> list[Unit]:
+    return [parse(header[header.index("[") + 1:-1]) for header in corpus]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing unit strings from CSV headers.")
+    parser.add_argument("--headers", type=int, default=200_000, help="The number of headers in the corpus.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random corpus.")
+    arguments = parser.parse_args()
+
+    corpus = build_corpus(arguments.headers, arguments.seed)
+    clear_unit_cache()
+
+    start = time.perf_counter()
+    uncached = resolve(corpus, parse_unit)
+    uncached_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cached = resolve(corpus, Unit.from_string)
+    cached_seconds = time.perf_counter() - start
+
+    assert uncached == cached
+    info = unit_cache_info()
+    print(f"headers:  {len(corpus):,} with {len(set(corpus)):,} distinct spellings of {len(COLUMNS)} units")
+    print(f"uncached: {uncached_seconds:.3f} s, {uncached_seconds / len(corpus) * 1e6:.2f} us per header")
+    print(f"cached:   {cached_seconds:.3f} s, {cached_seconds / len(corpus) * 1e6:.2f} us per header, "\
+          f"{uncached_seconds / cached_seconds:.0f}x faster")
+    print(f"cache:    {info.hits:,} hits, {info.misses:,} misses, {info.hits / (info.hits + info.misses):.2%} hit rate, "\
+          f"{info.currsize} entries")
+    print(f"interned: {len({id(unit) for unit in cached})} distinct Unit instances")
+
+
+if __name__ == "__main__":
+    main()
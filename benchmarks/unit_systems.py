@@ -0,0 +1,41 @@
+""" Benchmark of converting records in mixed units to a system of units.
+
+Converts a list of measurements in a handful of different units to US customary units with `Measurement.to_system`,
+which looks up the cached target unit and conversion factors of each record's unit, against resolving the target
+unit of every record from the units of its quantities and converting it with `convert_to`.
+
+    python benchmarks/unit_systems.py --records 1000000
+"""
+
+import argparse
+import time
+from ucalcx import Measurement, Unit
+from ucalcx.systems import US_CUSTOMARY
+
+
+def resolve(measurement: Measurement) -> Measurement:
+    """ Build the target unit of a measurement from the units of its quantities, without the cached plan. """
+
+    units = US_CUSTOMARY.preferred.get(measurement.unit.dimensionality)
+    if units is None:
+        units = Unit.from_fundamental_units(*((US_CUSTOMARY.units.get(unit.quantity, unit), power) for unit, power in measurement.unit.key))
+    return measurement.convert_to(units)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark converting records to a system of units.")
+    parser.add_argument("--records", type=int, default=1_000_000, help="The number of records to convert.")
+    arguments = parser.parse_args()
+
+    texts = ["100 km/h", "3 m", "4 g", "20 °C", "9.81 m/s^2", "1 kg*m^2/s^2", "250 mm", "2 km"]
+    records = [Measurement.from_string(texts[index % len(texts)]) for index in range(arguments.records)]
+    for name, function in (("resolve and convert_to", lambda: [resolve(record) for record in records]),
+                           ("to_system", lambda: [record.to_system(US_CUSTOMARY) for record in records])):
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        print(f"{name:<24}{seconds * 1e3:>10,.1f} ms{seconds / arguments.records * 1e9:>8,.0f} ns/record")
+
+
+if __name__ == "__main__":
+    main()
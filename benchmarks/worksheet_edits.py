@@ -0,0 +1,59 @@
+""" Benchmark of incremental worksheet re-evaluation.
+
+Builds a worksheet of many independent structural members, each with input dimensions and a handful of derived
+cells (area, volume, mass, load, stress), plus a few totals over a sample of the members. It then times editing a
+single input dimension, which re-evaluates only the cells downstream of it, against recalculating every cell.
+
+    python benchmarks/worksheet_edits.py --members 500
+"""
+
+import argparse
+import random
+import time
+from ucalcx.worksheet import Worksheet
+
+
+def build(members: int) -> Worksheet:
+    sheet = Worksheet()
+    sheet["density"] = "7850 kg/m^3"
+    sheet["gravity"] = "9.81 m/s^2"
+    for index in range(members):
+        sheet[f"width{index}"] = f"{200 + index % 50} mm"
+        sheet[f"depth{index}"] = f"{300 + index % 70} mm"
+        sheet[f"span{index}"] = f"{4 + index % 5} m"
+        sheet[f"area{index}"] = f"width{index} * depth{index} to m^2"
+        sheet[f"volume{index}"] = f"area{index} * span{index}"
+        sheet[f"mass{index}"] = f"volume{index} * density"
+        sheet[f"load{index}"] = f"mass{index} * gravity"
+        sheet[f"stress{index}"] = f"load{index} / area{index}"
+    sheet["total_mass"] = " + ".join(f"mass{index}" for index in range(0, members, max(members // 10, 1)))
+    return sheet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental worksheet re-evaluation.")
+    parser.add_argument("--members", type=int, default=500, help="The number of members in the worksheet.")
+    parser.add_argument("--edits", type=int, default=1000, help="The number of single input edits timed.")
+    arguments = parser.parse_args()
+
+    sheet = build(arguments.members)
+    rng = random.Random(0)
+    evaluations = sheet.evaluations
+    start = time.perf_counter()
+    for _ in range(arguments.edits):
+        sheet[f"span{rng.randrange(arguments.members)}"] = f"{rng.uniform(3, 9):.3f} m"
+    incremental = (time.perf_counter() - start) / arguments.edits
+    evaluated = (sheet.evaluations - evaluations) / arguments.edits
+
+    start = time.perf_counter()
+    recalculated = len(sheet.recalculate())
+    full = time.perf_counter() - start
+
+    print(f"cells:       {len(sheet):,}")
+    print(f"edit:        {incremental * 1e6:,.0f} us, {evaluated:.1f} cells evaluated per edit")
+    print(f"recalculate: {full * 1e6:,.0f} us, {recalculated:,} cells evaluated")
+    print(f"compiled:    {sheet.compilations:,} cell plans")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,10 @@ setup(
     install_requires=[
         'numpy',
     ],
+    extras_require={
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
+    },
     entry_points={
         'console_scripts': [
             'ucx = ucalcx.main:main',
@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+from ucalcx import aggregation, Measurement, MeasurementArray, Unit
+from ucalcx.exceptions import IncompatibleUnitsError, InvalidValueError
+from ucalcx.length import meter, kilometer, centimeter
+from ucalcx.temperature import celsius, fahrenheit
+from ucalcx.time_quantity import second
+
+
+class TestAggregation(unittest.TestCase):
+
+    def setUp(self):
+        self.measurements = [Measurement(1, kilometer), Measurement(500, meter), Measurement(50000, centimeter)]
+
+    def test_sum_is_in_the_unit_of_the_first_measurement(self):
+        self.assertEqual(aggregation.sum(self.measurements), Measurement(2, kilometer))
+        self.assertEqual(aggregation.sum(self.measurements).unit, Unit.from_fundamental_units((kilometer, 1)))
+
+    def test_sum_in_another_unit(self):
+        self.assertAlmostEqual(aggregation.sum(self.measurements, meter).value, 2000)
+
+    def test_empty_collections(self):
+        self.assertEqual(aggregation.sum([], meter).value, 0)
+        with self.assertRaises(InvalidValueError):
+            aggregation.sum([])
+        with self.assertRaises(InvalidValueError):
+            aggregation.mean([], meter)
+
+    def test_mean_std_min_max(self):
+        self.assertAlmostEqual(aggregation.mean(self.measurements, meter).value, 2000 / 3)
+        self.assertAlmostEqual(aggregation.std(self.measurements, meter).value, np.std([1000, 500, 500]))
+        self.assertEqual(aggregation.min(self.measurements).value, 0.5)
+        self.assertEqual(aggregation.max(self.measurements, meter).value, 1000)
+
+    def test_offsets_are_applied_per_value(self):
+        temperatures = [Measurement(0, celsius), Measurement(212, fahrenheit)]
+        self.assertEqual(aggregation.mean(temperatures).value, 50)
+        self.assertEqual(aggregation.max(temperatures, fahrenheit).value, 212)
+
+    def test_arrays(self):
+        array = MeasurementArray([1.0, 2.0, 3.0], kilometer)
+        self.assertEqual(aggregation.sum(array, meter).value, 6000)
+        counts, edges = aggregation.histogram(array, bins=2)
+        np.testing.assert_array_equal(counts, [1, 2])
+        self.assertEqual(edges.unit, array.unit)
+
+    def test_incompatible_units(self):
+        with self.assertRaises(IncompatibleUnitsError):
+            aggregation.sum([Measurement(1, meter), Measurement(1, second)])
+
+
+class TestMeasurementArithmetic(unittest.TestCase):
+
+    def test_numbers_scale_the_value(self):
+        self.assertEqual(Measurement(1, meter) * 2, Measurement(2, meter))
+        self.assertEqual(2 * Measurement(1, meter), Measurement(2, meter))
+        self.assertEqual(Measurement(1, meter) / 4, Measurement(0.25, meter))
+
+    def test_measurements_and_arrays(self):
+        array = MeasurementArray([500.0, 1500.0], meter)
+        result = Measurement(1, kilometer) + array
+        self.assertIsInstance(result, MeasurementArray)
+        self.assertEqual(result.unit, Unit.from_fundamental_units((kilometer, 1)))
+        np.testing.assert_array_equal(result.values, [1.5, 2.5])
+        np.testing.assert_array_equal((Measurement(1, kilometer) - array).values, [0.5, -0.5])
+        np.testing.assert_array_equal((Measurement(6, meter) / MeasurementArray([2.0, 3.0], second)).values, [3.0, 2.0])
+        np.testing.assert_array_equal((Measurement(2, kilometer) * array).values, [1.0, 3.0])
+
+    def test_other_operands(self):
+        with self.assertRaises(TypeError):
+            Measurement(1, meter) + "1 m"
+        with self.assertRaises(TypeError):
+            Measurement(1, meter) + 1
+
+
+if __name__ == "__main__":
+    unittest.main()
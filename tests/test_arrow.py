@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from ucalcx import MeasurementArray, Unit
+from ucalcx.exceptions import InvalidUnitError, IncompatibleUnitsError
+from ucalcx.length import meter, kilometer
+from ucalcx.temperature import celsius, fahrenheit
+from ucalcx.time_quantity import second
+
+try:
+    import pyarrow as pa
+    from ucalcx.interop import arrow
+except ImportError:
+    arrow = None
+
+
+@unittest.skipIf(arrow is None, "pyarrow is not installed")
+class TestUnitMetadata(unittest.TestCase):
+
+    def test_round_trip(self):
+        unit = meter / second
+        self.assertIs(arrow.deserialize_unit(arrow.serialize_unit(unit)), unit)
+
+    def test_malformed_data(self):
+        with self.assertRaises(InvalidUnitError):
+            arrow.deserialize_unit(b"not json")
+
+    def test_field_unit(self):
+        self.assertIs(arrow.field_unit(arrow.field("distance", kilometer)), Unit.coerce(kilometer))
+        self.assertIsNone(arrow.field_unit(pa.field("label", pa.string())))
+
+    def test_with_units(self):
+        table = arrow.with_units(pa.table({"distance": [1.0, 2.0]}), {"distance": meter})
+        self.assertIs(arrow.field_unit(table.schema.field("distance")), Unit.coerce(meter))
+        with self.assertRaises(KeyError):
+            arrow.with_units(table, {"speed": meter})
+
+
+@unittest.skipIf(arrow is None, "pyarrow is not installed")
+class TestConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.table = arrow.to_table({"temperature": MeasurementArray([32.0, 212.0], fahrenheit),
+                                     "distance": MeasurementArray([1500.0, 2500.0], meter)})
+
+    def test_offsets_are_applied(self):
+        table = arrow.convert_table(self.table, {"temperature": celsius})
+        np.testing.assert_allclose(table.column("temperature").to_numpy(), [0, 100], atol=1e-12)
+        self.assertEqual(arrow.field_unit(table.schema.field("temperature")).symbol, "°C")
+        np.testing.assert_array_equal(table.column("distance").to_numpy(), [1500, 2500])
+
+    def test_convert_batch(self):
+        batch = arrow.convert_batch(self.table.to_batches()[0], {"distance": kilometer})
+        np.testing.assert_allclose(batch.column(1).to_numpy(), [1.5, 2.5])
+
+    def test_missing_values_stay_missing(self):
+        table = arrow.with_units(pa.table({"distance": pa.array([1000.0, None])}), {"distance": meter})
+        self.assertEqual(arrow.convert_table(table, {"distance": kilometer}).column("distance").to_pylist(), [1.0, None])
+
+    def test_invalid_conversions(self):
+        with self.assertRaises(InvalidUnitError):
+            arrow.convert_table(pa.table({"distance": [1.0]}), {"distance": meter})
+        with self.assertRaises(IncompatibleUnitsError):
+            arrow.convert_table(self.table, {"distance": second})
+        with self.assertRaises(KeyError):
+            arrow.convert_table(self.table, {"speed": meter})
+
+
+@unittest.skipIf(arrow is None, "pyarrow is not installed")
+class TestParquet(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "readings.parquet")
+        arrow.write_parquet(self.path, {"distance": MeasurementArray(np.arange(10, dtype=float) * 1000, meter),
+                                        "temperature": MeasurementArray(np.full(10, 212.0), fahrenheit)})
+
+    def test_units_are_kept(self):
+        columns = arrow.read_parquet(self.path)
+        self.assertEqual(columns["distance"].unit.symbol, "m")
+        np.testing.assert_array_equal(columns["distance"].values, np.arange(10) * 1000)
+
+    def test_conversion_on_read(self):
+        columns = arrow.read_parquet(self.path, units={"distance": kilometer}, columns=["distance"])
+        self.assertEqual(list(columns), ["distance"])
+        self.assertEqual(columns["distance"].unit.symbol, "km")
+        np.testing.assert_allclose(columns["distance"].values, np.arange(10))
+
+    def test_iter_batches(self):
+        batches = list(arrow.iter_batches(self.path, units={"temperature": celsius}, batch_size=4))
+        self.assertEqual([batch.num_rows for batch in batches], [4, 4, 2])
+        for batch in batches:
+            self.assertEqual(arrow.field_unit(batch.schema.field("temperature")).symbol, "°C")
+            np.testing.assert_allclose(batch.column(1).to_numpy(), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from ucalcx import Unit, cache
+from ucalcx.input import clear_unit_cache, unit_cache_info
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "units.bin"
+        Unit.from_string("km/h").convert_to(Unit.from_string("m/s"), 1)
+
+    def clear(self):
+        clear_unit_cache()
+        Unit._conversion_cache.clear()
+
+    def test_round_trip(self):
+        self.assertEqual(cache.save(self.path), self.path)
+        self.clear()
+        stats = cache.load(self.path)
+        self.assertGreater(stats.units, 0)
+        self.assertGreaterEqual(stats.strings, 2)
+        self.assertGreaterEqual(stats.conversions, 1)
+        self.assertEqual(Unit.from_string("km/h").symbol, "km/h")
+        self.assertEqual(unit_cache_info().hits, 1)
+        self.assertIn((Unit.from_string("km/h").key, Unit.from_string("m/s").key), Unit._conversion_cache)
+
+    def test_loaded_entries_do_not_replace_existing_ones(self):
+        cache.save(self.path)
+        self.assertEqual(cache.load(self.path).strings, 0)
+
+    def test_max_conversions(self):
+        Unit.from_string("mi").convert_to(Unit.from_string("km"), 1)
+        cache.save(self.path, max_conversions=1)
+        self.clear()
+        self.assertEqual(cache.load(self.path).conversions, 1)
+        self.assertIn((Unit.from_string("mi").key, Unit.from_string("km").key), Unit._conversion_cache)
+
+    def test_changed_units_are_skipped(self):
+        cache.save(self.path)
+        self.clear()
+        with mock.patch.object(cache, "_fingerprint", return_value=(0.0, 2.0)):
+            self.assertEqual(cache.load(self.path), cache.CacheStats(0, 0, 0))
+        self.assertEqual(unit_cache_info().currsize, 0)
+
+    def test_invalid_files_are_ignored(self):
+        self.assertEqual(cache.load(self.path), cache.CacheStats(0, 0, 0))
+        cache.save(self.path)
+        data = bytearray(self.path.read_bytes())
+        data[-1] ^= 0xFF
+        self.path.write_bytes(bytes(data))
+        self.assertEqual(cache.load(self.path), cache.CacheStats(0, 0, 0))
+        self.path.write_bytes(b"")
+        self.assertEqual(cache.load(self.path), cache.CacheStats(0, 0, 0))
+
+    def test_other_format_versions_are_ignored(self):
+        cache.save(self.path)
+        with mock.patch.object(cache, "FORMAT_VERSION", cache.FORMAT_VERSION + 1):
+            self.assertEqual(cache.load(self.path), cache.CacheStats(0, 0, 0))
+
+    def test_no_temporary_files_are_left(self):
+        cache.save(self.path)
+        cache.save(self.path)
+        self.assertEqual(os.listdir(self.path.parent), [self.path.name])
+
+    def test_default_path(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.path.parent)}):
+            self.assertEqual(cache.default_path(), self.path.parent / "ucalcx" / f"units-v{cache.FORMAT_VERSION}.bin")
+
+    def test_persist_saves_on_exit(self):
+        with mock.patch("atexit.register") as register:
+            cache.persist(self.path)
+        register.assert_called_once_with(cache._save_quietly, self.path)
+        cache._save_quietly(self.path)
+        self.assertTrue(self.path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
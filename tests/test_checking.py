@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from ucalcx import Measurement, MeasurementArray, check_units
+from ucalcx.exceptions import IncompatibleUnitsError
+from ucalcx.length import meter, kilometer
+from ucalcx.temperature import celsius, fahrenheit
+from ucalcx.time_quantity import second, hour
+
+
+@check_units(meter, second, returns=meter / second)
+def speed(distance, time):
+    return distance / time
+
+
+class TestCheckUnits(unittest.TestCase):
+
+    def test_measurements_are_converted(self):
+        result = speed(Measurement(36, kilometer), Measurement(1, hour))
+        self.assertEqual(result.unit, meter / second)
+        self.assertAlmostEqual(result.value, 10.0)
+
+    def test_numbers_pass_through(self):
+        self.assertEqual(speed(100.0, 10.0), 10.0)
+
+    def test_wrong_dimensionality(self):
+        with self.assertRaises(IncompatibleUnitsError):
+            speed(Measurement(1, second), Measurement(1, second))
+
+    def test_arrays(self):
+        result = speed(MeasurementArray([36, 72], kilometer), Measurement(1, hour))
+        self.assertIsInstance(result, MeasurementArray)
+        np.testing.assert_allclose(result.values, [10.0, 20.0])
+
+    def test_keyword_arguments(self):
+        self.assertAlmostEqual(speed(time=Measurement(2, second), distance=Measurement(1, kilometer)).value, 500.0)
+
+    def test_plans_are_cached_per_units(self):
+        @check_units(meter)
+        def double(distance):
+            return distance * 2
+        double(Measurement(1, kilometer))
+        double(Measurement(2, kilometer))
+        double(Measurement(2, meter))
+        self.assertEqual(len(double.plans), 2)
+
+    def test_offsets_are_applied(self):
+        @check_units(celsius, returns=celsius)
+        def identity(temperature):
+            return temperature
+        self.assertAlmostEqual(identity(Measurement(212, fahrenheit)).value, 100.0)
+
+    def test_units_from_annotations(self):
+        @check_units
+        def pace(time: second, distance: kilometer, laps: int) -> second / kilometer:
+            return time / distance / laps
+        self.assertAlmostEqual(pace(Measurement(1, hour), Measurement(10, meter), 2).value, 180000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from ucalcx import Measurement, MeasurementArray
+from ucalcx.chemistry import SpeciesTable, _parse, molar_mass, to_amount, to_mass
+from ucalcx.exceptions import InvalidValueError
+from ucalcx.mass import gram, kilogram
+from ucalcx.amount_of_substance import mole
+
+
+class TestParse(unittest.TestCase):
+
+    def test_simple_formulas(self):
+        self.assertEqual(_parse("H2O"), {"H": 2, "O": 1})
+        self.assertEqual(_parse("C6H12O6"), {"C": 6, "H": 12, "O": 6})
+
+    def test_nested_groups(self):
+        self.assertEqual(_parse("Ca(OH)2"), {"Ca": 1, "O": 2, "H": 2})
+        self.assertEqual(_parse("Fe2(SO4)3"), {"Fe": 2, "S": 3, "O": 12})
+        self.assertEqual(_parse("K4[Fe(CN)6]"), {"K": 4, "Fe": 1, "C": 6, "N": 6})
+
+    def test_hydrates(self):
+        self.assertEqual(_parse("CuSO4·5H2O"), {"Cu": 1, "S": 1, "O": 9, "H": 10})
+        self.assertEqual(_parse("CaSO4.2H2O"), _parse("CaSO4*2H2O"))
+
+    def test_charges(self):
+        self.assertEqual(_parse("Fe^3+"), {"Fe": 1})
+        self.assertEqual(_parse("Fe+3"), {"Fe": 1})
+        self.assertEqual(_parse("NH4^+"), {"N": 1, "H": 4})
+        self.assertEqual(_parse("SO4 2-"), {"S": 1, "O": 4})
+        self.assertEqual(_parse("[Fe(CN)6]4-"), {"Fe": 1, "C": 6, "N": 6})
+        self.assertEqual(_parse("Cl-"), {"Cl": 1})
+
+    def test_digits_before_a_sign_are_ambiguous(self):
+        for formula in ("Fe3+", "NH4+", "SO42-"):
+            with self.assertRaises(InvalidValueError, msg=formula):
+                _parse(formula)
+
+    def test_bad_input(self):
+        for formula in ("", "+", "Xx2", "h2o", "Ca(OH", "CaOH)2", "H2O$", "(2)"):
+            with self.assertRaises(InvalidValueError, msg=formula):
+                _parse(formula)
+
+
+class TestConversions(unittest.TestCase):
+
+    def test_molar_mass(self):
+        self.assertEqual(molar_mass("H2O"), 18.015)
+        self.assertEqual(molar_mass("NH4^+"), molar_mass("NH4"))
+
+    def test_mass_and_amount(self):
+        self.assertAlmostEqual(to_amount(Measurement(36.03, gram), "H2O").value, 2.0)
+        self.assertAlmostEqual(to_mass(Measurement(2, mole), "H2O", kilogram).value, 0.03603)
+
+    def test_species_table(self):
+        species = SpeciesTable(["H2O", "CO2"])
+        codes = species.encode(["CO2", "H2O", "NaCl"], add=True)
+        np.testing.assert_array_equal(codes, [1, 0, 2])
+        amounts = species.to_amount(MeasurementArray([88.018, 18.015, 58.44], gram), codes)
+        np.testing.assert_allclose(amounts.values, [2.0, 1.0, 1.0], rtol=1e-4)
+        with self.assertRaises(InvalidValueError):
+            species.code("CH4")
+
+
+if __name__ == "__main__":
+    unittest.main()
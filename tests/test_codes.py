@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from ucalcx import FundamentalQuantity, Unit
+from ucalcx.common import codes
+from ucalcx.exceptions import IncompatibleUnitsError, InvalidUnitError
+from ucalcx.length import meter, kilometer, imperial
+from ucalcx.temperature import celsius, fahrenheit, kelvin
+from ucalcx.time_quantity import second
+
+
+class TestCodes(unittest.TestCase):
+
+    def test_round_trip(self):
+        self.assertIs(codes.unit(codes.code(kilometer)), kilometer)
+        self.assertEqual(codes.code(Unit.from_fundamental_units((kilometer, 1))), codes.code(kilometer))
+
+    def test_encode(self):
+        column = codes.encode([kilometer, meter, kilometer])
+        self.assertEqual(column.dtype, codes.CODE_DTYPE)
+        self.assertEqual(column[0], column[2])
+
+    def test_derived_and_unknown_units(self):
+        with self.assertRaises(InvalidUnitError):
+            codes.code(meter / second)
+        with self.assertRaises(InvalidUnitError):
+            codes.unit(-1)
+
+
+class TestConvert(unittest.TestCase):
+
+    def test_mixed_units(self):
+        column = codes.encode([kilometer, meter, imperial.foot])
+        np.testing.assert_allclose(codes.convert(np.array([1.5, 20.0, 10.0]), column, meter), [1500.0, 20.0, 3.048])
+
+    def test_offsets(self):
+        column = codes.encode([celsius, fahrenheit, kelvin])
+        np.testing.assert_allclose(codes.convert([100.0, 212.0, 373.15], column, celsius), [100.0, 100.0, 100.0])
+
+    def test_matrices(self):
+        table = codes.conversions(FundamentalQuantity.Length)
+        self.assertEqual(table.scales.shape, (len(table.units), len(table.units)))
+        np.testing.assert_allclose(np.diag(table.scales), 1.0)
+
+    def test_errors(self):
+        with self.assertRaises(IncompatibleUnitsError):
+            codes.convert([1.0], codes.encode([second]), meter)
+        with self.assertRaises(InvalidUnitError):
+            codes.convert([1.0], [10 ** 6], meter)
+        with self.assertRaises(InvalidUnitError):
+            codes.convert([1.0], [-1], meter)
+
+
+if __name__ == "__main__":
+    unittest.main()
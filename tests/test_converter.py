@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+from ucalcx import Unit, compile_converter
+from ucalcx.exceptions import IncompatibleUnitsError, InvalidUnitError
+from ucalcx.length import meter, kilometer, imperial
+from ucalcx.temperature import celsius, fahrenheit
+from ucalcx.time_quantity import second, hour
+
+
+class TestCompileConverter(unittest.TestCase):
+
+    def test_scale(self):
+        converter = compile_converter(kilometer, meter)
+        self.assertEqual(converter(1.5), 1500.0)
+        self.assertEqual(converter.source, "def convert(value):\n    return value * 1000.0\n")
+
+    def test_scale_and_offset(self):
+        converter = compile_converter(celsius, fahrenheit)
+        self.assertEqual((converter.scale, converter.offset), (1.8, 32.0))
+        self.assertEqual(converter(100), 212.0)
+
+    def test_identity_returns_the_value(self):
+        values = np.array([1.0, 2.0])
+        self.assertIs(compile_converter(meter, meter)(values), values)
+
+    def test_arrays(self):
+        np.testing.assert_allclose(compile_converter(imperial.foot, meter)(np.array([1.0, 10.0])), [0.3048, 3.048])
+
+    def test_compound_units(self):
+        converter = compile_converter(Unit.from_string("km/h"), meter / second)
+        self.assertAlmostEqual(converter(36), 10.0)
+
+    def test_converters_are_cached(self):
+        self.assertIs(compile_converter(kilometer, meter), compile_converter(Unit.coerce(kilometer), meter))
+
+    def test_invalid_units(self):
+        with self.assertRaises(IncompatibleUnitsError):
+            compile_converter(meter, hour)
+        with self.assertRaises(InvalidUnitError):
+            compile_converter("m", meter)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+from ucalcx import Measurement, MeasurementArray, IntervalMeasurement, IntervalMeasurementArray
+from ucalcx.exceptions import InvalidValueError
+from ucalcx.length import meter, kilometer
+from ucalcx.temperature import celsius, fahrenheit
+
+
+class TestIntervalMeasurement(unittest.TestCase):
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(InvalidValueError):
+            IntervalMeasurement(2, 1, meter)
+        with self.assertRaises(InvalidValueError):
+            IntervalMeasurement(float("nan"), 1, meter)
+
+    def test_conversion_encloses_the_bounds(self):
+        interval = IntervalMeasurement(98.2, 98.8, fahrenheit).convert_to(celsius)
+        self.assertLessEqual(interval.lower, (98.2 - 32) * 5 / 9)
+        self.assertGreaterEqual(interval.upper, (98.8 - 32) * 5 / 9)
+        self.assertLess(interval.width, 0.34)
+
+    def test_arithmetic(self):
+        interval = IntervalMeasurement(1, 2, meter)
+        difference = interval - IntervalMeasurement(0.5, 1, meter)
+        self.assertLessEqual(difference.lower, 0)
+        self.assertGreaterEqual(difference.upper, 1.5)
+        product = IntervalMeasurement(-1, 2, meter) * IntervalMeasurement(3, 4, meter)
+        self.assertEqual(product.unit, meter ** 2)
+        self.assertLessEqual(product.lower, -4)
+        self.assertGreaterEqual(product.upper, 8)
+
+    def test_division_by_an_interval_containing_zero(self):
+        quotient = IntervalMeasurement(1, 2, meter) / IntervalMeasurement(-1, 1, meter)
+        self.assertEqual((quotient.lower, quotient.upper), (-np.inf, np.inf))
+
+    def test_even_power_of_an_interval_containing_zero(self):
+        square = IntervalMeasurement(-2, 1, meter) ** 2
+        self.assertEqual(square.lower, 0)
+        self.assertGreaterEqual(square.upper, 4)
+
+
+class TestMeasurementOperands(unittest.TestCase):
+
+    def setUp(self):
+        self.interval = IntervalMeasurement(1, 2, meter)
+
+    def test_measurement_on_the_left(self):
+        total = Measurement(1, kilometer) + self.interval
+        self.assertIsInstance(total, IntervalMeasurement)
+        self.assertEqual(total.unit.symbol, "km")
+        self.assertLessEqual(total.lower, 1.001)
+        self.assertGreaterEqual(total.upper, 1.002)
+        difference = Measurement(3, meter) - self.interval
+        self.assertLessEqual(difference.lower, 1)
+        self.assertGreaterEqual(difference.upper, 2)
+
+    def test_measurement_is_a_single_point(self):
+        for result in (Measurement(2, meter) * self.interval, self.interval * Measurement(2, meter)):
+            self.assertEqual(result.unit, meter ** 2)
+            self.assertLessEqual(result.lower, 2)
+            self.assertGreaterEqual(result.upper, 4)
+        quotient = Measurement(4, meter) / self.interval
+        self.assertLessEqual(quotient.lower, 2)
+        self.assertGreaterEqual(quotient.upper, 4)
+
+    def test_measurement_array_gives_an_interval_array(self):
+        for result in (MeasurementArray([1, 2], meter) + self.interval, self.interval + MeasurementArray([1, 2], meter)):
+            self.assertIsInstance(result, IntervalMeasurementArray)
+            self.assertTrue(np.all(result.lower <= [2, 3]))
+            self.assertTrue(np.all(result.upper >= [3, 4]))
+
+
+class TestIntervalMeasurementArray(unittest.TestCase):
+
+    def test_limits(self):
+        readings = IntervalMeasurementArray.from_readings([148.7, 151.0, 139.0], fahrenheit, tolerance=0.5)
+        np.testing.assert_array_equal(readings.certainly_below(Measurement(65, celsius)), [False, False, True])
+        np.testing.assert_array_equal(readings.possibly_above(Measurement(65, celsius)), [True, True, False])
+
+    def test_indexing(self):
+        readings = IntervalMeasurementArray([1, 2], [2, 3], meter)
+        self.assertIsInstance(readings[0], IntervalMeasurement)
+        self.assertEqual(len(readings[:1]), 1)
+        self.assertEqual([interval.upper for interval in readings], [2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
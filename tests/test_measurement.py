@@ -0,0 +1,50 @@
+import unittest
+from ucalcx import Measurement, Unit
+from ucalcx.exceptions import IncompatibleUnitsError
+from ucalcx.length import meter, kilometer, centimeter
+from ucalcx.time_quantity import second
+
+
+class TestMeasurementComparison(unittest.TestCase):
+
+    def test_equality_across_units(self):
+        self.assertEqual(Measurement(1, kilometer), Measurement(1000, meter))
+        self.assertNotEqual(Measurement(1, meter), Measurement(1, second))
+        self.assertNotEqual(Measurement(1, meter), 1)
+
+    def test_equal_measurements_have_equal_hashes(self):
+        self.assertEqual(hash(Measurement(1, kilometer)), hash(Measurement(1000, meter)))
+        self.assertEqual(len({Measurement(1, kilometer), Measurement(1000, meter), Measurement(1, meter)}), 2)
+
+    def test_sorting(self):
+        measurements = [Measurement(2, meter), Measurement(1, kilometer), Measurement(50, centimeter)]
+        self.assertEqual([measurement.unit.symbol for measurement in sorted(measurements)], ["cm", "m", "km"])
+        self.assertLess(Measurement(50, centimeter), Measurement(1, meter))
+
+    def test_different_quantities_are_not_ordered(self):
+        with self.assertRaises(IncompatibleUnitsError):
+            Measurement(1, meter) < Measurement(1, second)
+
+
+class TestMeasurementImmutability(unittest.TestCase):
+
+    def test_value_and_unit_are_read_only(self):
+        measurement = Measurement(1, kilometer)
+        with self.assertRaises(AttributeError):
+            measurement.value = 2
+        with self.assertRaises(AttributeError):
+            measurement.unit = Unit.from_fundamental_units((meter, 1))
+
+    def test_hash_is_stable_in_sets(self):
+        measurement = Measurement(1, kilometer)
+        measurements = {measurement}
+        self.assertIn(Measurement(1000, meter), measurements)
+        self.assertEqual(measurement.convert_to(Unit.from_fundamental_units((meter, 1))), measurement)
+
+    def test_invalid_unit(self):
+        with self.assertRaises(ValueError):
+            Measurement(1, "m")
+
+
+if __name__ == "__main__":
+    unittest.main()
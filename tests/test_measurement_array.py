@@ -0,0 +1,94 @@
+import unittest
+import numpy as np
+from ucalcx import Measurement, MeasurementArray, Unit
+from ucalcx.exceptions import IncompatibleUnitsError
+from ucalcx.length import meter, kilometer
+from ucalcx.time_quantity import second
+
+
+class TestMeasurementArrayEquality(unittest.TestCase):
+
+    def setUp(self):
+        self.array = MeasurementArray([1000.0, 2.0], meter)
+
+    def test_measurements_are_compared_in_a_common_unit(self):
+        np.testing.assert_array_equal(self.array == Measurement(1, kilometer), [True, False])
+        np.testing.assert_array_equal(self.array == MeasurementArray([1, 2], kilometer), [True, False])
+        np.testing.assert_array_equal(self.array != MeasurementArray([1, 2], kilometer), [False, True])
+
+    def test_numbers_are_compared_with_the_values(self):
+        np.testing.assert_array_equal(self.array == 2, [False, True])
+        np.testing.assert_array_equal(self.array != 5, [True, True])
+        np.testing.assert_array_equal(self.array == np.array([1000.0, 3.0]), [True, False])
+
+    def test_other_quantities_are_never_equal(self):
+        np.testing.assert_array_equal(self.array == Measurement(1, second), [False, False])
+        np.testing.assert_array_equal(self.array != Measurement(1, second), [True, True])
+
+    def test_other_objects(self):
+        self.assertFalse(self.array == "1 m")
+        with self.assertRaises(TypeError):
+            hash(self.array)
+
+
+class TestNumPyProtocol(unittest.TestCase):
+
+    def setUp(self):
+        self.array = MeasurementArray([1.0, -2.0, 3.0], meter)
+
+    def test_as_array(self):
+        np.testing.assert_array_equal(np.asarray(self.array), [1.0, -2.0, 3.0])
+        self.assertEqual(np.asarray(self.array, dtype=np.float32).dtype, np.float32)
+
+    def test_matching_units(self):
+        result = np.add(self.array, Measurement(1, kilometer))
+        self.assertEqual(result.unit, self.array.unit)
+        np.testing.assert_array_equal(result.values, [1001.0, 998.0, 1003.0])
+        with self.assertRaises(IncompatibleUnitsError):
+            np.add(self.array, Measurement(1, second))
+
+    def test_products_and_roots(self):
+        self.assertEqual(np.multiply(self.array, self.array).unit, meter ** 2)
+        self.assertEqual(np.sqrt(MeasurementArray([4.0, 9.0], meter ** 2)).unit, Unit.from_fundamental_units((meter, 1)))
+        self.assertEqual((self.array / MeasurementArray([1.0, 1.0, 1.0], second)).unit, meter / second)
+
+    def test_product_of_values(self):
+        self.assertEqual(np.prod(self.array), Measurement(-6.0, meter ** 3))
+        self.assertEqual(np.prod(MeasurementArray(np.ones((2, 3)), meter), axis=0).unit, meter ** 2)
+
+    def test_operators(self):
+        squared = self.array ** 2
+        self.assertEqual(squared.unit, meter ** 2)
+        np.testing.assert_array_equal(squared.values, [1.0, 4.0, 9.0])
+        self.assertEqual((squared ** 0.5).unit, Unit.from_fundamental_units((meter, 1)))
+        np.testing.assert_array_equal(abs(self.array).values, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal((-self.array).values, [-1.0, 2.0, -3.0])
+
+    def test_plain_arrays(self):
+        plain = np.array([1.0, 2.0, 3.0])
+        np.testing.assert_array_equal((plain * self.array).values, [1.0, -4.0, 9.0])
+        self.assertEqual((self.array / plain).unit, self.array.unit)
+        np.testing.assert_array_equal(self.array < 2, [True, True, False])
+        with self.assertRaises(TypeError):
+            plain + self.array
+        with self.assertRaises(TypeError):
+            self.array - plain
+        unitless = MeasurementArray([1.0, 2.0], Unit.from_fundamental_units())
+        np.testing.assert_array_equal((unitless + np.array([1.0, 1.0])).values, [2.0, 3.0])
+
+    def test_unsupported_ufuncs(self):
+        with self.assertRaises(IncompatibleUnitsError):
+            np.exp(self.array)
+        with self.assertRaises(TypeError):
+            np.bitwise_and(self.array, self.array)
+
+    def test_array_functions(self):
+        self.assertEqual(np.mean(self.array), Measurement(2 / 3, meter))
+        self.assertEqual(np.var(self.array).unit, meter ** 2)
+        joined = np.concatenate([MeasurementArray([1.0], kilometer), MeasurementArray([500.0], meter)])
+        np.testing.assert_array_equal(joined.values, [1.0, 0.5])
+        self.assertTrue(np.allclose(MeasurementArray([1.0], kilometer), MeasurementArray([1000.0], meter)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from ucalcx import FundamentalQuantity, FundamentalQuantityUnit, Measurement, MetricPrefix, Unit
+from ucalcx.length import Meter, meter, kilometer
+from ucalcx.mass import gram, kilogram
+from ucalcx.mass.metric import Gram
+from ucalcx.time_quantity import second
+from ucalcx.time_quantity.time_unit import Second
+
+
+class TestFlyweights(unittest.TestCase):
+
+    def test_prefixed_units_are_shared(self):
+        self.assertIs(Meter(MetricPrefix.Kilo), kilometer)
+        self.assertIs(Meter(), meter)
+        self.assertIs(Meter(MetricPrefix.Base), meter)
+        self.assertIs(Gram(metric_prefix=MetricPrefix.Kilo), kilogram)
+        self.assertIs(Second(MetricPrefix.Nano), Second(MetricPrefix.Nano))
+
+    def test_every_prefix_is_registered(self):
+        Gram(MetricPrefix.Zepto)
+        self.assertIs(FundamentalQuantityUnit.lookup("Yg"), Gram(MetricPrefix.Yotta))
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_units_have_no_instance_dictionary(self):
+        for unit in (meter, kilometer, gram, second, Unit.from_fundamental_units((meter, 1), (second, -1))):
+            self.assertFalse(hasattr(unit, "__dict__"), unit)
+
+    def test_measurements_have_no_instance_dictionary(self):
+        self.assertFalse(hasattr(Measurement(1, meter), "__dict__"))
+
+    def test_enum_metadata_are_attributes(self):
+        self.assertEqual((MetricPrefix.Kilo.name, MetricPrefix.Kilo.symbol, MetricPrefix.Kilo.exponent), ("kilo", "k", 3))
+        self.assertEqual(FundamentalQuantity.Length.quantity_symbol, "L")
+        self.assertIs(FundamentalQuantity.Mass.si_unit, kilogram)
+
+
+if __name__ == "__main__":
+    unittest.main()
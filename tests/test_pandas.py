@@ -0,0 +1,128 @@
+import unittest
+import numpy as np
+from ucalcx import Measurement
+from ucalcx.length import meter, kilometer, centimeter
+from ucalcx.time_quantity import second
+
+try:
+    import pandas as pd
+    from ucalcx.interop.pandas import UnitArray, UnitDtype
+except ImportError:
+    pd = None
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestUnitDtype(unittest.TestCase):
+
+    def test_order_of_components_is_ignored(self):
+        self.assertEqual(UnitDtype(meter * second), UnitDtype(second * meter))
+        self.assertEqual(hash(UnitDtype(meter * second)), hash(UnitDtype(second * meter)))
+        self.assertEqual(UnitDtype("m*s"), UnitDtype("s*m"))
+
+    def test_units_of_a_quantity_are_different_dtypes(self):
+        self.assertNotEqual(UnitDtype(meter), UnitDtype(kilometer))
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestUnitSeries(unittest.TestCase):
+
+    def setUp(self):
+        self.series = pd.Series(UnitArray([1.0, 2.5, np.nan, 4.0], meter))
+
+    def test_describe(self):
+        description = self.series.describe()
+        self.assertEqual(description["count"], 3)
+        self.assertEqual(description["mean"], 2.5)
+        self.assertEqual(description["50%"], 2.5)
+
+    def test_quantile(self):
+        self.assertEqual(self.series.quantile(0.5), Measurement(2.5, meter))
+        quantiles = self.series.quantile([0.25, 0.75])
+        self.assertEqual(quantiles.dtype, UnitDtype(meter))
+        np.testing.assert_allclose(quantiles.array.to_numpy(), [1.75, 3.25])
+
+    def test_quantile_of_missing_values(self):
+        series = pd.Series(UnitArray([np.nan, np.nan], meter))
+        self.assertTrue(np.isnan(series.quantile([0.5]).array.to_numpy()).all())
+
+    def test_round(self):
+        rounded = pd.Series(UnitArray([1.234, 5.678], meter)).round(1)
+        self.assertEqual(rounded.dtype, UnitDtype(meter))
+        np.testing.assert_array_equal(rounded.array.to_numpy(), [1.2, 5.7])
+
+    def test_to_numpy(self):
+        objects = self.series.to_numpy(dtype=object)
+        self.assertEqual(objects.dtype, np.dtype(object))
+        self.assertEqual(objects[1], 2.5)
+        floats = self.series.to_numpy(dtype="float32")
+        self.assertEqual(floats.dtype, np.float32)
+        np.testing.assert_array_equal(floats, np.array([1.0, 2.5, np.nan, 4.0], dtype=np.float32))
+
+    def test_to_numpy_with_missing_value(self):
+        for na_value in (None, pd.NA):
+            values = self.series.to_numpy(dtype=object, na_value=na_value)
+            self.assertTrue(np.isnan(values[2]))
+        np.testing.assert_array_equal(self.series.to_numpy(na_value=0.0), [1.0, 2.5, 0.0, 4.0])
+
+    def test_min_count(self):
+        series = pd.Series(UnitArray([np.nan], meter))
+        self.assertTrue(pd.isna(series.sum(min_count=1)))
+        self.assertEqual(series.sum(), Measurement(0.0, meter))
+        self.assertEqual(self.series.sum(min_count=3), Measurement(7.5, meter))
+
+    def test_abs_keeps_unit(self):
+        series = pd.Series(UnitArray([-1.5, 2.0, np.nan], meter))
+        for result in (abs(series), np.abs(series)):
+            self.assertEqual(result.dtype, UnitDtype(meter))
+            np.testing.assert_array_equal(result.array.to_numpy(), [1.5, 2.0, np.nan])
+        self.assertEqual(np.sqrt(pd.Series(UnitArray([4.0], meter ** 2))).dtype, UnitDtype(meter))
+
+    def test_groupby(self):
+        groups = self.series.groupby([0, 0, 1, 1])
+        sums = groups.sum()
+        self.assertEqual(sums.dtype, UnitDtype(meter))
+        np.testing.assert_array_equal(sums.array.to_numpy(), [3.5, 4.0])
+        np.testing.assert_array_equal(groups.mean().array.to_numpy(), [1.75, 4.0])
+        np.testing.assert_array_equal(groups.count().to_numpy(), [2, 1])
+
+    def test_groupby_aggregations(self):
+        series = pd.Series(UnitArray([3.0, 1.0, 2.0, np.nan, 5.0, 4.0], meter))
+        groups = series.groupby([0, 0, 0, 1, 1, 2])
+        expected = {
+            "median": [2.0, 5.0, 4.0],
+            "min": [1.0, 5.0, 4.0],
+            "max": [3.0, 5.0, 4.0],
+            "first": [3.0, 5.0, 4.0],
+            "last": [2.0, 5.0, 4.0],
+            "std": [1.0, np.nan, np.nan],
+            "sem": [1 / np.sqrt(3), np.nan, np.nan],
+        }
+        for how, values in expected.items():
+            result = getattr(groups, how)()
+            self.assertEqual(result.dtype, UnitDtype(meter), how)
+            np.testing.assert_allclose(result.array.to_numpy(), values, err_msg=how)
+        self.assertEqual(groups.var().dtype, UnitDtype(meter ** 2))
+        np.testing.assert_array_equal(groups.sum(min_count=2).array.to_numpy(), [6.0, np.nan, np.nan])
+        np.testing.assert_array_equal(groups.sum(skipna=False).array.to_numpy(), [6.0, np.nan, 4.0])
+        np.testing.assert_array_equal(groups.idxmax().to_numpy(), [0, 4, 5])
+        np.testing.assert_array_equal(groups.idxmin().to_numpy(), [1, 4, 5])
+
+    def test_groupby_transforms(self):
+        series = pd.Series(UnitArray([1.0, 3.0, np.nan, 2.0, 5.0], meter))
+        groups = series.groupby([0, 1, 0, 0, 1])
+        np.testing.assert_array_equal(groups.cumsum().array.to_numpy(), [1.0, 3.0, np.nan, 3.0, 8.0])
+        np.testing.assert_array_equal(groups.cummax().array.to_numpy(), [1.0, 3.0, np.nan, 2.0, 5.0])
+        self.assertEqual(groups.cummin().dtype, UnitDtype(meter))
+
+    def test_groupby_missing_keys(self):
+        series = pd.Series(UnitArray([1.0, 2.0, 4.0], meter))
+        np.testing.assert_array_equal(series.groupby([0, None, 0]).sum().array.to_numpy(), [5.0])
+
+    def test_convert(self):
+        converted = self.series.ucx.convert_to(centimeter)
+        self.assertEqual(converted.dtype, UnitDtype(centimeter))
+        np.testing.assert_array_equal(converted.array.to_numpy(), [100.0, 250.0, np.nan, 400.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
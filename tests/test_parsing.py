@@ -0,0 +1,75 @@
+import unittest
+from ucalcx import Unit
+from ucalcx.common import FundamentalQuantityUnit
+from ucalcx.exceptions import InvalidUnitError
+from ucalcx.input import parse_unit_cached, unit_cache_info, clear_unit_cache
+from ucalcx.length import FundamentalLengthUnit, meter, kilometer
+
+
+class _LookupLengthUnit(FundamentalLengthUnit):
+    """ A length unit with any name and symbol, to register units whose names and symbols collide. """
+
+    def __init__(self, name: str, symbol: str):
+        super().__init__(name=name, symbol=symbol)
+
+    def meters_per_unit(self) -> float:
+        return 1.0
+
+
+class TestLookup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.first = _LookupLengthUnit("lookup first", "lkq")
+        cls.second = _LookupLengthUnit("lookup second", "lkq")
+        cls.named = _LookupLengthUnit("lkq", "lkn")
+
+    def test_symbols_and_names(self):
+        self.assertIs(FundamentalQuantityUnit.lookup("km"), kilometer)
+        self.assertIs(FundamentalQuantityUnit.lookup("kilometer"), kilometer)
+        self.assertIs(FundamentalQuantityUnit.lookup("lookup_first"), self.first)
+
+    def test_unique_name_wins_over_ambiguous_symbol(self):
+        self.assertIs(FundamentalQuantityUnit.lookup("lkq"), self.named)
+
+    def test_unknown_and_ambiguous_units(self):
+        with self.assertRaises(InvalidUnitError):
+            FundamentalQuantityUnit.lookup("no such unit")
+        _LookupLengthUnit("lookup third", "lkz")
+        _LookupLengthUnit("lookup fourth", "lkz")
+        with self.assertRaises(InvalidUnitError):
+            FundamentalQuantityUnit.lookup("lkz")
+
+
+class TestUnitCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_unit_cache()
+
+    def tearDown(self):
+        clear_unit_cache()
+
+    def test_spelling_variants_share_an_instance(self):
+        self.assertIs(parse_unit_cached("kg * m / s^2"), parse_unit_cached("kg*m/s^2"))
+        self.assertIs(Unit.from_string("m/s"), Unit.from_string(" m / s "))
+
+    def test_statistics(self):
+        parse_unit_cached("km/h")
+        parse_unit_cached("km/h")
+        parse_unit_cached("km / h")
+        info = unit_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+        clear_unit_cache()
+        self.assertEqual(unit_cache_info().currsize, 0)
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(InvalidUnitError):
+            parse_unit_cached("m/nosuchunit")
+        self.assertEqual(unit_cache_info().currsize, 0)
+
+    def test_prefixed_units_resolve_before_construction(self):
+        self.assertEqual(Unit.from_string("Mm").convert_to(Unit.from_fundamental_units((meter, 1)), 1), 1e6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from ucalcx import Unit, MetricPrefix
+from ucalcx.length import Meter, meter, kilometer, imperial
+from ucalcx.time_quantity import second
+
+
+class TestPickle(unittest.TestCase):
+
+    def test_units_are_restored_as_the_same_instances(self):
+        for unit in (meter, kilometer, imperial.foot, Meter(MetricPrefix.Femto)):
+            self.assertIs(pickle.loads(pickle.dumps(unit)), unit)
+
+    def test_compound_units_are_restored_equal(self):
+        unit = Unit.from_string("kg*m/s^2")
+        self.assertEqual(pickle.loads(pickle.dumps(unit)), unit)
+
+    def test_prefixed_unit_in_a_new_process(self):
+        # The other process never uses the unit before unpickling it
+        data = pickle.dumps(Unit.from_fundamental_units((Meter(MetricPrefix.Femto), 1), (second, -1)))
+        code = ("import pickle, sys\n"
+                "from ucalcx import Unit, MetricPrefix\n"
+                "from ucalcx.length import Meter\n"
+                "unit = pickle.loads(sys.stdin.buffer.read())\n"
+                "print(unit.symbol, unit.components[0]['unit'] is Meter(MetricPrefix.Femto), unit.convert_to(Unit.from_string('m/s'), 1))\n")
+        result = subprocess.run([sys.executable, "-c", code], input=data, capture_output=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.decode().split(), ["fm/s", "True", "1e-15"])
+
+
+if __name__ == "__main__":
+    unittest.main()
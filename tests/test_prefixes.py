@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+from ucalcx import MeasurementArray
+from ucalcx.common import prefixes
+from ucalcx.length import meter, kilometer, imperial
+
+
+class TestHumanize(unittest.TestCase):
+
+    def test_prefix_is_chosen_after_rounding(self):
+        self.assertEqual(prefixes.humanize([999.95, 999999, 0.00099999], meter), ["1 km", "1 Mm", "1 mm"])
+
+    def test_values_in_range(self):
+        self.assertEqual(prefixes.humanize([0.0123, 1.5, 4200], meter), ["12.3 mm", "1.5 m", "4.2 km"])
+
+    def test_squared_units_are_not_shown_in_exponent_notation(self):
+        self.assertEqual(prefixes.humanize([3e-7], meter ** 2), ["300000 μm^2"])
+
+    def test_zero_and_negative_values(self):
+        self.assertEqual(prefixes.humanize([0.0, -0.002], meter), ["0 m", "-2 mm"])
+
+    def test_units_without_prefixes_are_unchanged(self):
+        self.assertEqual(prefixes.humanize([1234.5], imperial.foot), ["1.23e+03 ft"])
+
+    def test_measurement_array(self):
+        array = MeasurementArray(np.array([0.5, 2000]), kilometer)
+        self.assertEqual(array.humanize(precision=2), ["500 m", "2 Mm"])
+
+
+if __name__ == "__main__":
+    unittest.main()
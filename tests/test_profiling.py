@@ -0,0 +1,56 @@
+import threading
+import unittest
+from ucalcx import Measurement, Unit, profiling
+from ucalcx.length import meter, kilometer
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        profiling.reset()
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def test_outermost_call_is_recorded(self):
+        with profiling.profile():
+            Measurement(5, meter).convert_to(kilometer)
+        stats = profiling.snapshot()
+        self.assertEqual(list(stats), [("Measurement.convert_to", "m", "km")])
+        self.assertEqual(stats[("Measurement.convert_to", "m", "km")].calls, 1)
+
+    def test_calls_are_counted(self):
+        source, target = Unit.from_string("km"), Unit.from_string("m")
+        with profiling.profile():
+            for _ in range(3):
+                source.convert_to(target, 1.0)
+        self.assertEqual(list(profiling.snapshot()), [("Unit.convert_to", "km", "m")])
+        self.assertEqual(profiling.snapshot()[("Unit.convert_to", "km", "m")].calls, 3)
+
+    def test_threads_are_counted_separately(self):
+        with profiling.profile():
+            threads = [threading.Thread(target=Measurement(1, meter).convert_to, args=(kilometer,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(profiling.snapshot()[("Measurement.convert_to", "m", "km")].calls, 4)
+
+    def test_disable_restores_the_methods(self):
+        convert_to = Measurement.convert_to
+        profiling.enable()
+        self.assertTrue(profiling.is_enabled())
+        profiling.disable()
+        self.assertIs(Measurement.convert_to, convert_to)
+        Measurement(5, meter).convert_to(kilometer)
+        self.assertEqual(profiling.snapshot(), {})
+
+    def test_prometheus_export(self):
+        with profiling.profile():
+            Measurement(5, meter).convert_to(kilometer)
+        self.assertIn('ucalcx_calls_total{operation="Measurement.convert_to",source="m",target="km"} 1', profiling.to_prometheus())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import unittest
+from ucalcx.service import ConversionBatcher, ConversionService, serve
+
+
+class TestConversionService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.service = ConversionService()
+
+    async def test_convert(self):
+        response = await self.service.handle_request({"id": 1, "op": "convert", "value": 1.5, "from": "km", "to": "m"})
+        self.assertEqual(response, {"id": 1, "value": 1500.0})
+
+    async def test_convert_list(self):
+        response = await self.service.handle_request({"id": 2, "op": "convert", "value": [1, 2], "from": "m", "to": "cm"})
+        self.assertEqual(response["value"], [100.0, 200.0])
+
+    async def test_evaluate(self):
+        response = await self.service.handle_request({"id": 3, "op": "evaluate", "expression": "36 km/h to m/s"})
+        self.assertAlmostEqual(response["value"], 10.0)
+        self.assertEqual(response["unit"], "m/s")
+
+    async def test_errors(self):
+        requests = [
+            {"id": 4, "op": "convert", "value": 1, "from": "m"},
+            {"id": 5, "op": "convert", "value": 1, "from": "m", "to": "s"},
+            {"id": 6, "op": "unknown"},
+        ]
+        for request in requests:
+            response = await self.service.handle_request(request)
+            self.assertEqual(response["id"], request["id"])
+            self.assertIn("error", response)
+        self.assertEqual(response["error"], "Unknown operation unknown, expected convert or evaluate.")
+
+    async def test_concurrent_conversions_are_batched(self):
+        batcher = ConversionBatcher()
+        values = await asyncio.gather(*(batcher.convert(value, "km", "m") for value in range(10)))
+        self.assertEqual(values, [value * 1000.0 for value in range(10)])
+        self.assertEqual((batcher.batches, batcher.conversions), (1, 10))
+
+    async def test_full_batches_are_converted_at_once(self):
+        batcher = ConversionBatcher(max_batch=4)
+        await asyncio.gather(*(batcher.convert(value, "m", "cm") for value in range(10)))
+        self.assertEqual(batcher.batches, 3)
+
+    async def test_batch_errors_reach_every_request(self):
+        batcher = ConversionBatcher()
+        results = await asyncio.gather(batcher.convert(1, "m", "s"), batcher.convert(2, "m", "s"), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, Exception) for result in results))
+
+    async def test_socket(self):
+        server = await serve(port=0, service=self.service)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"id": 1, "op": "convert", "value": 2, "from": "h", "to": "min"}\n')
+            writer.write(b"not json\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(2)]
+            writer.close()
+            await writer.wait_closed()
+        self.assertIn({"id": 1, "value": 120.0}, responses)
+        self.assertIn(None, [response["id"] for response in responses if "error" in response])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import math
+import sqlite3
+import unittest
+from ucalcx.interop import sqlite
+
+
+class TestFunctions(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.addCleanup(self.connection.close)
+        sqlite.register(self.connection)
+
+    def query(self, sql, *parameters):
+        return self.connection.execute(sql, parameters).fetchone()[0]
+
+    def test_convert(self):
+        self.assertAlmostEqual(self.query("SELECT ucalcx_convert(5280, 'ft', 'mi')"), 1)
+        self.assertAlmostEqual(self.query("SELECT ucalcx_convert(212, '°F', '°C')"), 100)
+
+    def test_factor_and_offset(self):
+        self.assertAlmostEqual(self.query("SELECT ucalcx_factor('km', 'm')"), 1000)
+        self.assertAlmostEqual(self.query("SELECT ucalcx_offset('°C', '°F')"), 32)
+
+    def test_nulls_give_null(self):
+        self.assertIsNone(self.query("SELECT ucalcx_convert(NULL, 'km', 'm')"))
+        self.assertIsNone(self.query("SELECT ucalcx_convert(1, NULL, 'm')"))
+        self.assertIsNone(self.query("SELECT ucalcx_factor('km', NULL)"))
+
+    def test_invalid_units_raise(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            self.query("SELECT ucalcx_convert(1, 'km', 's')")
+        with self.assertRaises(sqlite3.OperationalError):
+            self.query("SELECT ucalcx_convert(1, 'parsec', 'm')")
+
+    def test_prefix(self):
+        sqlite.register(self.connection, prefix="units")
+        self.assertAlmostEqual(self.query("SELECT units_convert(1, 'km', 'm')"), 1000)
+
+
+class TestAggregates(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.addCleanup(self.connection.close)
+        sqlite.register(self.connection)
+        self.connection.execute("CREATE TABLE readings (value REAL, unit TEXT)")
+        self.connection.executemany("INSERT INTO readings VALUES (?, ?)",
+                                    [(1, "km"), (500, "m"), (1000, "ft"), (None, "m"), (7, None)])
+
+    def aggregate(self, function, target="m"):
+        return self.connection.execute(f"SELECT {function}(value, unit, ?) FROM readings", (target,)).fetchone()[0]
+
+    def test_sum_and_average(self):
+        self.assertAlmostEqual(self.aggregate("ucalcx_sum"), 1804.8)
+        self.assertAlmostEqual(self.aggregate("ucalcx_avg"), 1804.8 / 3)
+
+    def test_minimum_and_maximum(self):
+        self.assertAlmostEqual(self.aggregate("ucalcx_min"), 304.8)
+        self.assertAlmostEqual(self.aggregate("ucalcx_max", "km"), 1)
+
+    def test_grouped_rows(self):
+        rows = self.connection.execute("SELECT unit, ucalcx_sum(value, unit, 'm') FROM readings WHERE unit IS NOT NULL "
+                                       "GROUP BY unit ORDER BY unit").fetchall()
+        self.assertEqual([unit for unit, _ in rows], ["ft", "km", "m"])
+        self.assertAlmostEqual(rows[1][1], 1000)
+
+    def test_temperatures(self):
+        self.connection.execute("DELETE FROM readings")
+        self.connection.executemany("INSERT INTO readings VALUES (?, ?)", [(0, "°C"), (212, "°F")])
+        self.assertAlmostEqual(self.aggregate("ucalcx_sum", "°C"), 100)
+        self.assertAlmostEqual(self.aggregate("ucalcx_avg", "°C"), 50)
+        self.assertAlmostEqual(self.aggregate("ucalcx_min", "°F"), 32)
+
+    def test_sum_is_compensated(self):
+        self.connection.execute("DELETE FROM readings")
+        values = [1e16, 1.0, -1e16] * 10
+        self.connection.executemany("INSERT INTO readings VALUES (?, 'm')", [(value,) for value in values])
+        self.assertEqual(self.aggregate("ucalcx_sum"), math.fsum(values))
+
+    def test_empty_table(self):
+        self.connection.execute("DELETE FROM readings")
+        for function in ("ucalcx_sum", "ucalcx_avg", "ucalcx_min", "ucalcx_max"):
+            self.assertIsNone(self.aggregate(function))
+
+
+if __name__ == "__main__":
+    unittest.main()
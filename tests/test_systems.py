@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from ucalcx import FundamentalQuantity, Measurement, MeasurementArray, Unit, UncertainMeasurement
+from ucalcx.exceptions import InvalidUnitError
+from ucalcx.length import meter, kilometer, imperial
+from ucalcx.temperature import celsius
+from ucalcx.systems import UnitSystem, SI, CGS, US_CUSTOMARY, NAUTICAL
+
+
+class TestSystems(unittest.TestCase):
+
+    def test_si(self):
+        converted = Measurement(100, Unit.from_string("km/h")).to_system(SI)
+        self.assertEqual(converted.unit.symbol, "m/s")
+        self.assertAlmostEqual(converted.value, 100 / 3.6)
+        self.assertAlmostEqual(Measurement(0, celsius).to_system(SI).value, 273.15)
+
+    def test_cgs(self):
+        converted = Measurement(9.81, Unit.from_string("m/s^2")).to_system(CGS)
+        self.assertEqual(converted.unit.symbol, "cm/s^2")
+        self.assertAlmostEqual(converted.value, 981)
+
+    def test_preferred_units(self):
+        converted = Measurement(100, Unit.from_string("km/h")).to_system(US_CUSTOMARY)
+        self.assertEqual(converted.unit.symbol, "mi/h")
+        self.assertAlmostEqual(converted.value, 62.13711922373341)
+        self.assertEqual(NAUTICAL.target(Unit.from_string("m/s")).symbol, "nmi/h")
+
+    def test_powers_are_kept(self):
+        self.assertEqual(US_CUSTOMARY.target(meter ** 2), Unit.from_fundamental_units((imperial.foot, 2)))
+
+    def test_quantities_without_a_unit_are_kept(self):
+        system = UnitSystem("lengths", {FundamentalQuantity.Length: kilometer})
+        self.assertEqual(system.target(meter / Unit.from_string("h")).symbol, "km/h")
+
+    def test_arrays(self):
+        converted = MeasurementArray([1, 2], kilometer).to_system(US_CUSTOMARY)
+        self.assertEqual(converted.unit.symbol, "ft")
+        np.testing.assert_allclose(converted.values, np.array([1000, 2000]) / 0.3048)
+
+    def test_subclasses_convert_themselves(self):
+        converted = UncertainMeasurement(1, kilometer, 0.01).to_system(SI)
+        self.assertIsInstance(converted, UncertainMeasurement)
+        self.assertAlmostEqual(converted.uncertainty, 10)
+
+    def test_convert_all(self):
+        converted = SI.convert_all([Measurement(1, kilometer), Measurement(100, Unit.from_string("cm"))])
+        self.assertEqual([measurement.value for measurement in converted], [1000, 1])
+
+    def test_invalid_units(self):
+        with self.assertRaises(InvalidUnitError):
+            SI.plan("m")
+
+
+class TestPlans(unittest.TestCase):
+
+    def setUp(self):
+        self.system = UnitSystem("test", {**SI.units, FundamentalQuantity.Length: imperial.foot})
+
+    def test_plans_are_cached(self):
+        plan = self.system.plan(kilometer)
+        self.assertIs(self.system.plan(Unit.coerce(kilometer)), plan)
+        self.assertIs(self.system.plan(kilometer), plan)
+        self.assertEqual(len(self.system._plans), 1)
+
+    def test_clear_cache(self):
+        self.system.plan(kilometer)
+        self.system.units[FundamentalQuantity.Length] = meter
+        self.assertEqual(self.system.target(kilometer).symbol, "ft")
+        self.system.clear_cache()
+        self.assertEqual(self.system.target(kilometer).symbol, "m")
+
+
+if __name__ == "__main__":
+    unittest.main()
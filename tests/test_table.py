@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from ucalcx import MeasurementArray
+from ucalcx.common import MeasurementTable
+from ucalcx.length import kilometer, centimeter, meter
+
+
+class TestMeasurementTableJoin(unittest.TestCase):
+
+    def setUp(self):
+        self.left = MeasurementTable({"key": MeasurementArray([0.1, 0.2, 0.3, 0.7], kilometer),
+                                      "a": MeasurementArray([1.0, 2.0, 3.0, 4.0], meter)})
+        self.right = MeasurementTable({"key": MeasurementArray([10000, 20000, 30000, 70000], centimeter),
+                                       "b": MeasurementArray([5.0, 6.0, 7.0, 8.0], meter)})
+
+    def test_keys_in_other_units_match_after_rounding(self):
+        # 30000 cm converts to 0.30000000000000004 km
+        joined = self.left.join(self.right, "key")
+        self.assertEqual(len(joined), 4)
+        np.testing.assert_array_equal(joined["b"].values, [5.0, 6.0, 7.0, 8.0])
+        self.assertEqual(joined["key"].unit, self.left["key"].unit)
+
+    def test_exact_join(self):
+        self.assertEqual(len(self.left.join(self.right, "key", rtol=0)), 2)
+
+    def test_left_join_fills_missing_rows(self):
+        right = MeasurementTable({"key": MeasurementArray([20000], centimeter), "b": MeasurementArray([6.0], meter)})
+        joined = self.left.join(right, "key", how="left")
+        self.assertEqual(len(joined), 4)
+        np.testing.assert_array_equal(joined["b"].values, [np.nan, 6.0, np.nan, np.nan])
+
+    def test_duplicate_keys_match_every_pair(self):
+        right = MeasurementTable({"key": MeasurementArray([20000, 20000], centimeter), "b": MeasurementArray([6.0, 9.0], meter)})
+        joined = self.left.join(right, "key")
+        np.testing.assert_array_equal(joined["a"].values, [2.0, 2.0])
+        np.testing.assert_array_equal(joined["b"].values, [6.0, 9.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
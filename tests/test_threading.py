@@ -0,0 +1,76 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from ucalcx import Unit, compile_converter
+from ucalcx.common import codes
+from ucalcx.length import FundamentalLengthUnit, meter
+from ucalcx.time_quantity import second
+
+THREADS = 8
+
+
+class _ThreadedLengthUnit(FundamentalLengthUnit):
+    """ A length unit with any name and symbol, so every test constructs units that no thread has seen yet. """
+
+    def __init__(self, name: str, symbol: str, meters: float = 1.0):
+        super().__init__(name=name, symbol=symbol)
+        self.meters = meters
+
+    def meters_per_unit(self) -> float:
+        return self.meters
+
+
+def _run(function, *args):
+    """ Call a function from several threads at once, and return the result of every call. """
+
+    barrier = threading.Barrier(THREADS)
+
+    def call(_):
+        barrier.wait()
+        return function(*args)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(call, range(THREADS)))
+
+
+class TestConcurrentConstruction(unittest.TestCase):
+
+    def assertSameInstance(self, results):
+        self.assertTrue(all(result is results[0] for result in results), results)
+
+    def test_fundamental_units(self):
+        self.assertSameInstance(_run(_ThreadedLengthUnit, "threaded fundamental", "thf"))
+
+    def test_units(self):
+        unit = _ThreadedLengthUnit("threaded unit", "thu")
+        self.assertSameInstance(_run(Unit.from_fundamental_units, (unit, 1), (second, -2)))
+
+    def test_parsed_units(self):
+        _ThreadedLengthUnit("threaded parsed", "thp")
+        results = _run(Unit.from_string, "thp^2/s")
+        self.assertSameInstance(results)
+        self.assertEqual(results[0].symbol, "thp^2/s")
+
+    def test_converters(self):
+        unit = _ThreadedLengthUnit("threaded converted", "thc", 0.5)
+        converters = _run(compile_converter, unit, meter)
+        self.assertSameInstance(converters)
+        self.assertEqual(converters[0](4), 2)
+
+    def test_conversion_factors(self):
+        unit = Unit.coerce(_ThreadedLengthUnit("threaded factors", "thx", 2.0))
+        self.assertEqual(set(_run(unit.conversion_factors, Unit.coerce(meter))), {(2.0, 0.0)})
+
+
+class TestConcurrentCodes(unittest.TestCase):
+
+    def test_every_unit_gets_one_code(self):
+        units = [_ThreadedLengthUnit(f"threaded code {index}", f"thk{index}") for index in range(THREADS)]
+        results = _run(lambda: [codes.code(unit) for unit in units])
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(len(set(results[0])), len(units))
+        self.assertEqual([codes.unit(code) for code in results[0]], units)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from ucalcx import Measurement, MeasurementArray, Unit, UncertainMeasurement, UncertainMeasurementArray
+from ucalcx.exceptions import IncompatibleUnitsError
+from ucalcx.length import meter, kilometer
+
+
+class TestUncertainMeasurementEquality(unittest.TestCase):
+
+    def test_uncertainty_is_compared(self):
+        self.assertNotEqual(UncertainMeasurement(5, meter, 0.1), UncertainMeasurement(5, meter, 3))
+        self.assertEqual(UncertainMeasurement(1, kilometer, 0.001), UncertainMeasurement(1000, meter, 1))
+
+    def test_plain_measurements_are_exact(self):
+        self.assertEqual(UncertainMeasurement(5, meter), Measurement(5, meter))
+        self.assertNotEqual(Measurement(5, meter), UncertainMeasurement(5, meter, 0.1))
+
+    def test_equal_measurements_have_equal_hashes(self):
+        self.assertEqual(hash(UncertainMeasurement(1, kilometer, 0.001)), hash(UncertainMeasurement(1000, meter, 1)))
+
+    def test_arrays_compare_elementwise(self):
+        array = UncertainMeasurementArray([1, 2], meter, [0.1, 0.2])
+        np.testing.assert_array_equal(array == UncertainMeasurementArray([1, 2], meter, [0.1, 0.3]), [True, False])
+        np.testing.assert_array_equal(array != array, [False, False])
+
+
+class TestMixedOperations(unittest.TestCase):
+
+    def setUp(self):
+        self.measurement = UncertainMeasurement(5, meter, 0.1)
+        self.array = MeasurementArray([1, 2], meter)
+
+    def test_measurement_and_array(self):
+        for result in (self.measurement + self.array, self.array + self.measurement):
+            self.assertIsInstance(result, UncertainMeasurementArray)
+            np.testing.assert_array_equal(result.values, [6, 7])
+            np.testing.assert_array_equal(result.uncertainties, [0.1, 0.1])
+        np.testing.assert_array_equal((self.array - self.measurement).values, [-4, -3])
+
+    def test_numbers_are_dimensionless(self):
+        array = UncertainMeasurementArray([1, 2], Unit.from_fundamental_units(), 0.1)
+        np.testing.assert_array_equal((array - 1).values, [0, 1])
+        np.testing.assert_array_equal((1 - array).values, [0, -1])
+        with self.assertRaises(IncompatibleUnitsError):
+            UncertainMeasurementArray([1, 2], meter, 0.1) - 1
+
+
+if __name__ == "__main__":
+    unittest.main()
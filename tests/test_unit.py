@@ -0,0 +1,85 @@
+import unittest
+from ucalcx import Unit, Measurement
+from ucalcx.exceptions import InvalidUnitError
+from ucalcx.length import meter, kilometer, imperial
+from ucalcx.temperature import celsius, fahrenheit, kelvin, rankine
+from ucalcx.time_quantity import second, minute, hour
+
+
+class TestCompoundConversions(unittest.TestCase):
+
+    def test_area(self):
+        self.assertAlmostEqual((meter ** 2).convert_to(imperial.foot ** 2, 1), 10.763910416709722)
+
+    def test_acceleration(self):
+        source = Unit.from_fundamental_units((meter, 1), (second, -2))
+        target = Unit.from_fundamental_units((imperial.foot, 1), (minute, -2))
+        self.assertAlmostEqual(source.convert_to(target, 1), 3600 / 0.3048)
+
+    def test_speed(self):
+        self.assertAlmostEqual(Unit.from_string("km/h").convert_to(Unit.from_string("m/s"), 36), 10)
+
+    def test_round_trip(self):
+        source, target = Unit.from_string("kg*m^2/s^3"), Unit.from_string("g*cm^2/min^3")
+        self.assertAlmostEqual(target.convert_to(source, source.convert_to(target, 2.5)), 2.5)
+
+    def test_offsets_are_dropped_in_compound_units(self):
+        source = Unit.from_fundamental_units((celsius, 1), (second, -1))
+        target = Unit.from_fundamental_units((fahrenheit, 1), (second, -1))
+        self.assertEqual(source.conversion_factors(target), (1.8, 0.0))
+
+
+class TestTemperatureConversions(unittest.TestCase):
+
+    def setUp(self):
+        self.celsius = Unit.from_fundamental_units((celsius, 1))
+        self.fahrenheit = Unit.from_fundamental_units((fahrenheit, 1))
+
+    def test_fixed_points_are_exact(self):
+        self.assertEqual(self.fahrenheit.convert_to(self.celsius, 212), 100.0)
+        self.assertEqual(self.fahrenheit.convert_to(self.celsius, 32), 0.0)
+        self.assertEqual(self.fahrenheit.convert_to(self.celsius, 98.6), 37.0)
+        self.assertEqual(self.celsius.convert_to(self.fahrenheit, 100), 212.0)
+        self.assertEqual(Measurement(212, fahrenheit).convert_to(self.celsius).value, 100.0)
+
+    def test_factors(self):
+        self.assertEqual(self.celsius.conversion_factors(self.fahrenheit), (1.8, 32.0))
+        self.assertEqual(Unit.from_fundamental_units((kelvin, 1)).conversion_factors(self.celsius), (1.0, -273.15))
+        self.assertEqual(Unit.from_fundamental_units((rankine, 1)).conversion_factors(self.fahrenheit), (1.0, -459.67))
+
+
+class TestUnitKey(unittest.TestCase):
+
+    def test_order_of_components_is_ignored(self):
+        self.assertEqual(meter * second, second * meter)
+        self.assertEqual(hash(meter * second), hash(second * meter))
+        self.assertEqual((meter * second).key, (second * meter).key)
+
+    def test_symbol_keeps_written_order(self):
+        self.assertEqual((meter * second).symbol, "m*s")
+        self.assertEqual((second * meter).symbol, "s*m")
+
+    def test_different_units_of_a_quantity_are_not_equal(self):
+        self.assertNotEqual(kilometer / hour, meter / second)
+        self.assertEqual(len({meter * second, second * meter, kilometer * second}), 2)
+
+    def test_construction_is_cached(self):
+        self.assertIs(Unit.from_fundamental_units((meter, 1), (second, -1)), Unit.from_fundamental_units((meter, 1), (second, -1)))
+
+    def test_absent_quantities_are_left_out(self):
+        self.assertEqual(set((meter / second).dimension), {meter.quantity, second.quantity})
+
+
+class TestCoerce(unittest.TestCase):
+
+    def test_fundamental_units_are_wrapped(self):
+        self.assertIs(Unit.coerce(meter), Unit.from_fundamental_units((meter, 1)))
+        self.assertIs(Unit.coerce(meter / second), meter / second)
+
+    def test_invalid_units(self):
+        with self.assertRaises(InvalidUnitError):
+            Unit.coerce("m")
+
+
+if __name__ == "__main__":
+    unittest.main()
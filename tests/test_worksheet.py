@@ -0,0 +1,75 @@
+import unittest
+from ucalcx import Measurement
+from ucalcx.exceptions import CircularReferenceError, IncompatibleUnitsError, InvalidValueError
+from ucalcx.length import meter, centimeter
+from ucalcx.worksheet import Worksheet
+
+
+class TestWorksheet(unittest.TestCase):
+
+    def setUp(self):
+        self.sheet = Worksheet()
+        self.sheet["width"] = "3 m"
+        self.sheet["depth"] = "250 cm"
+        self.sheet["area"] = "width * depth"
+        self.sheet["volume"] = "area * 2 m to cm^3"
+        self.sheet["other"] = "1 s"
+
+    def test_values(self):
+        self.assertAlmostEqual(self.sheet["area"].value, 7.5)
+        self.assertEqual(self.sheet["area"].unit.symbol, "m^2")
+        self.assertAlmostEqual(self.sheet["volume"].value, 15e6)
+
+    def test_only_downstream_cells_are_evaluated(self):
+        self.assertEqual(self.sheet.set("depth", "4 m"), ["depth", "area", "volume"])
+        self.assertAlmostEqual(self.sheet["volume"].value, 24e6)
+
+    def test_unchanged_results_stop_propagation(self):
+        self.assertEqual(self.sheet.set("depth", "2.5 m"), ["depth", "area"])
+
+    def test_cells_are_compiled_once_per_units(self):
+        compilations = self.sheet.compilations
+        self.sheet["width"] = "5 m"
+        # Only the edited cell is new, its dependents reuse their compiled functions
+        self.assertEqual(self.sheet.compilations, compilations + 1)
+        self.sheet["width"] = Measurement(500, centimeter)
+        self.assertEqual(len(self.sheet.cell("area").plans), 2)
+        self.assertAlmostEqual(self.sheet["area"].normalized_key[1], 12.5)
+
+    def test_circular_references_are_rejected(self):
+        with self.assertRaises(CircularReferenceError):
+            self.sheet["width"] = "volume / 1 m^2"
+        self.assertEqual(self.sheet.cell("width").expression, "3 m")
+
+    def test_errors_propagate(self):
+        self.sheet["width"] = "2 s"
+        self.sheet["total"] = "width + depth"
+        with self.assertRaises(IncompatibleUnitsError):
+            self.sheet["total"]
+        self.sheet["doubled"] = "total * 2"
+        with self.assertRaises(InvalidValueError):
+            self.sheet["doubled"]
+        self.sheet["width"] = "2 m"
+        self.assertEqual(self.sheet["doubled"], Measurement(9, meter))
+
+    def test_removed_cells(self):
+        del self.sheet["depth"]
+        self.assertNotIn("depth", self.sheet)
+        with self.assertRaises(InvalidValueError):
+            self.sheet["area"]
+        self.sheet["depth"] = "1 m"
+        self.assertAlmostEqual(self.sheet["area"].value, 3.0)
+
+    def test_dependencies(self):
+        self.assertEqual(self.sheet.dependencies("area"), ("width", "depth"))
+        self.assertEqual(self.sheet.dependents("area"), {"volume"})
+
+    def test_invalid_names(self):
+        with self.assertRaises(InvalidValueError):
+            self.sheet["to"] = "1 m"
+        with self.assertRaises(InvalidValueError):
+            self.sheet["2x"] = "1 m"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,14 +6,19 @@ from .temperature import kelvin
 from .electric_current import ampere
 from .luminous_intensity import candela
 from .amount_of_substance import mole
+from . import systems
+from . import chemistry
 
 
 
-__all__ = ["FundamentalQuantity", "Unit", "FundamentalQuantityUnit", "Measurement",
+__all__ = ["FundamentalQuantity", "Unit", "FundamentalQuantityUnit", "Measurement", "MeasurementArray", "aggregation", "codes", "check_units", "compile_converter",
+           "UncertainMeasurement", "UncertainMeasurementArray", "IntervalMeasurement", "IntervalMeasurementArray", "MeasurementTable",
            "imperial", "nautical", "meter", "millimeter", "centimeter", "kilometer",
            "kilogram", "gram",
            "second",
            "kelvin",
            "ampere",
            "candela",
-           "mole"]
\ No newline at end of file
+           "mole",
+           "systems",
+           "chemistry"]
\ No newline at end of file
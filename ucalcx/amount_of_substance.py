@@ -3,9 +3,11 @@ from abc import abstractmethod, ABC
 
 class FundamentalAmountUnit(FundamentalQuantityUnit, ABC):
     """ A base class for units of amount of substance. This class should not be instantiated directly. """
+
+    __slots__ = ()
     
     def __init__(self, name: str, symbol: str):
-        super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Current)
+        super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.AmountOfSubstance)
 
     def _conversion_method(self, other: "FundamentalAmountUnit", value: float) -> float:
         if not isinstance(other, FundamentalAmountUnit):
@@ -20,6 +22,8 @@ class FundamentalAmountUnit(FundamentalQuantityUnit, ABC):
 
 class Mole(FundamentalAmountUnit):
     """ Represents a mole. """
+
+    __slots__ = ("metric_prefix",)
     
     def __init__(self, metric_prefix: MetricPrefix=MetricPrefix.Base):
         super().__init__(name="mole", symbol="mol")
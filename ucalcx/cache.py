@@ -0,0 +1,219 @@
+""" An optional on-disk cache of parsed unit strings and conversion factors, so short-lived processes start warm.
+
+A cache file holds a snapshot of the registered units it refers to, the unit strings parsed so far and the unit
+each one resolved to, and the scale and offset of the most recently computed conversions. Loading it fills the
+unit string cache of `Unit.from_string` and the conversion cache of `Unit.conversion_factors`, so the first
+conversions of a new process cost a dictionary lookup instead of lexing, parsing and computing factors.
+
+The file starts with a header carrying a magic number, the format version and a CRC-32 checksum of the rest of
+the file, which is read through `mmap`. A file with another format version or a wrong checksum is ignored. Every
+unit in the snapshot is checked against the running registry by its conversion to its SI unit, and entries that
+refer to units that are missing or whose definition changed are skipped, so a stale cache never gives wrong
+conversions. Files are written to a temporary file and renamed into place, so concurrent workers never read a
+partial file.
+
+By default the cache lives in `$XDG_CACHE_HOME/ucalcx` (`~/.cache/ucalcx` when the variable is not set).
+
+Examples:
+    >>> from ucalcx import cache
+    >>> cache.persist()  # Load the cache now, and save it when the process exits
+    CacheStats(units=0, strings=0, conversions=0)
+    >>> cache.save()
+    PosixPath('/home/user/.cache/ucalcx/units-v1.bin')
+    >>> cache.load()
+    CacheStats(units=12, strings=8, conversions=25)
+"""
+
+import atexit
+import itertools
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import NamedTuple, Optional
+from .common import FundamentalQuantityUnit, Unit
+from .input import parsing
+
+
+FORMAT_VERSION = 1
+" The version of the file format, files written with another version are ignored. "
+
+MAX_CONVERSIONS = 4096
+" The most conversions saved to a cache file, the most recently computed ones are kept. "
+
+_MAGIC = b"UCXC"
+_HEADER = struct.Struct("<4sIIQQ")
+" The magic number, format version, checksum of the rest of the file, length of the index and number of conversions. "
+
+
+class CacheStats(NamedTuple):
+    """ The number of units, unit strings and conversions saved to or loaded from a cache file. """
+
+    units: int
+    strings: int
+    conversions: int
+
+
+def default_path() -> Path:
+    """ The path of the cache file in the user's cache directory, `$XDG_CACHE_HOME/ucalcx/units-v1.bin`. """
+
+    directory = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(directory) / "ucalcx" / f"units-v{FORMAT_VERSION}.bin"
+
+
+def _fingerprint(unit: FundamentalQuantityUnit) -> tuple[float, float]:
+    """ The conversions of 0 and 1 of a unit to its SI unit, which change whenever the definition of the unit does. """
+
+    si_unit = unit.quantity.si_unit
+    if si_unit is None:
+        return (0.0, 1.0)
+    return (float(unit.convert_to(si_unit, 0.0)), float(unit.convert_to(si_unit, 1.0)))
+
+
+def save(path: Optional[str | os.PathLike] = None, max_conversions: int = MAX_CONVERSIONS) -> Path:
+    """ Save the parsed unit strings and computed conversions of this process to a cache file.
+
+    Args:
+        path (Optional[str | os.PathLike]): The path of the cache file. Defaults to `default_path()`.
+        max_conversions (int): The most conversions to save, the most recently computed ones are kept.
+
+    Returns:
+        Path: The path the cache was written to.
+    """
+
+    path = Path(path) if path is not None else default_path()
+    units: dict[FundamentalQuantityUnit, int] = {}
+    keys: dict[tuple, int] = {}
+
+    def key_index(key: tuple) -> int:
+        if key not in keys:
+            keys[key] = len(keys)
+            for unit, _ in key:
+                units.setdefault(unit, len(units))
+        return keys[key]
+
+    # Copies of the caches are taken at once, as other threads may add to them while the file is written
+    # Parsed units are saved in the order they were written in, so they keep their symbols when loaded
+    strings = [[text, key_index(unit._terms)] for text, unit in parsing._parsed_units.copy().items()]
+    recent = list(Unit._conversion_cache.copy().items())[-max_conversions:] if max_conversions > 0 else []
+    conversions = [[key_index(source), key_index(target)] for (source, target), _ in recent]
+    factors = [value for _, pair in recent for value in pair]
+
+    index = json.dumps({
+        "units": [[*unit.registry_key, *_fingerprint(unit)] for unit in units],
+        "keys": [[[units[unit], power] for unit, power in key] for key in keys],
+        "strings": strings,
+        "conversions": conversions,
+    }).encode()
+    # The factors are aligned to 8 bytes, so they can be read straight from the mapped file
+    padding = -(_HEADER.size + len(index)) % 8
+    body = index + b"\0" * padding + struct.pack(f"<{len(factors)}d", *factors)
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, zlib.crc32(body), len(index), len(conversions))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(header)
+            file.write(body)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return path
+
+
+def _read(path: Path) -> Optional[tuple[dict, list[float]]]:
+    """ Read the index and factors of a cache file, or None if the file is missing, malformed or of another version. """
+
+    try:
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < _HEADER.size:
+                return None
+            magic, version, checksum, index_length, count = _HEADER.unpack_from(mapped)
+            if magic != _MAGIC or version != FORMAT_VERSION:
+                return None
+            start = _HEADER.size + index_length + (-(_HEADER.size + index_length) % 8)
+            if len(mapped) != start + count * 16:
+                return None
+            with memoryview(mapped) as view:
+                if zlib.crc32(view[_HEADER.size:]) != checksum:
+                    return None
+                with view[start:].cast("d") as values:
+                    factors = values.tolist()
+            index = json.loads(mapped[_HEADER.size:_HEADER.size + index_length])
+    except (OSError, ValueError):
+        # Missing and empty files cannot be mapped, and malformed indexes fail to decode
+        return None
+    return index, factors
+
+
+def load(path: Optional[str | os.PathLike] = None) -> CacheStats:
+    """ Load a cache file into the unit string and conversion caches.
+
+    Missing, corrupt and outdated files are ignored, and entries that refer to units that are not registered, or
+    whose definition changed since the file was written, are skipped.
+
+    Args:
+        path (Optional[str | os.PathLike]): The path of the cache file. Defaults to `default_path()`.
+
+    Returns:
+        CacheStats: The number of units, unit strings and conversions that were loaded.
+    """
+
+    contents = _read(Path(path) if path is not None else default_path())
+    if contents is None:
+        return CacheStats(0, 0, 0)
+    index, factors = contents
+    try:
+        registry = FundamentalQuantityUnit.registry
+        units = []
+        for quantity, name, *fingerprint in index["units"]:
+            unit = registry.get((quantity, name))
+            units.append(unit if unit is not None and list(_fingerprint(unit)) == fingerprint else None)
+
+        keys = []
+        for key in index["keys"]:
+            components = [(units[unit], power) for unit, power in key]
+            valid = all(unit is not None for unit, _ in components)
+            keys.append(Unit.from_fundamental_units(*components) if valid else None)
+
+        strings = 0
+        for text, key in index["strings"]:
+            if keys[key] is not None and text not in parsing._parsed_units:
+                parsing._parsed_units[text] = keys[key]
+                strings += 1
+
+        conversions = 0
+        for (source, target), scale, offset in zip(index["conversions"], itertools.islice(factors, 0, None, 2),
+                                                   itertools.islice(factors, 1, None, 2)):
+            if keys[source] is not None and keys[target] is not None:
+                Unit._conversion_cache.setdefault((keys[source].key, keys[target].key), (scale, offset))
+                conversions += 1
+    except (KeyError, IndexError, TypeError, ValueError):
+        # An index that does not have the expected structure is treated like a corrupt file
+        return CacheStats(0, 0, 0)
+    return CacheStats(sum(unit is not None for unit in units), strings, conversions)
+
+
+def persist(path: Optional[str | os.PathLike] = None) -> CacheStats:
+    """ Load a cache file now, and save the caches of this process back to it when the process exits.
+
+    Returns:
+        CacheStats: The number of units, unit strings and conversions that were loaded.
+    """
+
+    atexit.register(_save_quietly, path)
+    return load(path)
+
+
+def _save_quietly(path: Optional[str | os.PathLike]):
+    """ Save the caches when the process exits, a cache that cannot be written is not worth a traceback. """
+
+    try:
+        save(path)
+    except OSError:
+        pass
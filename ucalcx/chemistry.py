@@ -0,0 +1,327 @@
+""" Molar masses of chemical species, and conversions between masses and amounts of substance.
+
+Molar masses are computed from chemical formulas and the standard atomic weights of the elements, and cached per
+formula. A `SpeciesTable` gives every species of a dataset an integer code and keeps their molar masses in an
+array, so a column of masses of many species is converted to amounts (or back) in a single vectorized pass, with
+one gather of the molar masses by code and one multiply and divide.
+
+Formulas are written with element symbols and counts, parentheses or brackets for groups, and `·`, `.` or `*`
+for the parts of adducts like hydrates, which may start with a count, e.g. `Ca(OH)2`, `[Fe(CN)6]4-` or
+`CuSO4·5H2O`. A trailing charge is accepted and ignored, the mass of the electrons is below the precision of the
+atomic weights. Digits between an element and a trailing sign are ambiguous, `Fe3+` could be three iron atoms or a
+charge of 3+, so such formulas are rejected and the charge is written after `^` or a space instead, e.g. `Fe^3+`,
+`NH4^+` or `SO4 2-`.
+
+Examples:
+    >>> import numpy as np
+    >>> from ucalcx import MeasurementArray
+    >>> from ucalcx.chemistry import SpeciesTable, molar_mass
+    >>> from ucalcx.mass import gram
+    >>> molar_mass("H2O")
+    18.015
+    >>> species = SpeciesTable(["H2O", "CO2", "C6H12O6"])
+    >>> species.to_amount(MeasurementArray([18.015, 88.018, 180.156], gram), species.encode(["H2O", "CO2", "C6H12O6"]))
+    MeasurementArray([1. 2. 1.], mole (mol))
+"""
+
+import functools
+import re
+import numpy as np
+from typing import Iterable, Optional
+from .common import FundamentalQuantityUnit, Measurement, MeasurementArray, Unit
+from .exceptions import InvalidValueError
+from .mass import gram
+from .amount_of_substance import mole
+
+
+ATOMIC_WEIGHTS: dict[str, float] = {
+    "H": 1.008, "He": 4.002602, "Li": 6.94, "Be": 9.0121831, "B": 10.81, "C": 12.011, "N": 14.007, "O": 15.999,
+    "F": 18.998403163, "Ne": 20.1797, "Na": 22.98976928, "Mg": 24.305, "Al": 26.9815385, "Si": 28.085,
+    "P": 30.973761998, "S": 32.06, "Cl": 35.45, "Ar": 39.948, "K": 39.0983, "Ca": 40.078, "Sc": 44.955908,
+    "Ti": 47.867, "V": 50.9415, "Cr": 51.9961, "Mn": 54.938044, "Fe": 55.845, "Co": 58.933194, "Ni": 58.6934,
+    "Cu": 63.546, "Zn": 65.38, "Ga": 69.723, "Ge": 72.630, "As": 74.921595, "Se": 78.971, "Br": 79.904,
+    "Kr": 83.798, "Rb": 85.4678, "Sr": 87.62, "Y": 88.90584, "Zr": 91.224, "Nb": 92.90637, "Mo": 95.95,
+    "Tc": 98, "Ru": 101.07, "Rh": 102.90550, "Pd": 106.42, "Ag": 107.8682, "Cd": 112.414, "In": 114.818,
+    "Sn": 118.710, "Sb": 121.760, "Te": 127.60, "I": 126.90447, "Xe": 131.293, "Cs": 132.90545196,
+    "Ba": 137.327, "La": 138.90547, "Ce": 140.116, "Pr": 140.90766, "Nd": 144.242, "Pm": 145, "Sm": 150.36,
+    "Eu": 151.964, "Gd": 157.25, "Tb": 158.92535, "Dy": 162.500, "Ho": 164.93033, "Er": 167.259,
+    "Tm": 168.93422, "Yb": 173.045, "Lu": 174.9668, "Hf": 178.49, "Ta": 180.94788, "W": 183.84, "Re": 186.207,
+    "Os": 190.23, "Ir": 192.217, "Pt": 195.084, "Au": 196.966569, "Hg": 200.592, "Tl": 204.38, "Pb": 207.2,
+    "Bi": 208.98040, "Po": 209, "At": 210, "Rn": 222, "Fr": 223, "Ra": 226, "Ac": 227, "Th": 232.0377,
+    "Pa": 231.03588, "U": 238.02891, "Np": 237, "Pu": 244, "Am": 243, "Cm": 247, "Bk": 247, "Cf": 251,
+    "Es": 252, "Fm": 257, "Md": 258, "No": 259, "Lr": 266, "Rf": 267, "Db": 268, "Sg": 269, "Bh": 270,
+    "Hs": 277, "Mt": 278, "Ds": 281, "Rg": 282, "Cn": 285, "Nh": 286, "Fl": 289, "Mc": 290, "Lv": 293,
+    "Ts": 294, "Og": 294,
+}
+" The standard atomic weight of every element in g/mol, or the mass number of its longest-lived isotope if it has none. "
+
+CODE_DTYPE = np.int32
+" The NumPy type of arrays of species codes. "
+
+_TOKEN = re.compile(r"([A-Z][a-z]?)|(\d+)|([(\[])|([)\]])|([·.*])")
+_CHARGE = re.compile(r"(?:\^\d*[+-]|(?<=[)\]])\d*[+-]|\s+\d*[+-]|[+-]\d*)$")
+" A charge at the end of a formula, digits directly before the sign are only part of the charge after `^`, a group or a space. "
+
+_AMBIGUOUS_CHARGE = re.compile(r"[A-Za-z]\d+[+-]$")
+" Digits between an element and a trailing sign, which could be a count of atoms or the size of the charge. "
+
+
+def _parse(formula: str) -> dict[str, int]:
+    """ Count the atoms of each element in a formula. """
+
+    formula = formula.strip()
+    if _AMBIGUOUS_CHARGE.search(formula):
+        raise InvalidValueError(f"The charge of {formula!r} is ambiguous, write it after ^ or a space, e.g. Fe^3+ or NH4^+.")
+    text = _CHARGE.sub("", formula)
+    if not text:
+        raise InvalidValueError(f"{formula!r} is not a chemical formula.")
+    # The element counts of each open group, the bottom one is the current part of an adduct like CuSO4·5H2O
+    stack: list[dict[str, int]] = [{}]
+    total: dict[str, int] = {}
+    multiplier = 1
+    position = 0
+    previous: Optional[dict[str, int]] = None
+    at_start = True
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise InvalidValueError(f"Unexpected {text[position]!r} at position {position} of the formula {formula!r}.")
+        element, count, opening, closing, separator = match.groups()
+        position = match.end()
+        if element is not None:
+            if element not in ATOMIC_WEIGHTS:
+                raise InvalidValueError(f"{element} in the formula {formula!r} is not an element.")
+            previous = {element: 1}
+            stack[-1][element] = stack[-1].get(element, 0) + 1
+        elif count is not None:
+            if at_start:
+                multiplier = int(count)
+            elif previous is None:
+                raise InvalidValueError(f"The count {count} in the formula {formula!r} does not follow an element or group.")
+            else:
+                for name, atoms in previous.items():
+                    stack[-1][name] += atoms * (int(count) - 1)
+                previous = None
+        elif opening is not None:
+            stack.append({})
+            previous = None
+        elif closing is not None:
+            if len(stack) == 1:
+                raise InvalidValueError(f"Unbalanced {closing!r} in the formula {formula!r}.")
+            group = stack.pop()
+            for name, atoms in group.items():
+                stack[-1][name] = stack[-1].get(name, 0) + atoms
+            previous = group
+        else:
+            if len(stack) > 1:
+                raise InvalidValueError(f"Unbalanced parentheses in the formula {formula!r}.")
+            part, stack[0], previous = stack[0], {}, None
+            for name, atoms in part.items():
+                total[name] = total.get(name, 0) + atoms * multiplier
+            multiplier = 1
+            at_start = True
+            continue
+        at_start = False
+    if len(stack) > 1:
+        raise InvalidValueError(f"Unbalanced parentheses in the formula {formula!r}.")
+    for name, atoms in stack[0].items():
+        total[name] = total.get(name, 0) + atoms * multiplier
+    if not total:
+        raise InvalidValueError(f"{formula!r} is not a chemical formula.")
+    return total
+
+
+@functools.lru_cache(maxsize=4096)
+def _composition(formula: str) -> tuple[tuple[str, int], ...]:
+    return tuple(_parse(formula).items())
+
+
+def composition(formula: str) -> dict[str, int]:
+    """ The number of atoms of each element in a chemical formula.
+
+    Raises:
+        InvalidValueError: If the formula is malformed or contains an unknown element.
+
+    Examples:
+        >>> composition("CuSO4·5H2O")
+        {'Cu': 1, 'S': 1, 'O': 9, 'H': 10}
+    """
+
+    return dict(_composition(formula))
+
+
+@functools.lru_cache(maxsize=4096)
+def molar_mass(formula: str) -> float:
+    """ The molar mass of a chemical formula in g/mol, cached per formula.
+
+    Raises:
+        InvalidValueError: If the formula is malformed or contains an unknown element.
+
+    Examples:
+        >>> molar_mass("Ca(OH)2")
+        74.092
+    """
+
+    return round(sum(ATOMIC_WEIGHTS[element] * atoms for element, atoms in _composition(formula)), 9)
+
+
+def _grams(unit: Unit | FundamentalQuantityUnit) -> float:
+    """ The scale that converts values in a unit of mass to grams. """
+
+    return Unit.coerce(unit).conversion_factors(gram)[0]
+
+
+def _moles(unit: Unit | FundamentalQuantityUnit) -> float:
+    """ The scale that converts values in a unit of amount of substance to moles. """
+
+    return Unit.coerce(unit).conversion_factors(mole)[0]
+
+
+def to_amount(mass: Measurement, formula: str, unit: Unit | FundamentalQuantityUnit = mole) -> Measurement:
+    """ Convert a mass of a species to its amount of substance.
+
+    Args:
+        mass (Measurement): The mass, in any unit of mass.
+        formula (str): The chemical formula of the species.
+        unit (Unit | FundamentalQuantityUnit): The unit of the amount. Defaults to moles.
+
+    Raises:
+        IncompatibleUnitsError: If the measurement is not a mass, or the unit is not a unit of amount of substance.
+        InvalidValueError: If the formula is malformed or contains an unknown element.
+
+    Examples:
+        >>> to_amount(Measurement(36.03, gram), "H2O")
+        Measurement(2.0, mole (mol))
+    """
+
+    return Measurement(mass.value * _grams(mass.unit) / molar_mass(formula) / _moles(unit), unit)
+
+
+def to_mass(amount: Measurement, formula: str, unit: Unit | FundamentalQuantityUnit = gram) -> Measurement:
+    """ Convert an amount of substance of a species to its mass. See `to_amount`. """
+
+    return Measurement(amount.value * _moles(amount.unit) * molar_mass(formula) / _grams(unit), unit)
+
+
+class SpeciesTable:
+    """ The chemical species of a dataset, each with an integer code and its molar mass.
+
+    Species are given codes in the order they are added. Columns of data can store the code of the species of each
+    row, and masses or amounts of mixed species are converted with one vectorized pass over the column.
+
+    Args:
+        species (Iterable[str]): The formulas of the species to add.
+
+    Attributes:
+        formulas (list[str]): The formula of each species, in order of their codes.
+        molar_masses (np.ndarray): The molar mass of each species in g/mol, in order of their codes.
+    """
+
+    def __init__(self, species: Iterable[str] = ()):
+        self.formulas: list[str] = []
+        self.molar_masses = np.empty(0)
+        self._codes: dict[str, int] = {}
+        for formula in species:
+            self.add(formula)
+
+    def add(self, formula: str, mass: Optional[float] = None) -> int:
+        """ Add a species, or get the code of a species that was already added.
+
+        Args:
+            formula (str): The formula of the species, or its name if its molar mass is given.
+            mass (Optional[float]): The molar mass in g/mol. Defaults to the molar mass of the formula.
+
+        Returns:
+            int: The code of the species.
+
+        Raises:
+            InvalidValueError: If the formula is malformed or contains an unknown element, or the molar mass is not positive.
+        """
+
+        code = self._codes.get(formula)
+        if code is not None:
+            return code
+        mass = molar_mass(formula) if mass is None else float(mass)
+        if not mass > 0:
+            raise InvalidValueError(f"The molar mass of {formula} must be positive, not {mass}.")
+        code = self._codes[formula] = len(self.formulas)
+        self.formulas.append(formula)
+        self.molar_masses = np.append(self.molar_masses, mass)
+        return code
+
+    def code(self, formula: str) -> int:
+        """ The code of a species.
+
+        Raises:
+            InvalidValueError: If the species has not been added.
+        """
+
+        try:
+            return self._codes[formula]
+        except KeyError:
+            raise InvalidValueError(f"{formula} is not a species of the table.") from None
+
+    def encode(self, formulas: Iterable[str], add: bool = False) -> np.ndarray:
+        """ The codes of a sequence of species, e.g. the species of a column of readings.
+
+        Args:
+            formulas (Iterable[str]): The formulas of the species.
+            add (bool): Add species that are not in the table yet, rather than raising an error.
+
+        Raises:
+            InvalidValueError: If a species has not been added, and `add` is false.
+        """
+
+        formulas = list(formulas)
+        lookup = self.add if add else self.code
+        codes = {formula: lookup(formula) for formula in dict.fromkeys(formulas)}
+        return np.fromiter((codes[formula] for formula in formulas), dtype=CODE_DTYPE, count=len(formulas))
+
+    def _molar_masses(self, codes) -> np.ndarray:
+        """ Gather the molar mass of the species of every row. """
+
+        codes = np.asarray(codes)
+        if not codes.size:
+            codes = codes.astype(CODE_DTYPE)
+        if codes.size and (codes.min() < 0 or codes.max() >= len(self.formulas)):
+            raise InvalidValueError(f"The codes must be codes of species of the table, between 0 and {len(self.formulas) - 1}.")
+        return self.molar_masses.take(codes)
+
+    def to_amount(self, masses: MeasurementArray, codes, unit: Unit | FundamentalQuantityUnit = mole) -> MeasurementArray:
+        """ Convert masses of mixed species to amounts of substance, in one vectorized pass.
+
+        Args:
+            masses (MeasurementArray): The masses, in any unit of mass.
+            codes (np.ndarray): The code of the species of each mass.
+            unit (Unit | FundamentalQuantityUnit): The unit of the amounts. Defaults to moles.
+
+        Returns:
+            MeasurementArray: The amount of substance of each mass.
+
+        Raises:
+            IncompatibleUnitsError: If the array is not of masses, or the unit is not a unit of amount of substance.
+            InvalidValueError: If a code is not the code of a species of the table.
+        """
+
+        scale = _grams(masses.unit) / _moles(unit)
+        result = self._molar_masses(codes)
+        np.divide(masses.values, result, out=result)
+        if scale != 1:
+            result *= scale
+        return MeasurementArray(result, unit)
+
+    def to_mass(self, amounts: MeasurementArray, codes, unit: Unit | FundamentalQuantityUnit = gram) -> MeasurementArray:
+        """ Convert amounts of substance of mixed species to masses, in one vectorized pass. See `to_amount`. """
+
+        scale = _moles(amounts.unit) / _grams(unit)
+        result = self._molar_masses(codes)
+        np.multiply(amounts.values, result, out=result)
+        if scale != 1:
+            result *= scale
+        return MeasurementArray(result, unit)
+
+    def __len__(self) -> int:
+        return len(self.formulas)
+
+    def __repr__(self) -> str:
+        return f"SpeciesTable({self.formulas})"
@@ -3,6 +3,17 @@ from .metric_prefix import MetricPrefix
 from .fundamental_unit import FundamentalQuantityUnit
 from .unit import Unit
 from .measurement import Measurement
+from .measurement_array import MeasurementArray
+from .checking import check_units
+from .converter import compile_converter
+from .uncertainty import UncertainMeasurement, UncertainMeasurementArray
+from .interval import IntervalMeasurement, IntervalMeasurementArray
+from .table import MeasurementTable
+from . import aggregation
+from . import codes
+from . import prefixes
 
 
-__all__ = ["FundamentalQuantity", "Unit", "FundamentalQuantityUnit", "MetricPrefix", "Measurement"]
\ No newline at end of file
+__all__ = ["FundamentalQuantity", "Unit", "FundamentalQuantityUnit", "MetricPrefix", "Measurement", "MeasurementArray",
+           "aggregation", "codes", "prefixes", "check_units", "compile_converter", "UncertainMeasurement", "UncertainMeasurementArray",
+           "IntervalMeasurement", "IntervalMeasurementArray", "MeasurementTable"]
\ No newline at end of file
@@ -0,0 +1,206 @@
+""" Aggregation functions over collections of measurements.
+
+Every function accepts either an iterable of `Measurement` objects, which may use different (but compatible)
+units, or a `MeasurementArray`. Measurements are grouped by unit, and each group is converted to the result
+unit with a single scale and offset, rather than converting and allocating a new measurement per element.
+Sums are accumulated with `math.fsum` for lists, and numpy's pairwise summation for arrays.
+
+Examples:
+    >>> from ucalcx import aggregation, Measurement
+    >>> from ucalcx.length import meter, kilometer
+    >>> aggregation.sum([Measurement(1, kilometer), Measurement(500, meter)])
+    Measurement(1.5, kilometer (km))
+"""
+
+import builtins
+import math
+import numpy as np
+from typing import Iterable, Optional
+from .unit import Unit
+from .measurement import Measurement
+from .measurement_array import MeasurementArray, _group_by_unit
+from ..exceptions import InvalidValueError
+
+
+Measurements = Iterable[Measurement] | MeasurementArray
+" A type alias for the collections of measurements accepted by the aggregation functions. "
+
+
+def _converted_groups(measurements: Measurements, unit: Optional[Unit]) -> tuple[Unit, list[tuple[float, float, list[float] | np.ndarray]]]:
+    """ Group measurements by unit, pairing the values of each group with the scale and offset to the result unit. """
+
+    if unit is not None:
+        unit = Unit.coerce(unit)
+    if isinstance(measurements, MeasurementArray):
+        unit = measurements.unit if unit is None else unit
+        return unit, [(*measurements.unit.conversion_factors(unit), measurements.values)]
+
+    groups = _group_by_unit(measurements)
+    if unit is None:
+        if not groups:
+            raise InvalidValueError("Cannot infer the unit of an empty collection of measurements.")
+        unit = next(iter(groups.values()))[0]
+    return unit, [(*group_unit.conversion_factors(unit), values) for group_unit, _, values in groups.values()]
+
+
+def _group_sum(values: list[float] | np.ndarray) -> float:
+    if isinstance(values, np.ndarray):
+        return float(np.sum(values))
+    return math.fsum(values)
+
+
+def _count(groups: list[tuple[float, float, list[float] | np.ndarray]]) -> int:
+    return builtins.sum(len(values) for _, _, values in groups)
+
+
+def sum(measurements: Measurements, unit: Optional[Unit] = None) -> Measurement:
+    """ Sum a collection of measurements.
+
+    Args:
+        measurements (Measurements): The measurements to sum.
+        unit (Optional[Unit]): The unit of the result. Defaults to the unit of the first measurement.
+
+    Returns:
+        Measurement: The sum of the measurements, an empty collection sums to zero.
+
+    Raises:
+        InvalidValueError: If the collection is empty and no unit is given.
+        IncompatibleUnitsError: If the measurements cannot be converted to a common unit.
+    """
+
+    unit, groups = _converted_groups(measurements, unit)
+    total = math.fsum(scale * _group_sum(values) + offset * len(values) for scale, offset, values in groups)
+    return Measurement(total, unit)
+
+
+def mean(measurements: Measurements, unit: Optional[Unit] = None) -> Measurement:
+    """ Get the arithmetic mean of a collection of measurements.
+
+    Args:
+        measurements (Measurements): The measurements to average.
+        unit (Optional[Unit]): The unit of the result. Defaults to the unit of the first measurement.
+
+    Returns:
+        Measurement: The mean of the measurements.
+
+    Raises:
+        InvalidValueError: If the collection is empty.
+        IncompatibleUnitsError: If the measurements cannot be converted to a common unit.
+    """
+
+    unit, groups = _converted_groups(measurements, unit)
+    count = _count(groups)
+    if count == 0:
+        raise InvalidValueError("Cannot take the mean of an empty collection of measurements.")
+    total = math.fsum(scale * _group_sum(values) + offset * len(values) for scale, offset, values in groups)
+    return Measurement(total / count, unit)
+
+
+def std(measurements: Measurements, unit: Optional[Unit] = None, ddof: int = 0) -> Measurement:
+    """ Get the standard deviation of a collection of measurements.
+
+    Args:
+        measurements (Measurements): The measurements.
+        unit (Optional[Unit]): The unit of the result. Defaults to the unit of the first measurement.
+        ddof (int): The delta degrees of freedom, the divisor used is `count - ddof`. Defaults to 0, the
+            population standard deviation.
+
+    Returns:
+        Measurement: The standard deviation of the measurements.
+
+    Raises:
+        InvalidValueError: If the collection has no more than `ddof` measurements.
+        IncompatibleUnitsError: If the measurements cannot be converted to a common unit.
+    """
+
+    unit, groups = _converted_groups(measurements, unit)
+    count = _count(groups)
+    if count <= ddof:
+        raise InvalidValueError(f"Cannot take the standard deviation of {count} measurements with ddof={ddof}.")
+    average = math.fsum(scale * _group_sum(values) + offset * len(values) for scale, offset, values in groups) / count
+
+    squares = []
+    for scale, offset, values in groups:
+        if isinstance(values, np.ndarray):
+            squares.append(float(np.sum(np.square(values * scale + (offset - average)))))
+        else:
+            squares.append(math.fsum((value * scale + (offset - average)) ** 2 for value in values))
+    return Measurement(math.sqrt(math.fsum(squares) / (count - ddof)), unit)
+
+
+def _extreme(measurements: Measurements, unit: Optional[Unit], largest: bool) -> Measurement:
+    unit, groups = _converted_groups(measurements, unit)
+    extremes = []
+    for scale, offset, values in groups:
+        if len(values) == 0:
+            continue
+        # A negative scale reverses the order of the values within the group
+        if largest == (scale >= 0):
+            value = values.max() if isinstance(values, np.ndarray) else builtins.max(values)
+        else:
+            value = values.min() if isinstance(values, np.ndarray) else builtins.min(values)
+        extremes.append(float(value) * scale + offset)
+    if not extremes:
+        raise InvalidValueError("Cannot take the minimum or maximum of an empty collection of measurements.")
+    return Measurement(builtins.max(extremes) if largest else builtins.min(extremes), unit)
+
+
+def min(measurements: Measurements, unit: Optional[Unit] = None) -> Measurement:
+    """ Get the smallest measurement in a collection, converted to the result unit.
+
+    Args:
+        measurements (Measurements): The measurements.
+        unit (Optional[Unit]): The unit of the result. Defaults to the unit of the first measurement.
+
+    Returns:
+        Measurement: The smallest measurement.
+
+    Raises:
+        InvalidValueError: If the collection is empty.
+        IncompatibleUnitsError: If the measurements cannot be converted to a common unit.
+    """
+
+    return _extreme(measurements, unit, largest=False)
+
+
+def max(measurements: Measurements, unit: Optional[Unit] = None) -> Measurement:
+    """ Get the largest measurement in a collection, converted to the result unit.
+
+    Args:
+        measurements (Measurements): The measurements.
+        unit (Optional[Unit]): The unit of the result. Defaults to the unit of the first measurement.
+
+    Returns:
+        Measurement: The largest measurement.
+
+    Raises:
+        InvalidValueError: If the collection is empty.
+        IncompatibleUnitsError: If the measurements cannot be converted to a common unit.
+    """
+
+    return _extreme(measurements, unit, largest=True)
+
+
+def histogram(measurements: Measurements, bins: int = 10, bounds: Optional[tuple[float, float]] = None,
+              unit: Optional[Unit] = None) -> tuple[np.ndarray, MeasurementArray]:
+    """ Count the measurements that fall in each of a number of equal width bins.
+
+    Args:
+        measurements (Measurements): The measurements.
+        bins (int): The number of bins. Defaults to 10.
+        bounds (Optional[tuple[float, float]]): The lower and upper edge of the bins, in the result unit.
+            Defaults to the smallest and largest measurement.
+        unit (Optional[Unit]): The unit of the bin edges. Defaults to the unit of the first measurement.
+
+    Returns:
+        tuple[np.ndarray, MeasurementArray]: The count in each bin, and the `bins + 1` bin edges.
+
+    Raises:
+        InvalidValueError: If the collection is empty and no unit is given.
+        IncompatibleUnitsError: If the measurements cannot be converted to a common unit.
+    """
+
+    unit, groups = _converted_groups(measurements, unit)
+    values = np.concatenate([np.asarray(values, dtype=np.float64) * scale + offset for scale, offset, values in groups] or [np.empty(0)])
+    counts, edges = np.histogram(values, bins=bins, range=bounds)
+    return counts, MeasurementArray(edges, unit)
@@ -0,0 +1,119 @@
+import functools
+import inspect
+from typing import Callable, Optional
+from .unit import Unit
+from .fundamental_unit import FundamentalQuantityUnit
+from .measurement import Measurement
+from .measurement_array import MeasurementArray
+from ..exceptions import IncompatibleUnitsError
+
+
+def check_units(*units: Optional[Unit | FundamentalQuantityUnit], returns: Optional[Unit | FundamentalQuantityUnit] = None) -> Callable:
+    """ Check the units of a function's arguments once, and call the function with plain floats.
+
+    The function is written in terms of plain numbers in the declared units. When it is called with measurements,
+    the units of the arguments are checked against the declared units the first time each combination of units
+    is seen, and the scale and offset that convert each argument are cached. Every later call with the same units
+    only applies the cached factors, and arguments that are already plain numbers are passed straight through.
+
+    The result is wrapped in the `returns` unit when any argument was a measurement, a `MeasurementArray`
+    argument produces a `MeasurementArray` result.
+
+    The units can be passed to the decorator, or taken from the function's annotations when the decorator is
+    used without arguments, annotations that are not units are ignored. A unit of None leaves that argument
+    unchecked and unconverted.
+
+    Args:
+        *units (Optional[Unit]): The units of the function's leading positional parameters.
+        returns (Optional[Unit]): The unit of the value returned by the function.
+
+    Returns:
+        Callable: A decorator that wraps the function.
+
+    Raises:
+        IncompatibleUnitsError: When the wrapped function is called with an argument of the wrong dimensionality.
+
+    Examples:
+        >>> from ucalcx import check_units, Measurement
+        >>> from ucalcx.length import meter, kilometer
+        >>> from ucalcx.time_quantity import second, hour
+        >>> @check_units(meter, second, returns=meter / second)
+        ... def speed(distance, time):
+        ...     return distance / time
+        >>> speed(Measurement(36, kilometer), Measurement(1, hour))
+        Measurement(10.0, meter/second (m/s))
+        >>> speed(100.0, 10.0)
+        10.0
+
+        >>> @check_units
+        ... def speed(distance: meter, time: second) -> meter / second:
+        ...     return distance / time
+    """
+
+    if len(units) == 1 and callable(units[0]) and returns is None:
+        function = units[0]
+        annotations = inspect.get_annotations(function)
+        parameters = list(inspect.signature(function).parameters)
+        declared = [annotations.get(parameter) if isinstance(annotations.get(parameter), (Unit, FundamentalQuantityUnit)) else None 
+                    for parameter in parameters]
+        while declared and declared[-1] is None:
+            declared.pop()
+        returns = annotations.get("return")
+        return _checked(function, declared, returns if isinstance(returns, (Unit, FundamentalQuantityUnit)) else None)
+    return lambda function: _checked(function, list(units), returns)
+
+
+def _checked(function: Callable, units: list, returns: Optional[Unit]) -> Callable:
+    units = [None if unit is None else Unit.coerce(unit) for unit in units]
+    returns = None if returns is None else Unit.coerce(returns)
+    signature = inspect.signature(function)
+    parameters = list(signature.parameters)[:len(units)]
+    plans: dict[tuple, tuple[Optional[tuple[float, float]], ...]] = {}
+
+    def plan_for(arguments: tuple) -> tuple[Optional[tuple[float, float]], ...]:
+        """ Check the units of the arguments and find the scale and offset that converts each of them. """
+
+        plan = []
+        for index, argument in enumerate(arguments):
+            unit = units[index] if index < len(units) else None
+            if unit is None or not isinstance(argument, (Measurement, MeasurementArray)):
+                plan.append(None)
+                continue
+            if argument.unit.dimensionality != unit.dimensionality:
+                raise IncompatibleUnitsError(f"Argument {parameters[index]} of {function.__name__} must be in units of {unit}, got {argument.unit}.")
+            plan.append(argument.unit.conversion_factors(unit))
+        return tuple(plan)
+
+    @functools.wraps(function)
+    def wrapper(*arguments, **keywords):
+        if keywords and any(parameter in keywords for parameter in parameters):
+            # Move checked parameters passed by keyword into their positions
+            bound = signature.bind(*arguments, **keywords)
+            arguments, keywords = bound.args, bound.kwargs
+
+        key = tuple(argument.unit.key if isinstance(argument, (Measurement, MeasurementArray)) else None 
+                    for argument in arguments[:len(units)])
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = plan_for(arguments[:len(units)])
+
+        values = list(arguments)
+        is_measurement = is_array = False
+        for index, factors in enumerate(plan):
+            if factors is None:
+                continue
+            argument = values[index]
+            if isinstance(argument, MeasurementArray):
+                is_array = True
+                values[index] = argument.values * factors[0] + factors[1]
+            else:
+                is_measurement = True
+                values[index] = argument.value * factors[0] + factors[1]
+
+        result = function(*values, **keywords)
+        if returns is None or not (is_measurement or is_array):
+            return result
+        return MeasurementArray(result, returns) if is_array else Measurement(result, returns)
+
+    wrapper.plans = plans
+    return wrapper
@@ -0,0 +1,269 @@
+""" Integer codes for fundamental units, and dense conversion matrices between all units of a quantity.
+
+Every unit in the unit registry is assigned an integer code, its position in the registry. The registry only grows,
+so a unit's code never changes while a program runs. Columnar data can store a small integer code per row instead of
+a Python object, and convert a column of readings in mixed units with a single NumPy gather and multiply, using the
+matrix of scales and offsets between every pair of units of a quantity.
+
+Codes are only meaningful within the process that assigned them. They depend on the order in which units are
+registered, which changes when units are added to `ucalcx`, when modules are imported in another order, or when a
+program defines its own units, so they must not be persisted or sent to another process. Store the quantity and
+name of each unit instead, as `ucalcx.interop.arrow` does, and encode them again after loading.
+
+Examples:
+    >>> import numpy as np
+    >>> from ucalcx.common import codes
+    >>> from ucalcx.length import meter, kilometer, imperial
+    >>> column = codes.encode([kilometer, meter, imperial.foot])
+    >>> codes.convert(np.array([1.5, 20.0, 10.0]), column, meter)
+    array([1500.   ,   20.   ,    3.048])
+"""
+
+import threading
+import numpy as np
+from typing import Iterable, Optional
+from .quantity import FundamentalQuantity
+from .fundamental_unit import FundamentalQuantityUnit
+from .unit import Unit
+from ..exceptions import IncompatibleUnitsError, InvalidUnitError
+
+
+CODE_DTYPE = np.int32
+" The NumPy type of arrays of unit codes. "
+
+
+class QuantityConversions:
+    """ The conversion factors between every pair of units of a fundamental quantity.
+
+    Units are indexed by their position in `units`. Converting a value from `units[i]` to `units[j]` is
+    `value * scales[i, j] + offsets[i, j]`, offsets are only non-zero for temperatures.
+
+    Attributes:
+        quantity (FundamentalQuantity): The quantity of the units.
+        units (list[FundamentalQuantityUnit]): The registered units of the quantity, in order of their codes.
+        codes (np.ndarray): The code of each unit.
+        scales (np.ndarray): The scale of the conversion from each unit (rows) to each unit (columns).
+        offsets (np.ndarray): The offset of the conversion from each unit (rows) to each unit (columns).
+        positions (np.ndarray): The position in `units` of the unit with each code, or -1 for units of other quantities.
+    """
+
+    def __init__(self, quantity: FundamentalQuantity, units: list[FundamentalQuantityUnit], code_count: int):
+        self.quantity = quantity
+        self.units = units
+        self.codes = np.array([_codes[unit] for unit in units], dtype=CODE_DTYPE)
+        self.positions = np.full(code_count, -1, dtype=CODE_DTYPE)
+        self.positions[self.codes] = np.arange(len(units), dtype=CODE_DTYPE)
+
+        wrapped = [Unit.from_fundamental_units((unit, 1,)) for unit in units]
+        self.scales = np.empty((len(units), len(units)))
+        self.offsets = np.empty((len(units), len(units)))
+        for row, source in enumerate(wrapped):
+            for column, target in enumerate(wrapped):
+                self.scales[row, column], self.offsets[row, column] = source.conversion_factors(target)
+        self._columns: dict[FundamentalQuantityUnit, tuple[np.ndarray, Optional[np.ndarray]]] = {}
+
+    def column(self, target: FundamentalQuantityUnit) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """ The scales and offsets of the conversions to a unit of this quantity, indexed by the code of the source unit.
+
+        Scales are NaN for the codes of units of other quantities. The offsets are None if all of them are zero.
+
+        Raises:
+            IncompatibleUnitsError: If the target unit belongs to another quantity.
+        """
+
+        column = self._columns.get(target)
+        if column is None:
+            if target.quantity != self.quantity:
+                raise IncompatibleUnitsError(f"Cannot convert {self.quantity.quantity_name.lower()} units to "\
+                                             f"{target.name}, as they represent different quantities.")
+            position = self.positions[_codes[target]]
+            scales = np.full(len(self.positions), np.nan)
+            scales[self.codes] = self.scales[:, position]
+            offsets = None
+            if self.offsets[:, position].any():
+                offsets = np.zeros(len(self.positions))
+                offsets[self.codes] = self.offsets[:, position]
+            column = self._columns[target] = (scales, offsets)
+        return column
+
+    def convert(self, values: np.ndarray, codes: np.ndarray, target: FundamentalQuantityUnit) -> np.ndarray:
+        """ Convert values in the units with the given codes to a single unit of this quantity.
+
+        Args:
+            values (np.ndarray): The values to convert.
+            codes (np.ndarray): The code of the unit of each value.
+            target (FundamentalQuantityUnit): The unit to convert to.
+
+        Returns:
+            np.ndarray: The converted values.
+
+        Raises:
+            IncompatibleUnitsError: If a code or the target unit belongs to a unit of another quantity.
+            InvalidUnitError: If a code is not the code of a registered unit.
+        """
+
+        scales, offsets = self.column(target)
+        codes = np.asarray(codes)
+        if not codes.size:
+            codes = codes.astype(CODE_DTYPE)
+        try:
+            if codes.size and codes.min() < 0:
+                raise IndexError
+            factors = scales.take(codes)
+        except IndexError:
+            raise InvalidUnitError(f"The codes must be codes of registered units, between 0 and {len(scales) - 1}.") from None
+        if np.isnan(factors).any():
+            unit = _units[int(codes[np.isnan(factors)][0])]
+            raise IncompatibleUnitsError(f"Cannot convert {unit.name} to {target.name}, as they represent different "\
+                                         f"quantities, {unit.quantity} and {target.quantity} respectively.")
+        result = np.multiply(values, factors, out=factors)
+        if offsets is not None:
+            result += offsets.take(codes)
+        return result
+
+
+_codes: dict[FundamentalQuantityUnit, int] = {}
+" The code of every registered unit. "
+
+_units: list[FundamentalQuantityUnit] = []
+" The registered units, in order of their codes. "
+
+_conversions: dict[FundamentalQuantity, QuantityConversions] = {}
+" The conversion matrices of each quantity, built on first use and rebuilt when new units are registered. "
+
+_lock = threading.Lock()
+" Held while assigning codes and building conversion matrices, so concurrent threads never give a unit two codes. "
+
+
+def _update():
+    """ Assign codes to units registered since the last update, and drop the matrices built before them. """
+
+    registry = FundamentalQuantityUnit.registry
+    if len(_units) == len(registry):
+        return
+    with _lock:
+        for unit in list(registry.values())[len(_units):]:
+            # The code is assigned before the unit is listed, so a unit in `_units` always has a code
+            _codes[unit] = len(_units)
+            _units.append(unit)
+        _conversions.clear()
+
+
+def _as_fundamental_unit(unit: FundamentalQuantityUnit | Unit) -> FundamentalQuantityUnit:
+    if isinstance(unit, Unit):
+        components = unit.components
+        if len(components) == 1 and components[0]["power"] == 1:
+            return components[0]["unit"]
+        raise InvalidUnitError(f"Only fundamental units have codes, {unit} is a derived unit.")
+    return unit
+
+
+def code(unit: FundamentalQuantityUnit | Unit) -> int:
+    """ Get the code of a registered unit.
+
+    Codes are only valid in the current process, and must not be persisted, see the module documentation.
+
+    Args:
+        unit (FundamentalQuantityUnit | Unit): A fundamental unit, or a unit made of a single fundamental unit.
+
+    Returns:
+        int: The code of the unit.
+
+    Raises:
+        InvalidUnitError: If the unit is not registered, or is a derived unit.
+
+    Examples:
+        >>> codes.unit(codes.code(kilometer)) is kilometer
+        True
+    """
+
+    unit = _as_fundamental_unit(unit)
+    _update()
+    try:
+        return _codes[unit]
+    except (KeyError, TypeError):
+        raise InvalidUnitError(f"{unit} is not a registered unit, and has no code.") from None
+
+
+def unit(code: int) -> FundamentalQuantityUnit:
+    """ Get the unit with a code.
+
+    Raises:
+        InvalidUnitError: If no unit has the code.
+    """
+
+    _update()
+    if not 0 <= code < len(_units):
+        raise InvalidUnitError(f"{code} is not the code of a registered unit.")
+    return _units[code]
+
+
+def encode(units: Iterable[FundamentalQuantityUnit | Unit]) -> np.ndarray:
+    """ Get the codes of a sequence of units, e.g. the units of a column of readings.
+
+    Like the codes of `code`, the result is only valid in the current process.
+
+    Args:
+        units (Iterable[FundamentalQuantityUnit | Unit]): The units.
+
+    Returns:
+        np.ndarray: The code of each unit.
+
+    Raises:
+        InvalidUnitError: If a unit is not registered, or is a derived unit.
+    """
+
+    seen = {}
+    result = []
+    for item in units:
+        item_code = seen.get(item)
+        if item_code is None:
+            item_code = seen[item] = code(item)
+        result.append(item_code)
+    return np.array(result, dtype=CODE_DTYPE)
+
+
+def conversions(quantity: FundamentalQuantity) -> QuantityConversions:
+    """ Get the conversion matrices between every registered unit of a quantity.
+
+    Examples:
+        >>> from ucalcx import FundamentalQuantity
+        >>> table = codes.conversions(FundamentalQuantity.Length)
+        >>> table.scales.shape
+        (31, 31)
+    """
+
+    _update()
+    table = _conversions.get(quantity)
+    if table is None:
+        with _lock:
+            table = _conversions.get(quantity)
+            if table is None:
+                units = [unit for unit in _units if unit.quantity == quantity]
+                table = _conversions[quantity] = QuantityConversions(quantity, units, len(_units))
+    return table
+
+
+def convert(values: Iterable[float], codes: Iterable[int], target: FundamentalQuantityUnit | Unit) -> np.ndarray:
+    """ Convert readings in mixed units of one quantity, given by their codes, to a single unit.
+
+    The conversion factors to the target unit are laid out by code, so the conversion is a gather of the factor
+    of every reading, a multiplication and, for temperatures, a gather and an addition of the offsets, over the
+    whole column at once.
+
+    Args:
+        values (Iterable[float]): The values of the readings.
+        codes (Iterable[int]): The code of the unit of each reading.
+        target (FundamentalQuantityUnit | Unit): The unit to convert to.
+
+    Returns:
+        np.ndarray: The converted values.
+
+    Raises:
+        IncompatibleUnitsError: If a reading is in a unit of another quantity than the target unit.
+        InvalidUnitError: If the target unit is not registered, or is a derived unit.
+    """
+
+    target = _as_fundamental_unit(target)
+    code(target)
+    return conversions(target.quantity).convert(values, codes, target)
@@ -0,0 +1,77 @@
+from typing import Callable
+from .unit import Unit
+from .fundamental_unit import FundamentalQuantityUnit
+
+
+Converter = Callable[[float], float]
+" A compiled function that converts a value from one unit to another. "
+
+
+_converters: dict[tuple, Converter] = {}
+" The compiled converter for every pair of units seen so far, keyed by the components of both units. "
+
+
+def _generate(source: Unit, target: Unit) -> Converter:
+    """ Generate the source of a converter with the scale and offset folded in as constants, and compile it. """
+
+    scale, offset = source.conversion_factors(target)
+    if scale == 1 and offset == 0:
+        expression = "value"
+    elif offset == 0:
+        expression = f"value * {scale!r}"
+    elif scale == 1:
+        expression = f"value + {offset!r}"
+    else:
+        expression = f"value * {scale!r} + {offset!r}"
+
+    code = f"def convert(value):\n    return {expression}\n"
+    namespace = {}
+    exec(compile(code, f"<ucalcx converter {source.symbol} -> {target.symbol}>", "exec"), namespace)
+    convert = namespace["convert"]
+    convert.__doc__ = f"Convert a value from {source.symbol} to {target.symbol}, computed as {expression}."
+    convert.__qualname__ = f"compile_converter.<{source.symbol} -> {target.symbol}>"
+    convert.scale = scale
+    convert.offset = offset
+    convert.source = code
+    return convert
+
+
+def compile_converter(source: Unit | FundamentalQuantityUnit, target: Unit | FundamentalQuantityUnit) -> Converter:
+    """ Compile a specialized function that converts values from one unit to another.
+
+    The conversion factors are resolved once, and folded into the source of a one line function as constants,
+    e.g. `value * 0.3048`, so calling it does no type checks, dictionary lookups or method dispatch. The function
+    accepts anything that supports multiplication and addition with floats, including NumPy arrays. Converting
+    between equal units returns the value unchanged, without a multiply or a copy.
+
+    Converters are cached per pair of units, so compiling the same conversion again returns the same function.
+
+    Args:
+        source (Unit | FundamentalQuantityUnit): The unit to convert from.
+        target (Unit | FundamentalQuantityUnit): The unit to convert to.
+
+    Returns:
+        Converter: The converter. Its `scale` and `offset` attributes hold the folded constants, and its `source`
+            attribute holds the generated code.
+
+    Raises:
+        IncompatibleUnitsError: If the units are incompatible.
+        InvalidUnitError: If either unit is not a valid unit.
+
+    Examples:
+        >>> from ucalcx import compile_converter
+        >>> from ucalcx.length import meter, kilometer
+        >>> kilometers_to_meters = compile_converter(kilometer, meter)
+        >>> kilometers_to_meters(1.5)
+        1500.0
+        >>> print(kilometers_to_meters.source)
+        def convert(value):
+            return value * 1000.0
+    """
+
+    source, target = Unit.coerce(source), Unit.coerce(target)
+    key = (source.key, target.key)
+    converter = _converters.get(key)
+    if converter is None:
+        converter = _converters.setdefault(key, _generate(source, target))
+    return converter
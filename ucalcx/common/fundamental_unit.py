@@ -1,11 +1,103 @@
+import inspect
+import threading
 from .quantity import FundamentalQuantity
+from .metric_prefix import MetricPrefix
 from typing import Self
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 from typing import Union, Optional
-from ..exceptions import IncompatibleUnitsError, InvalidValueError
+from ..exceptions import IncompatibleUnitsError, InvalidValueError, InvalidUnitError
 
 
-class FundamentalQuantityUnit(ABC):
+class FundamentalQuantityUnitMeta(ABCMeta):
+    """ Metaclass for fundamental units that shares unit instances and records them in the unit registry.
+
+    Units are flyweights: constructing a unit class again with the same arguments, e.g. `Meter(MetricPrefix.Kilo)`,
+    returns the instance constructed the first time instead of a new object. Arguments are compared after filling
+    in defaults, so `Meter()` and `Meter(MetricPrefix.Base)` are the same instance. Units constructed from
+    unhashable arguments are not shared.
+
+    The first unit constructed with a given quantity and name becomes the canonical instance for that
+    key, this is the instance that is restored when a unit is unpickled or copied.
+
+    Constructing the first unit of a class that takes a metric prefix constructs the units of every other prefix
+    as well, so the registry, and the units that `FundamentalQuantityUnit.lookup` and `Unit.from_string` can
+    resolve, do not depend on which prefixed units a program happened to construct before.
+
+    Looking up a shared unit takes no lock. Units that are not shared yet are constructed while holding a lock, so
+    threads that construct the same unit at the same time still get a single instance.
+    """
+
+    _instances: dict[tuple, "FundamentalQuantityUnit"] = {}
+    " Every shared unit, keyed by its class and constructor arguments, both as given and with defaults filled in. "
+
+    _lock = threading.RLock()
+    " Held while constructing and sharing a new unit. Reentrant, as the constructor of a unit may construct others. "
+
+    _prefixed_classes: set[type] = set()
+    " The unit classes whose units have been constructed with every metric prefix. "
+
+    def __call__(cls, *args, **kwargs):
+        key = (cls, args, tuple(kwargs.items()))
+        instances = FundamentalQuantityUnitMeta._instances
+        try:
+            return instances[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return cls._construct(*args, **kwargs)
+
+        arguments = inspect.signature(cls.__init__).bind(None, *args, **kwargs)
+        arguments.apply_defaults()
+        canonical_key = (cls, tuple(arguments.arguments.items())[1:])
+        try:
+            unit = instances.get(canonical_key)
+        except TypeError:
+            return cls._construct(*args, **kwargs)
+        if unit is None:
+            with FundamentalQuantityUnitMeta._lock:
+                # Another thread may have constructed the unit while this one waited for the lock
+                unit = instances.get(canonical_key)
+                if unit is None:
+                    unit = instances[canonical_key] = cls._construct(*args, **kwargs)
+        instances.setdefault(key, unit)
+        return unit
+
+    def _construct(cls, *args, **kwargs):
+        """ Construct a new unit and record it in the unit registry. """
+
+        unit = super().__call__(*args, **kwargs)
+        FundamentalQuantityUnit.registry.setdefault(unit.registry_key, unit)
+        if isinstance(getattr(unit, "metric_prefix", None), MetricPrefix) and cls not in FundamentalQuantityUnitMeta._prefixed_classes:
+            FundamentalQuantityUnitMeta._prefixed_classes.add(cls)
+            with FundamentalQuantityUnitMeta._lock:
+                for prefix in MetricPrefix:
+                    cls(prefix)
+        return unit
+
+
+def _restore_unit(quantity_name: str, name: str) -> "FundamentalQuantityUnit":
+    """ Look up a registered unit by its registry key, used when unpickling units.
+
+    A prefixed unit that has not been constructed in this process yet, like micrometer, is constructed from a
+    registered unit of the same class with another prefix.
+    """
+
+    registry = FundamentalQuantityUnit.registry
+    unit = registry.get((quantity_name, name))
+    if unit is not None:
+        return unit
+    for other in list(registry.values()):
+        prefix = getattr(other, "metric_prefix", None)
+        if other.quantity.name != quantity_name or not isinstance(prefix, MetricPrefix):
+            continue
+        base_name = other.name[len(prefix.name):]
+        for candidate in MetricPrefix:
+            if candidate.name + base_name == name:
+                return type(other)(candidate)
+    raise InvalidUnitError(f"No unit named {name} is registered for the {quantity_name} quantity.")
+
+
+class FundamentalQuantityUnit(ABC, metaclass=FundamentalQuantityUnitMeta):
     """A base class for units of fundamental quantities. This class should not be instantiated directly.
     Instead, use one of the subclasses that inherit from this class.
 
@@ -13,8 +105,18 @@ class FundamentalQuantityUnit(ABC):
         name (str): The name of the unit (e.g. meter, second, etc.)
         symbol (str): The symbol of the unit (e.g. m for meters, s for seconds, etc.)
         quantity (FundamentalQuantity): The quantity that the unit represents (e.g. length, time, etc.)
+
+    Attributes:
+        registry (dict[tuple[str, str], FundamentalQuantityUnit]): The canonical unit for every registered
+            (quantity, name) pair. Units are added to the registry when they are constructed.
     """
 
+    __slots__ = ("_name", "_symbol", "quantity")
+
+    registry: dict[tuple[str, str], "FundamentalQuantityUnit"] = {}
+    _lookup_index: dict[str, Optional["FundamentalQuantityUnit"]] = {}
+    _lookup_index_size: int = 0
+
     def __init__(self, name: str, symbol: str, quantity: FundamentalQuantity):
         """ Initializes a new instance of the FundamentalQuantityUnit class. """
 
@@ -56,7 +158,97 @@ class FundamentalQuantityUnit(ABC):
             raise IncompatibleUnitsError(f"Cannot convert {self.name} to {other.name}, as they represent different "\
                                          f"quantities, {self.quantity} and {other.quantity} respectively.")
         return self._conversion_method(other=other, value=value)
-        
+
+    def conversion_factors(self, other: Self) -> tuple[float, float]:
+        """ Get the scale and offset that convert values from this unit to another unit, as `value * scale + offset`.
+
+        Units that share their zero point with the other units of their quantity convert with a scale alone. Units
+        with a zero point of their own, like degrees Fahrenheit, should override this with their exact affine
+        definition, as the factors measured from conversions of single values lose precision to rounding.
+
+        Args:
+            other (FundamentalQuantityUnit): The unit to convert to.
+
+        Returns:
+            tuple[float, float]: The scale and offset of the conversion.
+
+        Raises:
+            IncompatibleUnitsError: If the units represent different quantities.
+        """
+
+        offset = float(self.convert_to(other, 0.0))
+        if offset == 0:
+            return float(self.convert_to(other, 1.0)), 0.0
+        return self.convert_to(other, 1.0) - offset, offset
+
+    @property
+    def registry_key(self) -> tuple[str, str]:
+        """ The key that identifies this unit in the unit registry, the quantity name and the unit name. """
+
+        return (self.quantity.name, self.name)
+
+    @classmethod
+    def lookup(cls, text: str) -> "FundamentalQuantityUnit":
+        """ Find a registered unit by its symbol or name.
+
+        Symbols are matched before names, and spaces in names may be written as underscores (e.g. nautical_mile).
+
+        Args:
+            text (str): The symbol or name of the unit.
+
+        Returns:
+            FundamentalQuantityUnit: The registered unit.
+
+        Raises:
+            InvalidUnitError: If no registered unit has the symbol or name, or if it is shared by several units.
+
+        Examples:
+            >>> FundamentalQuantityUnit.lookup("km")
+            FQUnit(kilometer, km, FundamentalQuantity.Length)
+        """
+
+        registry = FundamentalQuantityUnit.registry
+        if FundamentalQuantityUnit._lookup_index_size != len(registry):
+            # Rebuild the index when new units have been registered, None marks ambiguous entries
+            # The index is built from a snapshot of the registry and replaced whole, so concurrent lookups never see
+            # a partial index, and units registered by other threads meanwhile are picked up by the next lookup
+            units = list(registry.values())
+            names, symbols = {}, {}
+            for unit in units:
+                for index, key in ((names, unit.name), (names, unit.name.replace(" ", "_")), (symbols, unit.symbol)):
+                    index[key] = None if index.get(key, unit) is not unit else unit
+            # A symbol wins over a name, unless the symbol is ambiguous and the name is not
+            index = dict(names)
+            for key, unit in symbols.items():
+                if unit is not None or index.get(key) is None:
+                    index[key] = unit
+            FundamentalQuantityUnit._lookup_index = index
+            FundamentalQuantityUnit._lookup_index_size = len(units)
+
+        index = FundamentalQuantityUnit._lookup_index
+        if text not in index:
+            raise InvalidUnitError(f"{text} is not the symbol or name of a known unit.")
+        unit = index[text]
+        if unit is None:
+            raise InvalidUnitError(f"{text} is ambiguous, it is the symbol or name of several units. Use the unit's full name instead.")
+        return unit
+
+    def __reduce_ex__(self, protocol):
+        """ Pickle registered units as a reference into the unit registry.
+
+        Unpickling (or copying) a registered unit returns the canonical instance, so identity checks like
+        `unit is meter` keep working across processes. Units with a metric prefix are pickled as a call to their
+        class with the prefix, which returns the shared instance even in a process that has not constructed that
+        prefix yet. Units that are not the canonical instance for their key are pickled with their full state.
+        """
+
+        if FundamentalQuantityUnit.registry.get(self.registry_key) is self:
+            prefix = getattr(self, "metric_prefix", None)
+            if isinstance(prefix, MetricPrefix):
+                return (type(self), (prefix,))
+            return (_restore_unit, self.registry_key)
+        return super().__reduce_ex__(protocol)
+
     @property
     def name(self) -> str:
         """ Get the name of the unit. """
@@ -164,8 +356,8 @@ class FundamentalQuantityUnit(ABC):
                 return Unit.from_fundamental_units((self, 2,))
             return Unit.from_fundamental_units((self, 1,), (other, 1,))
             
-        # Call __mul__ on the Unit class
-        return other * self
+        # Call __mul__ on the Unit class, keeping this unit on the left-hand side
+        return Unit.from_fundamental_units((self, 1,)) * other
 
     def __truediv__(self, other: Union[Self | "Unit"]) -> Optional["Unit"]:
         """ Divide this unit by another unit. 
@@ -189,7 +381,7 @@ class FundamentalQuantityUnit(ABC):
                 return None
             return Unit.from_fundamental_units((self, 1,), (other, -1,))
         else:
-            return other.__rtruediv__(self)
+            return Unit.from_fundamental_units((self, 1,)) / other
 
     def __div__(self, other: Self) -> "Unit":
         """ Divide this unit by another unit. 
@@ -0,0 +1,390 @@
+""" Interval-valued measurements, which carry guaranteed lower and upper bounds instead of a point value.
+
+Every conversion and arithmetic operation produces an interval that encloses every possible result for values
+within the bounds of its operands. After each floating point step the lower bound is rounded down and the upper
+bound up to the neighbouring float, so rounding errors can only widen an interval, never move a true value outside
+of it. The bounds enclose the result computed with the library's conversion factors, which are themselves rounded
+floats, not the exact value of a conversion whose factor has no exact float representation.
+
+- Conversions are affine (`x * scale + offset`) and monotone, including temperature conversions with offsets, so
+  the bounds are converted directly, and swapped for a negative scale.
+- Addition and subtraction combine the matching bounds, `[a, b] - [c, d] = [a - d, b - c]`.
+- Multiplication and division take the smallest and largest of the four products or quotients of the bounds, so
+  the signs of the bounds are accounted for. Dividing by an interval that contains zero gives the whole real line.
+- Even powers of an interval that contains zero start at zero.
+- A measurement on either side of an operation is treated as an interval of a single point, and an operand with
+  many values gives an `IntervalMeasurementArray`.
+
+`IntervalMeasurementArray` stores the bounds of many readings in two float arrays, and checks all of them against
+unit-tagged limits in a single vectorized pass.
+
+Examples:
+    >>> from ucalcx import IntervalMeasurement, IntervalMeasurementArray, Measurement
+    >>> from ucalcx.temperature import celsius, fahrenheit
+    >>> reading = IntervalMeasurement(98.2, 98.8, fahrenheit)
+    >>> reading.convert_to(celsius)
+    IntervalMeasurement([36.777777777777764, 37.11111111111113], celsius (°C))
+    >>> readings = IntervalMeasurementArray.from_readings([148.7, 151.0, 139.0], fahrenheit, tolerance=0.5)
+    >>> readings.certainly_below(Measurement(65, celsius))
+    array([False, False,  True])
+"""
+
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from .unit import Unit
+from .measurement import Measurement
+from .measurement_array import MeasurementArray
+from ..exceptions import InvalidValueError
+
+
+def _down(value):
+    """ Round a bound down to the next float, so the exact result of the step that produced it is enclosed. """
+
+    return np.nextafter(value, -np.inf)
+
+
+def _up(value):
+    """ Round a bound up to the next float, so the exact result of the step that produced it is enclosed. """
+
+    return np.nextafter(value, np.inf)
+
+
+def convert_bounds(lower, upper, scale: float, offset: float) -> tuple:
+    """ Apply the affine conversion `x * scale + offset` to a pair of bounds, rounding outward after each step. """
+
+    if scale < 0:
+        lower, upper = upper, lower
+    if scale != 1:
+        lower, upper = _down(lower * scale), _up(upper * scale)
+    if offset:
+        lower, upper = _down(lower + offset), _up(upper + offset)
+    return lower, upper
+
+
+def multiply_bounds(lower, upper, other_lower, other_upper) -> tuple:
+    """ The bounds of the product of two intervals, the extremes of the four products of their bounds. """
+
+    products = (lower * other_lower, lower * other_upper, upper * other_lower, upper * other_upper)
+    return _down(np.minimum.reduce(products)), _up(np.maximum.reduce(products))
+
+
+def divide_bounds(lower, upper, other_lower, other_upper) -> tuple:
+    """ The bounds of the quotient of two intervals, unbounded where the divisor contains zero. """
+
+    spans_zero = (other_lower <= 0) & (other_upper >= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quotients = (lower / other_lower, lower / other_upper, upper / other_lower, upper / other_upper)
+        result_lower = np.where(spans_zero, -np.inf, _down(np.minimum.reduce(quotients)))
+        result_upper = np.where(spans_zero, np.inf, _up(np.maximum.reduce(quotients)))
+    return result_lower, result_upper
+
+
+def power_bounds(lower, upper, power: int) -> tuple:
+    """ The bounds of an interval raised to an integer power, by repeated multiplication rounded outward. """
+
+    if power == 0:
+        return np.ones_like(lower), np.ones_like(upper)
+    if power < 0:
+        lower, upper = power_bounds(lower, upper, -power)
+        return divide_bounds(np.ones_like(lower), np.ones_like(upper), lower, upper)
+    magnitude_lower = np.where((lower <= 0) & (upper >= 0), 0.0, np.minimum(np.abs(lower), np.abs(upper)))
+    magnitude_upper = np.maximum(np.abs(lower), np.abs(upper))
+    if power % 2 == 0:
+        # An even power only depends on the magnitude, which is at least zero when the interval contains zero
+        return np.maximum(_magnitude_power(magnitude_lower, power, _down), 0.0), _magnitude_power(magnitude_upper, power, _up)
+    # An odd power is monotone, so each bound is raised on its own, rounding its magnitude away from the other bound
+    result_lower = np.where(lower < 0, -_magnitude_power(np.abs(lower), power, _up), _magnitude_power(np.abs(lower), power, _down))
+    result_upper = np.where(upper < 0, -_magnitude_power(np.abs(upper), power, _down), _magnitude_power(np.abs(upper), power, _up))
+    return result_lower, result_upper
+
+
+def _magnitude_power(magnitude, power: int, rounding) -> float | np.ndarray:
+    """ Raise a non-negative value to a positive integer power by repeated multiplication, rounding every step one way. """
+
+    result = magnitude
+    for _ in range(power - 1):
+        result = rounding(result * magnitude)
+    return result
+
+
+def _bounds(other) -> Optional[tuple]:
+    """ Split an operand into its bounds and unit, measurements are treated as intervals of a single point. """
+
+    if isinstance(other, (IntervalMeasurement, IntervalMeasurementArray)):
+        return other.lower, other.upper, other.unit
+    if isinstance(other, Measurement):
+        return other.value, other.value, other.unit
+    if isinstance(other, MeasurementArray):
+        return other.values, other.values, other.unit
+    return None
+
+
+def _promoted(other) -> "Optional[IntervalMeasurement | IntervalMeasurementArray]":
+    """ A measurement as an interval of a single point, so it can be the left operand of interval arithmetic. """
+
+    if isinstance(other, Measurement):
+        return IntervalMeasurement(other.value, other.value, other.unit)
+    if isinstance(other, MeasurementArray):
+        return IntervalMeasurementArray(other.values, other.values, other.unit)
+    return None
+
+
+class _IntervalOperations(ABC):
+    """ The arithmetic and limit checks shared by single intervals and arrays of intervals. """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _result(self, lower, upper, unit: Unit):
+        """ Create an interval of the same kind as this one, from its bounds and unit. """
+
+    def _converted_bounds(self, other) -> Optional[tuple]:
+        """ The bounds of another operand, converted to the unit of this interval. """
+
+        bounds = _bounds(other)
+        if bounds is None:
+            return None
+        lower, upper, unit = bounds
+        return convert_bounds(lower, upper, *unit.conversion_factors(self.unit))
+
+    def _aligned_bounds(self, other) -> Optional[tuple]:
+        """ The bounds and unit of another operand, with the quantities it shares with this interval in this interval's units. """
+
+        if isinstance(other, (int, float, np.ndarray)):
+            return other, other, Unit.from_fundamental_units()
+        bounds = _bounds(other)
+        if bounds is None:
+            return None
+        lower, upper, unit = bounds
+        aligned = unit.aligned_with(self.unit)
+        scale, _ = unit.conversion_factors(aligned)
+        return (*convert_bounds(lower, upper, scale, 0.0), aligned)
+
+    def convert_to(self, other: Unit):
+        """ Convert the bounds to a new unit, rounding outward. """
+
+        return self._result(*convert_bounds(self.lower, self.upper, *self.unit.conversion_factors(other)), other)
+
+    def __add__(self, other):
+        bounds = self._converted_bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._result(_down(self.lower + bounds[0]), _up(self.upper + bounds[1]), self.unit)
+
+    def __sub__(self, other):
+        bounds = self._converted_bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._result(_down(self.lower - bounds[1]), _up(self.upper - bounds[0]), self.unit)
+
+    def __mul__(self, other):
+        bounds = self._aligned_bounds(other)
+        if bounds is None:
+            return NotImplemented
+        lower, upper, unit = bounds
+        return self._result(*multiply_bounds(self.lower, self.upper, lower, upper), self.unit * unit)
+
+    def __truediv__(self, other):
+        bounds = self._aligned_bounds(other)
+        if bounds is None:
+            return NotImplemented
+        lower, upper, unit = bounds
+        return self._result(*divide_bounds(self.lower, self.upper, lower, upper), self.unit / unit)
+
+    def __radd__(self, other):
+        promoted = _promoted(other)
+        return promoted + self if promoted is not None else NotImplemented
+
+    def __rsub__(self, other):
+        promoted = _promoted(other)
+        return promoted - self if promoted is not None else NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float, np.ndarray)):
+            return self * other
+        promoted = _promoted(other)
+        return promoted * self if promoted is not None else NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float, np.ndarray)):
+            lower, upper = divide_bounds(other, other, self.lower, self.upper)
+            return self._result(lower, upper, Unit.from_fundamental_units() / self.unit)
+        promoted = _promoted(other)
+        return promoted / self if promoted is not None else NotImplemented
+
+    def __pow__(self, power: int):
+        if not isinstance(power, int):
+            raise InvalidValueError("Intervals can only be raised to integer powers.")
+        return self._result(*power_bounds(self.lower, self.upper, power), self.unit ** power)
+
+    def __neg__(self):
+        return self._result(-self.upper, -self.lower, self.unit)
+
+    def _limit(self, limit) -> tuple:
+        """ The bounds of a limit, converted to the unit of this interval. """
+
+        bounds = self._converted_bounds(limit)
+        if bounds is None:
+            raise InvalidValueError(f"A limit must be a measurement, got {type(limit)}.")
+        return bounds
+
+    def certainly_below(self, limit: Measurement):
+        """ Check if every value within the bounds is below a limit. """
+
+        return self.upper < self._limit(limit)[0]
+
+    def certainly_above(self, limit: Measurement):
+        """ Check if every value within the bounds is above a limit. """
+
+        return self.lower > self._limit(limit)[1]
+
+    def possibly_below(self, limit: Measurement):
+        """ Check if any value within the bounds could be below a limit. """
+
+        return ~self.certainly_above(limit) if isinstance(self.lower, np.ndarray) else not self.certainly_above(limit)
+
+    def possibly_above(self, limit: Measurement):
+        """ Check if any value within the bounds could be above a limit. """
+
+        return ~self.certainly_below(limit) if isinstance(self.lower, np.ndarray) else not self.certainly_below(limit)
+
+    def certainly_within(self, lower_limit: Measurement, upper_limit: Measurement):
+        """ Check if every value within the bounds is between two limits. """
+
+        return (self.lower > self._limit(lower_limit)[1]) & (self.upper < self._limit(upper_limit)[0])
+
+    def contains(self, value: Measurement):
+        """ Check if a measurement lies within the bounds. """
+
+        lower, upper = self._limit(value)
+        return (self.lower <= lower) & (upper <= self.upper)
+
+
+class IntervalMeasurement(_IntervalOperations):
+    """ A measurement known to lie between a lower and an upper bound.
+
+    Attributes:
+        lower (float): The lower bound.
+        upper (float): The upper bound.
+        unit (Unit): The unit of both bounds.
+
+    Raises:
+        InvalidValueError: If the lower bound is above the upper bound, or either bound is NaN.
+
+    Examples:
+        >>> from ucalcx.length import meter
+        >>> IntervalMeasurement(-1, 2, meter) * IntervalMeasurement(3, 4, meter)
+        IntervalMeasurement([-4.000000000000001, 8.000000000000002], meter^2 (m^2))
+    """
+
+    __slots__ = ("lower", "upper", "unit")
+
+    def __init__(self, lower: float, upper: float, unit: Unit):
+        if isinstance(lower, Measurement) or isinstance(upper, Measurement):
+            raise InvalidValueError("The bounds of an interval are floats in its unit, use IntervalMeasurement.from_measurement for measurements.")
+        if not lower <= upper:
+            raise InvalidValueError(f"The lower bound of an interval must not be above its upper bound, got [{lower}, {upper}].")
+        unit = Unit.coerce(unit)
+        self.lower = float(lower)
+        self.upper = float(upper)
+        self.unit = unit
+
+    @classmethod
+    def from_measurement(cls, measurement: Measurement, tolerance: float = 0.0) -> "IntervalMeasurement":
+        """ Create the interval of a measurement plus or minus a tolerance, in the unit of the measurement. """
+
+        return cls(_down(measurement.value - tolerance), _up(measurement.value + tolerance), measurement.unit)
+
+    def _result(self, lower, upper, unit: Unit) -> "IntervalMeasurement | IntervalMeasurementArray":
+        if np.ndim(lower) or np.ndim(upper):
+            # An operand with many values, like a measurement array, gives an interval for each of them
+            return IntervalMeasurementArray(*np.broadcast_arrays(lower, upper), unit)
+        interval = IntervalMeasurement.__new__(IntervalMeasurement)
+        interval.lower, interval.upper, interval.unit = float(lower), float(upper), unit
+        return interval
+
+    @property
+    def midpoint(self) -> float:
+        """ The value in the middle of the bounds. """
+
+        return self.lower / 2 + self.upper / 2
+
+    @property
+    def width(self) -> float:
+        """ The distance between the bounds. """
+
+        return self.upper - self.lower
+
+    def __reduce__(self):
+        return (type(self), (self.lower, self.upper, self.unit))
+
+    def __str__(self):
+        return f"[{self.lower}, {self.upper}] {self.unit.symbol}"
+
+    def __repr__(self):
+        return f"IntervalMeasurement([{self.lower}, {self.upper}], {self.unit})"
+
+
+class IntervalMeasurementArray(_IntervalOperations):
+    """ Many intervals that share a single unit, with their bounds stored in two contiguous float arrays.
+
+    Attributes:
+        lower (np.ndarray): The lower bounds.
+        upper (np.ndarray): The upper bounds.
+        unit (Unit): The unit of the bounds.
+
+    Raises:
+        InvalidValueError: If the bounds have different shapes, or any lower bound is above its upper bound.
+    """
+
+    def __init__(self, lower: Iterable[float], upper: Iterable[float], unit: Unit):
+        lower, upper = np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64)
+        if lower.shape != upper.shape:
+            raise InvalidValueError(f"The bounds of an interval array must have the same shape, got {lower.shape} and {upper.shape}.")
+        if not np.all(lower <= upper):
+            raise InvalidValueError("The lower bounds of an interval array must not be above its upper bounds.")
+        self.lower, self.upper, self.unit = lower, upper, Unit.coerce(unit)
+
+    @classmethod
+    def from_readings(cls, values: Iterable[float], unit: Unit, tolerance: float | Iterable[float] = 0.0) -> "IntervalMeasurementArray":
+        """ Create the intervals of readings plus or minus a tolerance, either one for all readings or one per reading. """
+
+        values, tolerance = np.asarray(values, dtype=np.float64), np.asarray(tolerance, dtype=np.float64)
+        return cls(_down(values - tolerance), _up(values + tolerance), unit)
+
+    def _result(self, lower, upper, unit: Unit) -> "IntervalMeasurementArray":
+        array = IntervalMeasurementArray.__new__(IntervalMeasurementArray)
+        array.lower, array.upper, array.unit = np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64), unit
+        return array
+
+    @property
+    def midpoints(self) -> MeasurementArray:
+        """ The values in the middle of the bounds. """
+
+        return MeasurementArray(self.lower / 2 + self.upper / 2, self.unit)
+
+    @property
+    def widths(self) -> MeasurementArray:
+        """ The distances between the bounds. """
+
+        return MeasurementArray(self.upper - self.lower, self.unit)
+
+    def __len__(self) -> int:
+        return len(self.lower)
+
+    def __iter__(self):
+        for lower, upper in zip(self.lower.tolist(), self.upper.tolist()):
+            yield IntervalMeasurement(lower, upper, self.unit)
+
+    def __getitem__(self, index) -> "IntervalMeasurement | IntervalMeasurementArray":
+        lower, upper = self.lower[index], self.upper[index]
+        if np.ndim(lower) == 0:
+            return IntervalMeasurement(lower, upper, self.unit)
+        return self._result(lower, upper, self.unit)
+
+    def __str__(self):
+        return f"[{self.lower}, {self.upper}] {self.unit.symbol}"
+
+    def __repr__(self):
+        return f"IntervalMeasurementArray([{self.lower}, {self.upper}], {self.unit})"
@@ -1,14 +1,20 @@
 from .unit import Unit
 from .fundamental_unit import FundamentalQuantityUnit
+from .prefixes import best_prefix, with_prefix
+from ..exceptions import IncompatibleUnitsError
 
 class Measurement:
     """ Measurement Class
     
     Represents a measurement with a value and a unit.
+
+    Measurements compare, hash and sort by their magnitude in SI base units, so measurements of the same
+    quantity in different units can be sorted and used in sets or as dictionary keys. Measurements are immutable,
+    so the SI magnitude is computed once, on the first comparison, and cached.
     
     Attributes:
-        value (float): The value of the measurement.
-        unit (Unit): The unit of the measurement.
+        value (float): The value of the measurement, read-only.
+        unit (Unit): The unit of the measurement, read-only.
         
     Examples:
         >>> from ucalcx import Measurement, Unit
@@ -17,55 +23,203 @@ class Measurement:
         >>> length_measurement
         Measurement(5, Unit({length: FQUnit(meter, m, length), power: 1}))
     """
+
+    __slots__ = ("_value", "_unit", "_normalized_key")
     
     def __init__(self, value: float, unit: Unit):
-        self.value = value
         if isinstance(unit, FundamentalQuantityUnit):
             unit = Unit.from_fundamental_units((unit, 1,))
         elif not isinstance(unit, Unit):
             raise ValueError("The unit must be a Unit or a FundamentalQuantityUnit")
-        self.unit = unit
+        self._value = value
+        self._unit = unit
+        self._normalized_key = None
+
+    @classmethod
+    def from_string(cls, text: str) -> "Measurement":
+        """ Parse a measurement like `9.81 m/s^2`, a number followed by an optional unit expression.
+
+        The unit is resolved with `Unit.from_string`, so repeated unit strings are only parsed once.
+
+        Args:
+            text (str): The measurement.
+
+        Returns:
+            Measurement: The measurement.
+
+        Raises:
+            InvalidUnitError: If the unit contains an unknown or ambiguous unit.
+            InvalidValueError: If the measurement is malformed.
+
+        Examples:
+            >>> Measurement.from_string("9.81 m/s^2")
+            Measurement(9.81, meter/second^2 (m/s^2))
+        """
+
+        from ..input.parsing import parse_measurement_cached
+        return parse_measurement_cached(text)
+
+    @property
+    def value(self) -> float:
+        """ The value of the measurement. """
+
+        return self._value
+
+    @property
+    def unit(self) -> Unit:
+        """ The unit of the measurement. """
+
+        return self._unit
+
+    @property
+    def normalized_key(self) -> tuple[tuple, float]:
+        """ The dimensionality of the measurement and its magnitude in SI base units.
+
+        This is the key used to compare, hash and sort measurements. It is computed on first use and cached.
+
+        Examples:
+            >>> Measurement(1, kilometer).normalized_key
+            (((FundamentalQuantity.Length, 1),), 1000.0)
+        """
+
+        if self._normalized_key is None:
+            si_unit = Unit.from_fundamental_units(*((component["unit"].quantity.si_unit, component["power"]) 
+                                                    for component in self.unit.components))
+            scale, offset = self.unit.conversion_factors(si_unit)
+            magnitude = self.value * scale + offset
+            self._normalized_key = (self.unit.dimensionality, magnitude)
+        return self._normalized_key
 
     def convert_to(self, other: Unit) -> "Measurement":
         """ Convert the measurement to a new unit. """
         
         return Measurement(value=self.unit.convert_to(other, self.value), unit=other)
+
+    def to_best_prefix(self) -> "Measurement":
+        """ Convert the measurement to the metric prefix that brings its value into the range [1, 1000).
+
+        Measurements in units that cannot be prefixed, like feet or meters per second, are returned unchanged.
+
+        Examples:
+            >>> Measurement(0.000012, meter).to_best_prefix()
+            Measurement(12.0, micrometer (μm))
+        """
+
+        prefix = best_prefix(self.value, self.unit)
+        return self.convert_to(self.unit if prefix is None else with_prefix(self.unit, prefix))
+
+    def to_system(self, system: "UnitSystem") -> "Measurement":
+        """ Convert the measurement to a system of units, like `ucalcx.systems.US_CUSTOMARY`.
+
+        The unit of each quantity is replaced by the unit of the system, unless the system prefers another unit for
+        the measurement's dimension. The target unit and conversion factors are cached by the system per unit.
+
+        Examples:
+            >>> from ucalcx.systems import US_CUSTOMARY
+            >>> Measurement(100, Unit.from_string("km/h")).to_system(US_CUSTOMARY)
+            Measurement(62.13711922373341, mile/hour (mi/h))
+        """
+
+        return system.convert(self)
     
+    def __reduce__(self):
+        return (type(self), (self.value, self.unit))
+
+    def __float__(self) -> float:
+        """ The value of the measurement in its own unit, without the unit.
+
+        This lets libraries that expect floats use measurements, like the float summary that `Series.describe`
+        builds from the reductions of a pandas column with a `UnitDtype`. The unit is dropped, so convert the
+        measurement to the intended unit first.
+        """
+
+        return float(self.value)
+
     def __str__(self):
         return f"{self.value} {self.unit.symbol}"
     
     def __add__(self, other: "Measurement") -> "Measurement":
-        # This will throw a ValueError if the units are incompatible
+        if not isinstance(other, Measurement):
+            # Arrays and intervals combine with measurements in their reflected methods
+            return NotImplemented
+        # This will throw an IncompatibleUnitsError if the units are incompatible
         others_converted = other.unit.convert_to(self.unit, other.value)
 
         return Measurement(value=self.value + others_converted, unit=self.unit)
     
     def __sub__(self, other: "Measurement") -> "Measurement":
-        # This will throw a ValueError if the units are incompatible
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        # This will throw an IncompatibleUnitsError if the units are incompatible
         others_converted = other.unit.convert_to(self.unit, other.value)
 
         return Measurement(value=self.value - others_converted, unit=self.unit)
     
-    def __mul__(self, other: "Measurement") -> "Measurement":
-        # Convert all components that are shared to a common unit in that dimension
-        new_value = other.value
-        for component in self.unit.components:
-            other_component = other.unit.dimension[component['unit'].quantity]
-            if other_component is not None and other_component['power'] != 0:
-                new_value = other.value ** (1/other_component['power'])
-                new_value = other_component['unit'].convert_to(component['unit'], new_value) ** other_component['power']
-        return Measurement(value=self.value * new_value, unit=self.unit * other.unit)
-
-
-    def __truediv__(self, other: "Measurement") -> "Measurement":
-        # Convert all components that are shared to a common unit in that dimension
-        new_value = other.value
-        for component in self.unit.components:
-            other_component = other.unit.dimension[component['unit'].quantity]
-            if other_component is not None and other_component['power'] != 0:
-                new_value = other.value ** (1/other_component['power'])
-                new_value = other_component['unit'].convert_to(component['unit'], new_value) ** other_component['power']
-        return Measurement(value=self.value / new_value, unit=self.unit / other.unit)
+    def __mul__(self, other: "Measurement | float") -> "Measurement":
+        if isinstance(other, (int, float)):
+            return Measurement(value=self.value * other, unit=self.unit)
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        # Quantities shared by both measurements are converted to the units of the left-hand side
+        aligned = other.unit.aligned_with(self.unit)
+        scale, _ = other.unit.conversion_factors(aligned)
+        return Measurement(value=self.value * other.value * scale, unit=self.unit * aligned)
+
+    def __rmul__(self, other: float) -> "Measurement":
+        if isinstance(other, (int, float)):
+            return Measurement(value=other * self.value, unit=self.unit)
+        return NotImplemented
+
+    def __truediv__(self, other: "Measurement | float") -> "Measurement":
+        if isinstance(other, (int, float)):
+            return Measurement(value=self.value / other, unit=self.unit)
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        # Quantities shared by both measurements are converted to the units of the left-hand side
+        aligned = other.unit.aligned_with(self.unit)
+        scale, _ = other.unit.conversion_factors(aligned)
+        return Measurement(value=self.value / (other.value * scale), unit=self.unit / aligned)
+
+    def _ordering_keys(self, other: "Measurement") -> tuple[float, float]:
+        """ Get the SI magnitudes of two measurements, ensuring that they can be ordered. """
+
+        dimensionality, magnitude = self.normalized_key
+        other_dimensionality, other_magnitude = other.normalized_key
+        if dimensionality != other_dimensionality:
+            raise IncompatibleUnitsError(f"Cannot compare {self} to {other}, as they measure different quantities.")
+        return magnitude, other_magnitude
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        return self.normalized_key == other.normalized_key
+
+    def __hash__(self) -> int:
+        return hash(self.normalized_key)
+
+    def __lt__(self, other: "Measurement") -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        magnitude, other_magnitude = self._ordering_keys(other)
+        return magnitude < other_magnitude
+
+    def __le__(self, other: "Measurement") -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        magnitude, other_magnitude = self._ordering_keys(other)
+        return magnitude <= other_magnitude
+
+    def __gt__(self, other: "Measurement") -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        magnitude, other_magnitude = self._ordering_keys(other)
+        return magnitude > other_magnitude
+
+    def __ge__(self, other: "Measurement") -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        magnitude, other_magnitude = self._ordering_keys(other)
+        return magnitude >= other_magnitude
 
     def __repr__(self):
         return f"Measurement({self.value}, {self.unit})"
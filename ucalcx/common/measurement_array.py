@@ -0,0 +1,599 @@
+import numpy as np
+from fractions import Fraction
+from typing import Callable, Iterable, Optional, Self
+from .unit import Unit
+from .fundamental_unit import FundamentalQuantityUnit
+from .measurement import Measurement
+from . import prefixes
+from ..exceptions import InvalidOperationError, InvalidValueError
+
+
+def _group_by_unit(measurements: Iterable[Measurement]) -> dict[tuple, tuple[Unit, list[int], list[float]]]:
+    """ Group the positions and values of measurements by their unit, keyed by the unit's fundamental units and powers. """
+
+    groups = {}
+    for index, measurement in enumerate(measurements):
+        unit = measurement.unit
+        key = unit.key
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = (unit, [], [])
+        group[1].append(index)
+        group[2].append(measurement.value)
+    return groups
+
+
+class MeasurementArray:
+    """ MeasurementArray Class
+
+    Represents many values that share a single unit, stored in a contiguous float array. This avoids creating
+    a `Measurement` for every value, the unit is tracked once for the whole array.
+
+    Attributes:
+        values (np.ndarray): The values of the measurements.
+        unit (Unit): The unit shared by all of the values.
+
+    Examples:
+        >>> from ucalcx import MeasurementArray
+        >>> from ucalcx.length import meter, kilometer
+        >>> distances = MeasurementArray([1500, 2500], meter)
+        >>> distances.convert_to(kilometer)
+        MeasurementArray([1.5 2.5], kilometer (km))
+    """
+
+    def __init__(self, values: Iterable[float], unit: Unit):
+        if isinstance(values, (list, tuple)) and values and isinstance(values[0], Measurement):
+            # Measurements convert to floats in their own units, which may differ from the unit of the array
+            raise InvalidValueError("Create an array of measurements with MeasurementArray.from_measurements, which converts their units.")
+        self.values = np.asarray(values, dtype=np.float64)
+        if isinstance(unit, FundamentalQuantityUnit):
+            unit = Unit.from_fundamental_units((unit, 1,))
+        elif not isinstance(unit, Unit):
+            raise ValueError("The unit must be a Unit or a FundamentalQuantityUnit")
+        self.unit = unit
+
+    @classmethod
+    def from_measurements(cls, measurements: Iterable[Measurement], unit: Optional[Unit] = None) -> Self:
+        """ Create an array from a collection of measurements, converting them to a single unit.
+
+        Measurements are grouped by unit, so each distinct unit is only converted once.
+
+        Args:
+            measurements (Iterable[Measurement]): The measurements to store in the array.
+            unit (Optional[Unit]): The unit of the array. Defaults to the unit of the first measurement.
+
+        Returns:
+            MeasurementArray: The new array.
+
+        Raises:
+            InvalidValueError: If no measurements and no unit are given.
+            IncompatibleUnitsError: If the measurements cannot be converted to the unit.
+        """
+
+        measurements = list(measurements)
+        if unit is None:
+            if not measurements:
+                raise InvalidValueError("Cannot infer the unit of an empty collection of measurements.")
+            unit = measurements[0].unit
+        array = cls(np.empty(len(measurements)), unit)
+        for group_unit, indices, values in _group_by_unit(measurements).values():
+            scale, offset = group_unit.conversion_factors(array.unit)
+            array.values[indices] = np.asarray(values, dtype=np.float64) * scale + offset
+        return array
+
+    def to_measurements(self) -> list[Measurement]:
+        """ Convert the array to a list of measurements. """
+
+        return [Measurement(value, self.unit) for value in self.values.tolist()]
+
+    def convert_to(self, other: Unit) -> "MeasurementArray":
+        """ Convert every value in the array to a new unit, with a single vectorized multiply and add. """
+
+        scale, offset = self.unit.conversion_factors(other)
+        return MeasurementArray(self.values * scale + offset if offset else self.values * scale, other)
+
+    def to_best_prefix(self) -> "MeasurementArray":
+        """ Convert the array to the metric prefix that brings its largest finite value into the range [1, 1000).
+
+        Arrays in units that cannot be prefixed, and arrays without a finite non-zero value, are returned unchanged.
+        """
+
+        magnitudes = np.abs(self.values[np.isfinite(self.values)])
+        prefix = prefixes.best_prefix(float(magnitudes.max()) if magnitudes.size else 0.0, self.unit)
+        return self.convert_to(self.unit if prefix is None else prefixes.with_prefix(self.unit, prefix))
+
+    def to_system(self, system: "UnitSystem") -> "MeasurementArray":
+        """ Convert the array to a system of units, like `ucalcx.systems.CGS`. See `Measurement.to_system`. """
+
+        return system.convert_array(self)
+
+    def humanize(self, precision: int = 3, separator: str = " ") -> list[str]:
+        """ Format every value with its own best metric prefix, e.g. `12 μm`. See `ucalcx.common.prefixes.humanize`. """
+
+        return prefixes.humanize(self.values, self.unit, precision, separator)
+
+    def _other_values(self, other: "MeasurementArray | Measurement") -> tuple[np.ndarray | float, Unit]:
+        """ Split the other operand of an arithmetic operation into its values and unit. """
+
+        if isinstance(other, MeasurementArray):
+            return other.values, other.unit
+        if isinstance(other, Measurement):
+            return other.value, other.unit
+        raise TypeError(f"Expected a Measurement or MeasurementArray, got {type(other)}")
+
+    @staticmethod
+    def _is_operand(other) -> bool:
+        """ Whether the other operand of an arithmetic operation is combined here.
+
+        Subclasses of Measurement that carry more than a value, like an uncertainty, would lose it here, so they are
+        left to their reflected operators.
+        """
+
+        return isinstance(other, MeasurementArray) or type(other) is Measurement
+
+    def __add__(self, other: "MeasurementArray | Measurement") -> "MeasurementArray":
+        if not self._is_operand(other):
+            return NotImplemented
+        values, unit = self._other_values(other)
+        scale, offset = unit.conversion_factors(self.unit)
+        return MeasurementArray(self.values + (values * scale + offset), self.unit)
+
+    def __sub__(self, other: "MeasurementArray | Measurement") -> "MeasurementArray":
+        if not self._is_operand(other):
+            return NotImplemented
+        values, unit = self._other_values(other)
+        scale, offset = unit.conversion_factors(self.unit)
+        return MeasurementArray(self.values - (values * scale + offset), self.unit)
+
+    def __mul__(self, other: "MeasurementArray | Measurement | float") -> "MeasurementArray":
+        if isinstance(other, (int, float, np.ndarray)):
+            return MeasurementArray(self.values * other, self.unit)
+        if not self._is_operand(other):
+            return NotImplemented
+        values, unit = self._other_values(other)
+        # Quantities shared by both units are converted to this array's units before multiplying
+        scale, _ = unit.conversion_factors(unit.aligned_with(self.unit))
+        return MeasurementArray(self.values * (values * scale), self.unit * unit)
+
+    def __radd__(self, other: Measurement) -> "MeasurementArray":
+        if isinstance(other, MeasurementArray) or not self._is_operand(other):
+            return NotImplemented
+        # The result is in the unit of the left-hand side, like the sum of two measurements
+        scale, offset = self.unit.conversion_factors(other.unit)
+        return MeasurementArray(other.value + (self.values * scale + offset), other.unit)
+
+    def __rsub__(self, other: Measurement) -> "MeasurementArray":
+        if isinstance(other, MeasurementArray) or not self._is_operand(other):
+            return NotImplemented
+        scale, offset = self.unit.conversion_factors(other.unit)
+        return MeasurementArray(other.value - (self.values * scale + offset), other.unit)
+
+    def __rmul__(self, other: "Measurement | float") -> "MeasurementArray":
+        if isinstance(other, (int, float, np.ndarray)):
+            return MeasurementArray(other * self.values, self.unit)
+        if isinstance(other, MeasurementArray) or not self._is_operand(other):
+            return NotImplemented
+        aligned = self.unit.aligned_with(other.unit)
+        scale, _ = self.unit.conversion_factors(aligned)
+        return MeasurementArray(other.value * (self.values * scale), other.unit * aligned)
+
+    def __truediv__(self, other: "MeasurementArray | Measurement | float") -> "MeasurementArray":
+        if isinstance(other, (int, float, np.ndarray)):
+            return MeasurementArray(self.values / other, self.unit)
+        if not self._is_operand(other):
+            return NotImplemented
+        values, unit = self._other_values(other)
+        scale, _ = unit.conversion_factors(unit.aligned_with(self.unit))
+        return MeasurementArray(self.values / (values * scale), self.unit / unit)
+
+    def __rtruediv__(self, other: "Measurement | float") -> "MeasurementArray":
+        if isinstance(other, (int, float, np.ndarray)):
+            return MeasurementArray(other / self.values, Unit.from_fundamental_units() / self.unit)
+        if isinstance(other, MeasurementArray) or not self._is_operand(other):
+            return NotImplemented
+        aligned = self.unit.aligned_with(other.unit)
+        scale, _ = self.unit.conversion_factors(aligned)
+        return MeasurementArray(other.value / (self.values * scale), other.unit / aligned)
+
+    def __pow__(self, power: float) -> "MeasurementArray":
+        """ Raise every value to a power, and the unit with it. Fractional powers like 0.5 take a root of the unit. """
+
+        if not isinstance(power, (int, float)):
+            return NotImplemented
+        return MeasurementArray(self.values ** power, _power_unit(self.unit, power))
+
+    def __neg__(self) -> "MeasurementArray":
+        return MeasurementArray(-self.values, self.unit)
+
+    def __pos__(self) -> "MeasurementArray":
+        return MeasurementArray(+self.values, self.unit)
+
+    def __abs__(self) -> "MeasurementArray":
+        return MeasurementArray(np.abs(self.values), self.unit)
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs, **kwargs):
+        """ Apply a NumPy ufunc to the values, working out the unit of the result once for the whole call.
+
+        Ufuncs that need matching units, like `np.add`, `np.maximum` and comparisons, convert their operands to the
+        unit of the first operand with a unit. `np.multiply`, `np.divide`, `np.power`, `np.sqrt` and similar ufuncs
+        propagate units with the same rules as `Unit.__mul__`, `Unit.__truediv__`, `Unit.__pow__` and `Unit.root`.
+        Exponentials, logarithms and trigonometric functions need unitless operands. Other ufuncs are not supported,
+        and NumPy raises a TypeError for them rather than dropping the unit.
+
+        Plain numbers and NumPy arrays are unitless factors in products and quotients, and are compared with the
+        values in the unit of the array. Adding them to values with a unit is ambiguous, and raises a TypeError.
+
+        Examples:
+            >>> np.sqrt(MeasurementArray([4.0, 9.0], meter ** 2))
+            MeasurementArray([2. 3.], meter (m))
+            >>> np.add.reduce(MeasurementArray([1.0, 2.5], kilometer))
+            Measurement(3.5, kilometer (km))
+        """
+
+        return _apply_ufunc(ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func: Callable, types: tuple[type, ...], args: tuple, kwargs: dict):
+        """ Apply a NumPy function like `np.mean` or `np.concatenate` to the values, keeping track of the unit.
+
+        Examples:
+            >>> np.concatenate([MeasurementArray([1.0], kilometer), MeasurementArray([500.0], meter)])
+            MeasurementArray([1.  0.5], kilometer (km))
+        """
+
+        handler = _ARRAY_FUNCTIONS.get(func)
+        if handler is None or not all(issubclass(type_, (MeasurementArray, np.ndarray)) for type_ in types):
+            return NotImplemented
+        return handler(func, *args, **kwargs)
+
+    def __array__(self, dtype=None, copy: Optional[bool] = None) -> np.ndarray:
+        """ The values of the array in its unit, so `np.asarray(array)` is the float array rather than an array of measurements.
+
+        As in NumPy 2, the values are returned without copying unless `copy` is true or `dtype` needs a cast, and
+        `copy=False` raises a ValueError when a cast is needed.
+        """
+
+        if copy:
+            return np.array(self.values, dtype=dtype)
+        if copy is False and dtype is not None and np.dtype(dtype) != self.values.dtype:
+            raise ValueError(f"Unable to avoid a copy while converting the values of a MeasurementArray to {np.dtype(dtype)}.")
+        return np.asarray(self.values, dtype=dtype)
+
+    # Arrays are mutable and compare elementwise, so they are not hashable, like NumPy arrays
+    __hash__ = None
+
+    def _equal(self, other) -> np.ndarray:
+        """ Compare the array with another operand elementwise, never raising for operands that are values.
+
+        Bare numbers and NumPy arrays are compared with the values in the unit of this array. Like Measurement,
+        measurements of other quantities are never equal.
+        """
+
+        if isinstance(other, (int, float, np.ndarray)):
+            return self.values == other
+        if self.unit.dimensionality != other.unit.dimensionality:
+            return np.zeros(self.values.shape, dtype=bool)
+        return np.equal(self, other)
+
+    def __eq__(self, other) -> np.ndarray:
+        if not isinstance(other, (MeasurementArray, Measurement, np.ndarray, int, float)):
+            # Like Measurement, objects that are not values are never equal, rather than raising
+            return NotImplemented
+        return self._equal(other)
+
+    def __ne__(self, other) -> np.ndarray:
+        if not isinstance(other, (MeasurementArray, Measurement, np.ndarray, int, float)):
+            return NotImplemented
+        return ~self._equal(other)
+
+    def __lt__(self, other) -> np.ndarray:
+        return np.less(self, other)
+
+    def __le__(self, other) -> np.ndarray:
+        return np.less_equal(self, other)
+
+    def __gt__(self, other) -> np.ndarray:
+        return np.greater(self, other)
+
+    def __ge__(self, other) -> np.ndarray:
+        return np.greater_equal(self, other)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        for value in self.values.tolist():
+            yield Measurement(value, self.unit)
+
+    def __getitem__(self, index) -> "Measurement | MeasurementArray":
+        values = self.values[index]
+        if np.ndim(values) == 0:
+            return Measurement(float(values), self.unit)
+        return MeasurementArray(values, self.unit)
+
+    def __str__(self):
+        return f"{self.values} {self.unit.symbol}"
+
+    def __repr__(self):
+        return f"MeasurementArray({self.values}, {self.unit})"
+
+
+
+_UNITLESS = Unit.from_fundamental_units()
+" The unit of operands without a unit. "
+
+
+def _split(operand) -> tuple[np.ndarray | float, Optional[Unit]]:
+    """ Split an operand of a NumPy function into its values and unit, the unit is None for plain numbers and arrays. """
+
+    if isinstance(operand, MeasurementArray):
+        return operand.values, operand.unit
+    if isinstance(operand, Measurement):
+        return operand.value, operand.unit
+    return operand, None
+
+
+def _first_unit(operands: Iterable) -> Unit:
+    return next((unit for _, unit in map(_split, operands) if unit is not None), _UNITLESS)
+
+
+def _in_unit(operand, unit: Unit) -> np.ndarray | float:
+    """ The values of an operand converted to a unit, operands without a unit can only be converted to unitless units. """
+
+    values, operand_unit = _split(operand)
+    scale, offset = (operand_unit or _UNITLESS).conversion_factors(unit)
+    if scale == 1 and offset == 0:
+        return values
+    return values * scale + offset
+
+
+def _wrap(values, unit: Optional[Unit]):
+    """ Attach a unit to the result of a NumPy function, a single value becomes a `Measurement`. """
+
+    if unit is None:
+        return values
+    if np.ndim(values) == 0:
+        return Measurement(float(values), unit)
+    return MeasurementArray(values, unit)
+
+
+def _power_unit(unit: Unit, exponent) -> Unit:
+    """ The unit of a unit raised to a power, fractional powers are taken as roots. """
+
+    if np.ndim(exponent) != 0:
+        raise InvalidOperationError(f"Cannot raise {unit.symbol} to an array of powers, the result would have several units.")
+    fraction = Fraction(float(exponent)).limit_denominator(_MAX_ROOT_DEGREE)
+    if float(fraction) != float(exponent):
+        raise InvalidOperationError(f"Cannot raise {unit.symbol} to the power {exponent}, it is not a simple fraction.")
+    return (unit ** fraction.numerator).root(fraction.denominator)
+
+
+_MAX_ROOT_DEGREE = 12
+" The largest denominator of a fractional power that units can be raised to. "
+
+_MATCHING_UNIT_UFUNCS = frozenset([np.add, np.subtract, np.maximum, np.minimum, np.fmax, np.fmin, np.hypot, np.remainder, np.fmod])
+" Ufuncs whose operands are converted to a common unit, which is also the unit of their result. "
+
+_COMPARISON_UFUNCS = frozenset([np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal])
+" Ufuncs whose operands are converted to a common unit, and whose result has no unit. "
+
+_UNIT_PRESERVING_UFUNCS = frozenset([np.negative, np.positive, np.absolute, np.fabs, np.rint, np.floor, np.ceil, np.trunc, np.conjugate])
+" Ufuncs of a single operand whose result is in the unit of the operand. "
+
+_UNITLESS_RESULT_UFUNCS = frozenset([np.isnan, np.isinf, np.isfinite, np.signbit, np.sign])
+" Ufuncs of a single operand of any unit, whose result has no unit. "
+
+_DIMENSIONLESS_UFUNCS = frozenset([np.exp, np.expm1, np.exp2, np.log, np.log2, np.log10, np.log1p, np.sin, np.cos, np.tan,
+                                   np.arcsin, np.arccos, np.arctan, np.sinh, np.cosh, np.tanh, np.arcsinh, np.arccosh, np.arctanh])
+" Ufuncs that only accept unitless operands, and whose result has no unit. "
+
+_PRODUCT_UFUNCS = {np.multiply: 1, np.matmul: 1, np.divide: -1, np.floor_divide: -1}
+" Ufuncs that multiply (1) or divide (-1) the units of their operands. "
+
+_ROOT_UFUNCS = {np.sqrt: 2, np.cbrt: 3}
+" Ufuncs that take a root of the unit of their operand, by the degree of the root. "
+
+
+def _ufunc_operands(ufunc: np.ufunc, inputs: tuple) -> Optional[tuple[list, Optional[Unit]]]:
+    """ The values to call a ufunc with, converted where it needs matching units, and the unit of its result.
+
+    Returns None for ufuncs that are not supported.
+    """
+
+    if ufunc in _MATCHING_UNIT_UFUNCS or ufunc in _COMPARISON_UFUNCS:
+        unit = _first_unit(inputs)
+        if unit.dimensionality and any(_split(operand)[1] is None for operand in inputs):
+            # Numbers without a unit are compared with the values in the unit of the array, like `array == 0`, but
+            # adding them to values with a unit is ambiguous, so NumPy raises a TypeError
+            if ufunc in _MATCHING_UNIT_UFUNCS:
+                return None
+            return [_split(operand)[0] if _split(operand)[1] is None else _in_unit(operand, unit) for operand in inputs], None
+        return [_in_unit(operand, unit) for operand in inputs], None if ufunc in _COMPARISON_UFUNCS else unit
+    if ufunc in _DIMENSIONLESS_UFUNCS:
+        return [_in_unit(operand, _UNITLESS) for operand in inputs], None
+
+    splits = [_split(operand) for operand in inputs]
+    values, unit = splits[0][0], splits[0][1] or _UNITLESS
+    if ufunc in _UNIT_PRESERVING_UFUNCS:
+        return [values], unit
+    if ufunc in _UNITLESS_RESULT_UFUNCS:
+        return [values], None
+    if ufunc in _ROOT_UFUNCS:
+        return [values], unit.root(_ROOT_UFUNCS[ufunc])
+    if ufunc is np.square:
+        return [values], unit ** 2
+    if ufunc is np.reciprocal:
+        return [values], _UNITLESS / unit
+    if ufunc in _PRODUCT_UFUNCS:
+        other, other_unit = splits[1][0], splits[1][1] or _UNITLESS
+        # Quantities shared by both operands are converted to the units of the left-hand side, as in Unit.__mul__
+        scale, _ = other_unit.conversion_factors(other_unit.aligned_with(unit))
+        other = other if scale == 1 else other * scale
+        return [values, other], unit * other_unit if _PRODUCT_UFUNCS[ufunc] == 1 else unit / other_unit
+    if ufunc in (np.power, np.float_power):
+        exponent = _in_unit(inputs[1], _UNITLESS)
+        if not unit.dimension:
+            return [values, exponent], splits[0][1]
+        return [values, exponent], _power_unit(unit, exponent)
+    return None
+
+
+def _apply_ufunc(ufunc: np.ufunc, method: str, inputs: tuple, kwargs: dict):
+    """ Apply a ufunc method to the values of measurement arrays, and attach the unit of the result. """
+
+    if method in ("__call__", "outer"):
+        prepared = _ufunc_operands(ufunc, inputs)
+    elif method in ("reduce", "accumulate", "reduceat") and ufunc in _MATCHING_UNIT_UFUNCS:
+        values, unit = _split(inputs[0])
+        prepared = [values, *inputs[1:]], unit
+    elif method == "reduce" and ufunc is np.multiply:
+        # The product of n values has the unit raised to the power n
+        values, unit = _split(inputs[0])
+        axis = kwargs.get("axis", 0)
+        if axis is not None and not isinstance(axis, int):
+            return NotImplemented
+        count = np.size(values) if axis is None else np.shape(values)[axis]
+        prepared = [values], (unit or _UNITLESS) ** count
+    else:
+        return NotImplemented
+    if prepared is None:
+        return NotImplemented
+
+    values, unit = prepared
+    out = kwargs.get("out")
+    if out is not None:
+        kwargs["out"] = tuple(array.values if isinstance(array, MeasurementArray) else array for array in out)
+    result = getattr(ufunc, method)(*values, **kwargs)
+    if out is None:
+        return _wrap(result, unit)
+    if isinstance(out[0], MeasurementArray):
+        out[0].unit = unit or _UNITLESS
+        return out[0]
+    return _wrap(out[0], unit)
+
+
+_ARRAY_FUNCTIONS: dict[Callable, Callable] = {}
+" The implementations of NumPy functions for measurement arrays, by the NumPy function they implement. "
+
+
+def _implements(*names: str):
+    """ Register an implementation of the NumPy functions with the given names, skipping names this NumPy lacks. """
+
+    def register(handler: Callable) -> Callable:
+        for name in names:
+            function = np
+            for part in name.split("."):
+                function = getattr(function, part, None)
+            if function is not None:
+                _ARRAY_FUNCTIONS[function] = handler
+        return handler
+    return register
+
+
+@_implements("sum", "nansum", "mean", "nanmean", "median", "nanmedian", "min", "nanmin", "amin", "max", "nanmax", "amax",
+             "ptp", "std", "nanstd", "percentile", "nanpercentile", "quantile", "nanquantile", "cumsum", "nancumsum",
+             "sort", "round", "around", "diff", "copy", "squeeze", "ravel", "reshape", "transpose", "flip", "roll",
+             "take", "repeat", "atleast_1d", "zeros_like", "ones_like", "empty_like", "linalg.norm")
+def _unit_preserving(function: Callable, array, *args, **kwargs):
+    values, unit = _split(array)
+    return _wrap(function(values, *args, **kwargs), unit)
+
+
+@_implements("prod", "nanprod")
+def _product(function: Callable, array, axis=None, *args, **kwargs):
+    # The product of n values has the unit raised to the power n
+    values, unit = _split(array)
+    if axis is not None and not isinstance(axis, int):
+        return NotImplemented
+    count = np.size(values) if axis is None else np.shape(values)[axis]
+    return _wrap(function(values, axis, *args, **kwargs), (unit or _UNITLESS) ** count)
+
+
+@_implements("var", "nanvar")
+def _squared_unit(function: Callable, array, *args, **kwargs):
+    values, unit = _split(array)
+    return _wrap(function(values, *args, **kwargs), unit ** 2)
+
+
+@_implements("argsort", "argmin", "nanargmin", "argmax", "nanargmax", "shape", "ndim", "size", "nonzero", "argwhere",
+             "flatnonzero", "count_nonzero")
+def _without_unit(function: Callable, array, *args, **kwargs):
+    return function(_split(array)[0], *args, **kwargs)
+
+
+@_implements("concatenate", "stack", "vstack", "hstack", "column_stack", "dstack")
+def _joined(function: Callable, arrays, *args, **kwargs):
+    arrays = list(arrays)
+    unit = _first_unit(arrays)
+    return _wrap(function([_in_unit(array, unit) for array in arrays], *args, **kwargs), unit)
+
+
+@_implements("append")
+def _appended(function: Callable, array, values, *args, **kwargs):
+    unit = _first_unit([array, values])
+    return _wrap(function(_in_unit(array, unit), _in_unit(values, unit), *args, **kwargs), unit)
+
+
+@_implements("clip")
+def _clipped(function: Callable, array, *args, **kwargs):
+    # Bounds left out are passed on untouched, NumPy marks them with None or a private sentinel
+    def bound(value):
+        return _in_unit(value, unit) if isinstance(value, (int, float, np.ndarray, Measurement, MeasurementArray)) else value
+
+    values, unit = _split(array)
+    args = [bound(value) for value in args]
+    kwargs = {name: bound(value) if name in ("a_min", "a_max", "min", "max") else value for name, value in kwargs.items()}
+    return _wrap(function(values, *args, **kwargs), unit)
+
+
+@_implements("where")
+def _where(function: Callable, condition, *choices):
+    if not choices:
+        return function(_split(condition)[0])
+    unit = _first_unit(choices)
+    return _wrap(function(_split(condition)[0], *(_in_unit(choice, unit) for choice in choices)), unit)
+
+
+@_implements("searchsorted")
+def _searchsorted(function: Callable, array, values, *args, **kwargs):
+    sorted_values, unit = _split(array)
+    return function(sorted_values, _in_unit(values, unit or _UNITLESS), *args, **kwargs)
+
+
+@_implements("isclose", "allclose", "array_equal")
+def _compared(function: Callable, array, other, *args, **kwargs):
+    unit = _first_unit([array, other])
+    if isinstance(kwargs.get("atol"), Measurement):
+        kwargs["atol"] = kwargs["atol"].value * abs(kwargs["atol"].unit.conversion_factors(unit)[0])
+    return function(_in_unit(array, unit), _in_unit(other, unit), *args, **kwargs)
+
+
+@_implements("interp")
+def _interpolated(function: Callable, x, xp, fp, *args, **kwargs):
+    unit = _first_unit([xp, x])
+    values, result_unit = _split(fp)
+    args = [_in_unit(bound, result_unit) if _split(bound)[1] is not None else bound for bound in args]
+    return _wrap(function(_in_unit(x, unit), _in_unit(xp, unit), values, *args, **kwargs), result_unit)
+
+
+def _aligned_product(array, other) -> tuple[np.ndarray | float, np.ndarray | float, Unit]:
+    """ The values of two operands of a product, with the quantities they share in the units of the first, and the unit of the product. """
+
+    values, unit = _split(array)
+    other_values, other_unit = _split(other)
+    unit, other_unit = unit or _UNITLESS, other_unit or _UNITLESS
+    scale, _ = other_unit.conversion_factors(other_unit.aligned_with(unit))
+    return values, other_values if scale == 1 else other_values * scale, unit * other_unit
+
+
+@_implements("dot", "vdot", "inner", "outer", "cross")
+def _multiplied(function: Callable, array, other, *args, **kwargs):
+    values, other_values, unit = _aligned_product(array, other)
+    return _wrap(function(values, other_values, *args, **kwargs), unit)
+
+
+@_implements("trapezoid")
+def _integrated(function: Callable, y, x=None, dx=1.0, axis=-1):
+    values, steps, unit = _aligned_product(y, x if x is not None else dx)
+    if x is not None:
+        return _wrap(function(values, steps, axis=axis), unit)
+    return _wrap(function(values, dx=steps, axis=axis), unit)
@@ -0,0 +1,179 @@
+""" Selection of the metric prefix that shows a value with the fewest digits, for single values and whole arrays.
+
+The best prefix of a value is the engineering prefix (a power of 1000, from yocto to yotta) that brings it into
+the range [1, 1000), e.g. 0.000012 m is shown as 12 μm. The prefix is read from a table indexed by the decimal
+exponent of the value, `floor(log10(|value|))`, so choosing the prefixes of an array takes a few vectorized NumPy
+operations rather than a search over the `MetricPrefix` enum for every value.
+
+Only units made of a single metric unit (a unit that takes a `MetricPrefix`, like `Meter`, `Second`, `Gram` and
+`Ampere`) raised to a power can be prefixed. For powers other than one, the prefix applies to the unit before it
+is raised, so 0.0003 m^2 is shown as 300 mm^2 (1 mm^2 is 10^-6 m^2) and 5000 /s is shown as 5 /ms. A step of one
+prefix scales such values by 1000 to the power, so they are brought into the range [1, 1000^|power|) instead,
+e.g. 3e-7 m^2 is shown as 300000 μm^2 (0.3 mm^2 would be below 1).
+
+Examples:
+    >>> from ucalcx import Measurement, MeasurementArray
+    >>> from ucalcx.length import meter
+    >>> Measurement(0.000012, meter).to_best_prefix()
+    Measurement(12.0, micrometer (μm))
+    >>> MeasurementArray([0.000012, 1500, 0.25], meter).humanize()
+    ['12 μm', '1.5 km', '250 mm']
+"""
+
+import math
+import numpy as np
+from typing import Iterable, Optional
+from .metric_prefix import MetricPrefix
+from .fundamental_unit import FundamentalQuantityUnit
+from .unit import Unit
+
+
+ENGINEERING_PREFIXES = tuple(sorted((prefix for prefix in MetricPrefix if prefix.exponent % 3 == 0), key=lambda prefix: prefix.exponent))
+" The prefixes whose exponent is a multiple of three, from yocto to yotta, in increasing order. "
+
+_BASE_INDEX = ENGINEERING_PREFIXES.index(MetricPrefix.Base)
+_LARGEST_INDEX = len(ENGINEERING_PREFIXES) - 1
+
+_SMALLEST_EXPONENT = 3 * (-_BASE_INDEX - 1)
+_PREFIX_BY_EXPONENT = np.clip(np.arange(_SMALLEST_EXPONENT, -_SMALLEST_EXPONENT + 1) // 3 + _BASE_INDEX, 0, _LARGEST_INDEX)
+" The position in `ENGINEERING_PREFIXES` of the best prefix of a value, indexed by its exponent minus `_SMALLEST_EXPONENT`. "
+_PREFIX_BY_EXPONENT.setflags(write=False)
+
+
+def _prefixable(unit: Unit | FundamentalQuantityUnit) -> Optional[tuple[FundamentalQuantityUnit, int]]:
+    """ The metric unit and power of a unit that can be prefixed, or None if the unit cannot be prefixed. """
+
+    if isinstance(unit, FundamentalQuantityUnit):
+        unit, power = unit, 1
+    elif len(unit.components) == 1:
+        unit, power = unit.components[0]["unit"], unit.components[0]["power"]
+    else:
+        return None
+    if not isinstance(getattr(unit, "metric_prefix", None), MetricPrefix):
+        return None
+    return unit, power
+
+
+def with_prefix(unit: Unit | FundamentalQuantityUnit, prefix: MetricPrefix) -> Optional[Unit]:
+    """ The unit with its metric unit replaced by the same unit with another prefix, or None if it cannot be prefixed.
+
+    Examples:
+        >>> from ucalcx.length import meter
+        >>> with_prefix(meter ** 2, MetricPrefix.Milli).symbol
+        'mm^2'
+    """
+
+    prefixable = _prefixable(unit)
+    if prefixable is None:
+        return None
+    metric_unit, power = prefixable
+    return Unit.from_fundamental_units((type(metric_unit)(prefix), power))
+
+
+def _indices(exponents: np.ndarray, power: int) -> np.ndarray:
+    """ The positions in `ENGINEERING_PREFIXES` of the best prefixes of values with the given decimal exponents. """
+
+    # An n-th power of a prefix scales values by n times its exponent, and negative powers mirror the order of prefixes
+    exponents = np.floor_divide(exponents, abs(power)) - _SMALLEST_EXPONENT
+    indices = _PREFIX_BY_EXPONENT[np.clip(exponents, 0, len(_PREFIX_BY_EXPONENT) - 1)]
+    return indices if power > 0 else _LARGEST_INDEX - indices
+
+
+def best_prefixes(values: Iterable[float], unit: Unit | FundamentalQuantityUnit) -> Optional[np.ndarray]:
+    """ The best prefix of every value of an array, as positions in `ENGINEERING_PREFIXES`.
+
+    Zeros, infinities and NaN keep the unprefixed unit. Returns None if the unit cannot be prefixed.
+    """
+
+    prefixable = _prefixable(unit)
+    if prefixable is None:
+        return None
+    metric_unit, power = prefixable
+    values = np.abs(np.asarray(values, dtype=np.float64))
+    finite = np.isfinite(values) & (values > 0)
+    exponents = np.zeros(values.shape, dtype=np.int64)
+    np.floor(np.log10(values, where=finite, out=np.zeros(values.shape)), out=exponents, where=finite, casting="unsafe")
+    # The exponent of a value in the unprefixed unit, computed on integers so the current prefix adds no rounding
+    exponents += metric_unit.metric_prefix.exponent * power
+    return np.where(finite, _indices(exponents, power), _BASE_INDEX)
+
+
+def best_prefix(value: float, unit: Unit | FundamentalQuantityUnit) -> Optional[MetricPrefix]:
+    """ The prefix that brings a value into the range [1, 1000), or None if the unit cannot be prefixed.
+
+    For units raised to a power, the range is [1, 1000^|power|).
+
+    Examples:
+        >>> from ucalcx.length import meter
+        >>> best_prefix(0.000012, meter)
+        <MetricPrefix.Micro: ('micro', 'μ', -6)>
+    """
+
+    prefixable = _prefixable(unit)
+    if prefixable is None:
+        return None
+    metric_unit, power = prefixable
+    value = abs(value)
+    if not (0 < value < math.inf):
+        return MetricPrefix.Base
+    exponent = math.floor(math.log10(value)) + metric_unit.metric_prefix.exponent * power
+    return ENGINEERING_PREFIXES[int(_indices(np.array(exponent), power))]
+
+
+def _rescale(values, exponents):
+    """ Multiply values by powers of ten, dividing by negative powers, as the reciprocals of most powers of ten are inexact. """
+
+    return np.where(exponents >= 0, values * np.power(10.0, np.abs(exponents)), values / np.power(10.0, np.abs(exponents)))
+
+
+def _round_significant(values: np.ndarray, precision: int) -> np.ndarray:
+    """ Round values to a number of significant digits. Zeros, infinities and NaN are returned unchanged. """
+
+    finite = np.isfinite(values) & (values != 0)
+    exponents = np.zeros(values.shape, dtype=np.int64)
+    np.floor(np.log10(np.abs(values), where=finite, out=np.zeros(values.shape)), out=exponents, where=finite, casting="unsafe")
+    digits = precision - 1 - exponents
+    return np.where(finite, _rescale(np.round(_rescale(values, digits)), -digits), values)
+
+
+def humanize(values: Iterable[float], unit: Unit | FundamentalQuantityUnit, precision: int = 3, separator: str = " ") -> list[str]:
+    """ Format every value of an array with its best prefix, e.g. `12 μm`.
+
+    Values are rounded to `precision` significant digits before their prefix is chosen, so a value that rounds up
+    to the next power of 1000 takes the next prefix, e.g. 999.95 m is shown as `1 km` rather than `1e+03 m`.
+    Values with a prefix are written without an exponent, e.g. `300000 μm^2`.
+
+    The prefixes and rescaled values of the whole array are computed with vectorized NumPy operations, and the
+    symbol of each prefixed unit is only built once. Values of units that cannot be prefixed are formatted in
+    their own unit.
+
+    Args:
+        values (Iterable[float]): The values to format.
+        unit (Unit | FundamentalQuantityUnit): The unit of the values.
+        precision (int): The number of significant digits of each value.
+        separator (str): The text between each value and its unit.
+
+    Returns:
+        list[str]: The formatted values.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    prefixable = _prefixable(unit)
+    if prefixable is None:
+        symbol = separator + (unit.symbol if isinstance(unit, Unit) else Unit.from_fundamental_units((unit, 1)).symbol)
+        return [f"{value:.{precision}g}{symbol}" for value in values.ravel().tolist()]
+
+    # Rounding to significant digits commutes with rescaling by powers of ten, so the values are rounded first
+    values = _round_significant(values, precision)
+    indices = best_prefixes(values, unit)
+    metric_unit, power = prefixable
+    exponents = np.array([prefix.exponent for prefix in ENGINEERING_PREFIXES])[indices]
+    rescaled = _rescale(values, (metric_unit.metric_prefix.exponent - exponents) * power)
+    symbols = {int(index): separator + with_prefix(unit, ENGINEERING_PREFIXES[index]).symbol for index in np.unique(indices)}
+    rescaled, indices = rescaled.ravel(), indices.ravel()
+    formatted = [f"{value:.{precision}g}{symbols[index]}" for value, index in zip(rescaled.tolist(), indices.tolist())]
+    # The g format switches to an exponent from 10^precision, which values of units raised to a power can reach
+    for position in np.flatnonzero(np.abs(rescaled) >= 10.0 ** precision).tolist():
+        value = np.format_float_positional(rescaled[position], precision=precision, unique=False, fractional=False, trim="-")
+        formatted[position] = value + symbols[int(indices[position])]
+    return formatted
@@ -4,47 +4,48 @@ from enum import Enum
 class FundamentalQuantity(Enum):
     """ Fundamental Quantity Enum
     
-    Provides the name and symbol of the fundamental quantity.
+    Provides the name and symbol of the fundamental quantity, stored as plain attributes of each member.
     
     Attributes:
-        name (str): The name of the fundamental quantity.
-        symbol (str): The symbol of the fundamental quantity.
+        quantity_name (str): The name of the fundamental quantity.
+        quantity_symbol (str): The symbol of the fundamental quantity.
+        si_unit_name (str): The name of the SI base unit of the fundamental quantity.
     """
     
-    Length = {"name": "Length", "symbol": "L"}
+    Length = ("Length", "L", "meter")
     """ Length (L) """
     
-    Mass = {"name": "Mass", "symbol": "M"}
+    Mass = ("Mass", "M", "kilogram")
     """ Mass (M) """
     
-    Time = {"name": "Time", "symbol": "T"}
+    Time = ("Time", "T", "second")
     """ Time (T) """
     
-    Current = {"name": "Current", "symbol": "I"}
+    Current = ("Current", "I", "ampere")
     """ Current (I) """
     
-    Temperature = {"name": "Temperature", "symbol": "T"}
+    Temperature = ("Temperature", "T", "kelvin")
     """ Temperature (T) """
     
-    AmountOfSubstance = {"name": "Amount of Substance", "symbol": "N"}
+    AmountOfSubstance = ("Amount of Substance", "N", "mole")
     """ Amount of Substance (N) """
     
-    LuminousIntensity = {"name": "Luminous Intensity", "symbol": "J"}
+    LuminousIntensity = ("Luminous Intensity", "J", "candela")
     """ Luminous Intensity (J) """
     
-    Unitless = {"name": "Coefficient", "symbol": ""}
+    Unitless = ("Coefficient", "", None)
     """ Unitless (1) """
     
-    @property
-    def quantity_name(self):
-        """ Returns the name of the fundamental quantity. """
-        
-        return self.value["name"]
+    def __init__(self, quantity_name: str, quantity_symbol: str, si_unit_name: str | None):
+        self.quantity_name = quantity_name
+        self.quantity_symbol = quantity_symbol
+        self.si_unit_name = si_unit_name
 
     @property
-    def quantity_symbol(self):
-        """ Returns the symbol of the fundamental quantity. """
-        
-        return self.value["symbol"]
-    
-    
\ No newline at end of file
+    def si_unit(self):
+        """ Returns the SI base unit of the fundamental quantity, or None for unitless quantities. """
+
+        if self.si_unit_name is None:
+            return None
+        from .fundamental_unit import FundamentalQuantityUnit
+        return FundamentalQuantityUnit.registry[(self.name, self.si_unit_name)]
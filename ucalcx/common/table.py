@@ -0,0 +1,233 @@
+""" A columnar table of measurements, with one contiguous float array and one unit per column.
+
+A `MeasurementTable` stores each column as a `MeasurementArray`, so a row costs 8 bytes per column instead of a
+`Measurement` object per value, and operations on whole columns run as vectorized NumPy operations. Slicing rows
+with a slice gives a table of views of the same buffers, without copying them. Filtering with a boolean mask or
+taking rows by index copies the selected rows.
+
+Examples:
+    >>> from ucalcx import Measurement, Unit
+    >>> from ucalcx.common import MeasurementTable
+    >>> readings = MeasurementTable.from_records([
+    ...     {"distance": Measurement.from_string("1.5 km"), "time": Measurement.from_string("300 s")},
+    ...     {"distance": Measurement.from_string("800 m"), "time": Measurement.from_string("2 min")},
+    ... ])
+    >>> readings.convert_to({"time": Unit.from_string("min")})
+    MeasurementTable(2 rows, distance [km], time [min])
+    >>> readings.filter(readings["distance"] > Measurement.from_string("1 km")).to_records()
+    [{'distance': Measurement(1.5, kilometer (km)), 'time': Measurement(300.0, second (s))}]
+"""
+
+import numpy as np
+from typing import Iterable, Iterator, Mapping, Optional
+from .unit import Unit
+from .fundamental_unit import FundamentalQuantityUnit
+from .measurement import Measurement
+from .measurement_array import MeasurementArray
+from ..exceptions import InvalidValueError
+
+
+class MeasurementTable:
+    """ A table of measurements stored column by column, each column a `MeasurementArray` with its own unit.
+
+    Args:
+        columns (Mapping[str, MeasurementArray]): The columns of the table, by name. All columns must have the
+            same length. The arrays are stored as given, without copying their values.
+
+    Raises:
+        InvalidValueError: If the columns have different lengths.
+    """
+
+    def __init__(self, columns: Mapping[str, MeasurementArray]):
+        self.columns: dict[str, MeasurementArray] = dict(columns)
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise InvalidValueError(f"The columns of a table must have the same length, got lengths {sorted(lengths)}.")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Measurement]],
+                     units: Optional[Mapping[str, Unit | FundamentalQuantityUnit]] = None) -> "MeasurementTable":
+        """ Create a table from rows of measurements, like a list of dictionaries.
+
+        Every row must have a measurement for every column. The measurements of each column are converted to a
+        single unit, grouped by unit so each distinct unit is converted once.
+
+        Args:
+            records (Iterable[Mapping[str, Measurement]]): The rows of the table.
+            units (Optional[Mapping[str, Unit]]): The unit of each column. Defaults to the unit of the first
+                measurement of the column.
+
+        Raises:
+            InvalidValueError: If a row is missing a column.
+            IncompatibleUnitsError: If the measurements of a column cannot be converted to a single unit.
+        """
+
+        records = list(records)
+        names = list(records[0]) if records else list(units or {})
+        if not records and not names:
+            return cls({})
+        try:
+            values = {name: [record[name] for record in records] for name in names}
+        except KeyError as error:
+            raise InvalidValueError(f"Every row must have a measurement for the column {error.args[0]}.") from None
+        units = units or {}
+        return cls({name: MeasurementArray.from_measurements(column, units.get(name)) for name, column in values.items()})
+
+    def to_records(self) -> list[dict[str, Measurement]]:
+        """ Convert the table to a list of rows, each a dictionary of measurements by column name. """
+
+        columns = [column.to_measurements() for column in self.columns.values()]
+        return [dict(zip(self.columns, row)) for row in zip(*columns)]
+
+    @property
+    def names(self) -> list[str]:
+        """ The names of the columns. """
+
+        return list(self.columns)
+
+    @property
+    def units(self) -> dict[str, Unit]:
+        """ The unit of each column, by name. """
+
+        return {name: column.unit for name, column in self.columns.items()}
+
+    @property
+    def nbytes(self) -> int:
+        """ The number of bytes used by the values of the table. """
+
+        return sum(column.values.nbytes for column in self.columns.values())
+
+    def convert_to(self, units: Mapping[str, Unit | FundamentalQuantityUnit]) -> "MeasurementTable":
+        """ Convert columns to new units, each with one vectorized multiply and add. Other columns are shared.
+
+        Raises:
+            KeyError: If a column does not exist.
+            IncompatibleUnitsError: If a column cannot be converted to its new unit.
+        """
+
+        columns = dict(self.columns)
+        for name, unit in units.items():
+            columns[name] = self[name].convert_to(unit)
+        return MeasurementTable(columns)
+
+    def select(self, names: Iterable[str]) -> "MeasurementTable":
+        """ A table with some of the columns, in the given order, sharing their values. """
+
+        return MeasurementTable({name: self[name] for name in names})
+
+    def with_column(self, name: str, column: MeasurementArray) -> "MeasurementTable":
+        """ A table with a column added or replaced, sharing the values of the other columns. """
+
+        return MeasurementTable({**self.columns, name: column})
+
+    def filter(self, mask) -> "MeasurementTable":
+        """ The rows where a boolean mask is true, e.g. `table.filter(table["speed"] > limit)`. The rows are copied. """
+
+        mask = np.asarray(mask)
+        if mask.dtype != np.bool_ or mask.shape != (self._length,):
+            raise InvalidValueError(f"A filter must be a boolean array with one value per row, got {mask.dtype} with shape {mask.shape}.")
+        return self._take(mask)
+
+    def take(self, indices) -> "MeasurementTable":
+        """ The rows at the given positions, in the given order. The rows are copied. """
+
+        return self._take(np.asarray(indices, dtype=np.intp))
+
+    def _take(self, index) -> "MeasurementTable":
+        return MeasurementTable({name: MeasurementArray(column.values[index], column.unit) for name, column in self.columns.items()})
+
+    def sort_by(self, name: str, descending: bool = False) -> "MeasurementTable":
+        """ The rows sorted by a column, with a stable sort. The rows are copied. """
+
+        order = np.argsort(self[name].values, kind="stable")
+        return self.take(order[::-1] if descending else order)
+
+    def join(self, other: "MeasurementTable", on: str, how: str = "inner", suffix: str = "_right",
+             rtol: float = 1e-9) -> "MeasurementTable":
+        """ Join the rows of two tables that have equal values in a key column.
+
+        The key column of the other table is converted to the unit of this table's key column first. Keys are
+        equal when they differ by at most `rtol` times the key of this table, so keys that only differ by the
+        rounding of the conversion still match, e.g. 30000 cm converts to 0.30000000000000004 km and matches
+        0.3 km. Every pair of rows with equal keys is matched, in the order of the rows of this table, and then
+        of the other table.
+
+        Args:
+            other (MeasurementTable): The table to join with.
+            on (str): The name of the key column, in both tables.
+            how (str): `inner` to keep only the rows with a match, or `left` to keep every row of this table,
+                with NaN values in the columns of the other table where there is no match.
+            suffix (str): Appended to the names of columns of the other table that this table also has.
+            rtol (float): The largest difference between keys that are equal, relative to the key of this table.
+                Zero matches keys exactly.
+
+        Returns:
+            MeasurementTable: The joined table, with the columns of this table followed by those of the other.
+
+        Raises:
+            KeyError: If a table has no key column.
+            IncompatibleUnitsError: If the key columns cannot be converted to the same unit.
+            InvalidValueError: If `how` is not `inner` or `left`.
+        """
+
+        if how not in ("inner", "left"):
+            raise InvalidValueError(f"A join must be 'inner' or 'left', not {how!r}.")
+        keys = self[on].values
+        other_keys = other[on].convert_to(self[on].unit).values
+
+        # Find the run of equal keys in the sorted keys of the other table for every key of this table
+        order = np.argsort(other_keys, kind="stable")
+        sorted_keys = other_keys[order]
+        tolerance = np.abs(keys) * rtol
+        starts = np.searchsorted(sorted_keys, keys - tolerance, side="left")
+        counts = np.searchsorted(sorted_keys, keys + tolerance, side="right") - starts
+        missing = None
+        if how == "left":
+            missing = counts == 0
+            counts = np.where(missing, 1, counts)
+        rows = np.repeat(np.arange(len(keys)), counts)
+        # The position in the sorted keys of every match, the start of its run plus its position within the run
+        positions = np.repeat(starts, counts) + np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+        if missing is not None:
+            missing = np.repeat(missing, counts)
+            positions[missing] = 0
+
+        columns = {name: MeasurementArray(column.values[rows], column.unit) for name, column in self.columns.items()}
+        for name, column in other.columns.items():
+            if name == on:
+                continue
+            if len(order):
+                values = column.values[order[positions]]
+                if missing is not None:
+                    values[missing] = np.nan
+            else:
+                values = np.full(len(rows), np.nan)
+            columns[name + suffix if name in columns else name] = MeasurementArray(values, column.unit)
+        return MeasurementTable(columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __iter__(self) -> Iterator[dict[str, Measurement]]:
+        """ Iterate over the rows of the table, each a dictionary of measurements by column name. """
+
+        return iter(self.to_records())
+
+    def __getitem__(self, key):
+        """ Get a column by name, a row by position, or a table of the rows of a slice, which shares the values. """
+
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, (int, np.integer)):
+            return {name: column[key] for name, column in self.columns.items()}
+        if isinstance(key, slice):
+            return MeasurementTable({name: MeasurementArray(column.values[key], column.unit) for name, column in self.columns.items()})
+        return self.filter(key) if np.asarray(key).dtype == np.bool_ else self.take(key)
+
+    def __repr__(self) -> str:
+        columns = ", ".join(f"{name} [{column.unit.symbol}]" for name, column in self.columns.items())
+        return f"MeasurementTable({self._length} rows{', ' if columns else ''}{columns})"
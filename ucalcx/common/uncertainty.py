@@ -0,0 +1,400 @@
+""" Measurements that carry a standard uncertainty, propagated with first-order (linear) error rules.
+
+Uncertainties are treated as independent, and are propagated through arithmetic and conversions with the
+first-order rules, where for `z = f(x, y)` the uncertainty is `sqrt((df/dx * ux)^2 + (df/dy * uy)^2)`:
+
+- `x + y` and `x - y`: `sqrt(ux^2 + uy^2)`
+- `x * y`: `sqrt((y * ux)^2 + (x * uy)^2)`
+- `x / y`: `sqrt(ux^2 + (z * uy)^2) / |y|`
+- `x ^ n`: `|n * x^(n - 1)| * ux`
+- conversions, `x * scale + offset`: `|scale| * ux`
+
+The propagation functions work on floats and NumPy arrays alike, so `UncertainMeasurementArray` propagates the
+uncertainties of a whole batch in the same vectorized pass as its values. Both types reuse the cached conversion
+factors of `Unit.conversion_factors`, so tracking uncertainty costs a few extra multiplies per operation.
+
+Plain measurements combined with uncertain ones are treated as exact, and numbers as exact dimensionless values.
+
+Examples:
+    >>> from ucalcx import UncertainMeasurement
+    >>> from ucalcx.length import meter, centimeter
+    >>> from ucalcx.time_quantity import second
+    >>> distance = UncertainMeasurement(100, meter, 0.5)
+    >>> time = UncertainMeasurement(9.58, second, 0.01)
+    >>> distance / time
+    UncertainMeasurement(10.438413361169102 ± 0.05331731130989544, meter/second (m/s))
+    >>> distance.convert_to(centimeter)
+    UncertainMeasurement(10000.0 ± 50.0, centimeter (cm))
+"""
+
+import math
+import numpy as np
+from typing import Iterable, Optional
+from .unit import Unit
+from .measurement import Measurement
+from .measurement_array import MeasurementArray
+from ..exceptions import InvalidValueError
+
+
+def _root_sum_squares(first, second):
+    if isinstance(first, np.ndarray) or isinstance(second, np.ndarray):
+        # Accumulate in place, to avoid allocating a temporary array for every step
+        result = np.square(first)
+        result += np.square(second)
+        return np.sqrt(result, out=result)
+    return math.hypot(first, second)
+
+
+def propagate_sum(uncertainty, other_uncertainty, scale: float):
+    """ The uncertainty of `x + (y * scale + offset)` or `x - (y * scale + offset)`. """
+
+    return _root_sum_squares(uncertainty, other_uncertainty * scale)
+
+
+def propagate_product(value, uncertainty, other_value, other_uncertainty):
+    """ The uncertainty of `x * y`. """
+
+    return _root_sum_squares(other_value * uncertainty, value * other_uncertainty)
+
+
+def propagate_quotient(result, uncertainty, other_value, other_uncertainty):
+    """ The uncertainty of `z = x / y`. """
+
+    uncertainty = _root_sum_squares(uncertainty, result * other_uncertainty)
+    if isinstance(uncertainty, np.ndarray):
+        uncertainty /= np.abs(other_value)
+        return uncertainty
+    return uncertainty / abs(other_value)
+
+
+def propagate_power(value, uncertainty, power: int):
+    """ The uncertainty of `x ** power`. """
+
+    return abs(power * value ** (power - 1)) * uncertainty
+
+
+def _split(self, other) -> Optional[tuple]:
+    """ Split the other operand of an arithmetic operation into its value, uncertainty and unit.
+
+    Numbers are exact dimensionless values. Returns None for operands that are not numbers or measurements.
+    """
+
+    if isinstance(other, (int, float)):
+        return other, 0.0, Unit.from_fundamental_units()
+    if isinstance(other, (UncertainMeasurement, UncertainMeasurementArray)):
+        return other._magnitude(), other._uncertainty(), other.unit
+    if isinstance(other, Measurement):
+        return other.value, 0.0, other.unit
+    if isinstance(other, MeasurementArray):
+        return other.values, 0.0, other.unit
+    return None
+
+
+class UncertainMeasurement(Measurement):
+    """ A measurement with a standard uncertainty, in the same unit as its value.
+
+    Args:
+        value (float): The value of the measurement.
+        unit (Unit): The unit of the measurement.
+        uncertainty (float): The standard uncertainty of the value. Defaults to 0, an exact value.
+
+    Raises:
+        InvalidValueError: If the uncertainty is negative.
+
+    Examples:
+        >>> from ucalcx.length import meter
+        >>> UncertainMeasurement(2.5, meter, 0.1)
+        UncertainMeasurement(2.5 ± 0.1, meter (m))
+    """
+
+    __slots__ = ("uncertainty",)
+
+    def __init__(self, value: float, unit: Unit, uncertainty: float = 0.0):
+        super().__init__(value, unit)
+        if not uncertainty >= 0:
+            raise InvalidValueError(f"The uncertainty of a measurement must be non-negative, not {uncertainty}.")
+        self.uncertainty = uncertainty
+
+    @property
+    def relative_uncertainty(self) -> float:
+        """ The uncertainty relative to the magnitude of the value, infinite for a value of 0. """
+
+        return self.uncertainty / abs(self.value) if self.value else float("inf")
+
+    def _magnitude(self) -> float:
+        return self.value
+
+    def _uncertainty(self) -> float:
+        return self.uncertainty
+
+    def _result(self, value, uncertainty, unit: Unit):
+        if isinstance(value, np.ndarray):
+            # Combined with a MeasurementArray
+            return UncertainMeasurementArray._result(self, value, uncertainty, unit)
+        return UncertainMeasurement(value, unit, uncertainty)
+
+    def _normalized_uncertainty(self) -> float:
+        """ The uncertainty in SI base units, to compare with the magnitude of `normalized_key`. """
+
+        si_unit = Unit.from_fundamental_units(*((component["unit"].quantity.si_unit, component["power"])
+                                                for component in self.unit.components))
+        return self.uncertainty * abs(self.unit.conversion_factors(si_unit)[0])
+
+    def convert_to(self, other: Unit) -> "UncertainMeasurement":
+        """ Convert the measurement to a new unit, scaling its uncertainty by the conversion factor. """
+
+        scale, offset = self.unit.conversion_factors(other)
+        return UncertainMeasurement(self.value * scale + offset, other, self.uncertainty * abs(scale))
+
+    def __reduce__(self):
+        return (type(self), (self.value, self.unit, self.uncertainty))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        if self.normalized_key != other.normalized_key:
+            return False
+        if not isinstance(other, UncertainMeasurement):
+            return self.uncertainty == 0
+        if other.unit == self.unit:
+            return other.uncertainty == self.uncertainty
+        return other._normalized_uncertainty() == self._normalized_uncertainty()
+
+    # Equal measurements have equal normalized keys, so the hash of Measurement stays consistent with equality
+    __hash__ = Measurement.__hash__
+
+    def __add__(self, other):
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        scale, offset = unit.conversion_factors(self.unit)
+        return self._result(self._magnitude() + (value * scale + offset),
+                            propagate_sum(self._uncertainty(), uncertainty, abs(scale)), self.unit)
+
+    def __sub__(self, other):
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        scale, offset = unit.conversion_factors(self.unit)
+        return self._result(self._magnitude() - (value * scale + offset),
+                            propagate_sum(self._uncertainty(), uncertainty, abs(scale)), self.unit)
+
+    def __radd__(self, other):
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        scale, offset = self.unit.conversion_factors(unit)
+        return self._result(value + (self._magnitude() * scale + offset),
+                            propagate_sum(uncertainty, self._uncertainty(), abs(scale)), unit)
+
+    def __rsub__(self, other):
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        scale, offset = self.unit.conversion_factors(unit)
+        return self._result(value - (self._magnitude() * scale + offset),
+                            propagate_sum(uncertainty, self._uncertainty(), abs(scale)), unit)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return self._result(self._magnitude() * other, self._uncertainty() * abs(other), self.unit)
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        # Quantities shared by both units are converted to the units of the left-hand side
+        aligned = unit.aligned_with(self.unit)
+        scale, _ = unit.conversion_factors(aligned)
+        if scale != 1:
+            value, uncertainty = value * scale, uncertainty * abs(scale)
+        return self._result(self._magnitude() * value,
+                            propagate_product(self._magnitude(), self._uncertainty(), value, uncertainty), self.unit * aligned)
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)):
+            return self._result(self._magnitude() / other, self._uncertainty() / abs(other), self.unit)
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        aligned = unit.aligned_with(self.unit)
+        scale, _ = unit.conversion_factors(aligned)
+        if scale != 1:
+            value, uncertainty = value * scale, uncertainty * abs(scale)
+        result = self._magnitude() / value
+        return self._result(result, propagate_quotient(result, self._uncertainty(), value, uncertainty), self.unit / aligned)
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self * other
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        aligned = self.unit.aligned_with(unit)
+        scale, _ = self.unit.conversion_factors(aligned)
+        magnitude, own_uncertainty = self._magnitude(), self._uncertainty()
+        if scale != 1:
+            magnitude, own_uncertainty = magnitude * scale, own_uncertainty * abs(scale)
+        return self._result(value * magnitude,
+                            propagate_product(value, uncertainty, magnitude, own_uncertainty), unit * aligned)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)):
+            other = Measurement(other, Unit.from_fundamental_units())
+        split = _split(self, other)
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        aligned = self.unit.aligned_with(unit)
+        scale, _ = self.unit.conversion_factors(aligned)
+        magnitude, own_uncertainty = self._magnitude(), self._uncertainty()
+        if scale != 1:
+            magnitude, own_uncertainty = magnitude * scale, own_uncertainty * abs(scale)
+        result = value / magnitude
+        return self._result(result, propagate_quotient(result, uncertainty, magnitude, own_uncertainty), unit / aligned)
+
+    def __pow__(self, power: int):
+        if not isinstance(power, int):
+            raise InvalidValueError("Measurements can only be raised to integer powers.")
+        return self._result(self._magnitude() ** power, propagate_power(self._magnitude(), self._uncertainty(), power), self.unit ** power)
+
+    def __neg__(self):
+        return self._result(-self._magnitude(), self._uncertainty(), self.unit)
+
+    def __str__(self):
+        return f"{self.value} ± {self.uncertainty} {self.unit.symbol}"
+
+    def __repr__(self):
+        return f"UncertainMeasurement({self.value} ± {self.uncertainty}, {self.unit})"
+
+
+class UncertainMeasurementArray(MeasurementArray):
+    """ Many values with standard uncertainties that share a single unit, stored in contiguous float arrays.
+
+    Arithmetic and conversions propagate the uncertainties of the whole array with the same first-order rules as
+    `UncertainMeasurement`, in one vectorized pass.
+
+    Attributes:
+        values (np.ndarray): The values of the measurements.
+        uncertainties (np.ndarray): The standard uncertainties of the values.
+        unit (Unit): The unit shared by all of the values.
+
+    Raises:
+        InvalidValueError: If the uncertainties do not match the shape of the values, or any is negative.
+
+    Examples:
+        >>> from ucalcx.temperature import celsius, fahrenheit
+        >>> readings = UncertainMeasurementArray([20.0, 21.5], celsius, [0.2, 0.2])
+        >>> readings.convert_to(fahrenheit)
+        UncertainMeasurementArray([68.  70.7] ± [0.36 0.36], fahrenheit (°F))
+    """
+
+    def __init__(self, values: Iterable[float], unit: Unit, uncertainties: Optional[Iterable[float] | float] = None):
+        super().__init__(values, unit)
+        if uncertainties is None:
+            uncertainties = 0.0
+        self.uncertainties = np.broadcast_to(np.asarray(uncertainties, dtype=np.float64), self.values.shape).copy() \
+            if np.ndim(uncertainties) == 0 else np.asarray(uncertainties, dtype=np.float64)
+        if self.uncertainties.shape != self.values.shape:
+            raise InvalidValueError(f"Expected {self.values.shape} uncertainties, got {self.uncertainties.shape}.")
+        if not np.all(self.uncertainties >= 0):
+            raise InvalidValueError("The uncertainties of measurements must be non-negative.")
+
+    @classmethod
+    def from_measurements(cls, measurements: Iterable[Measurement], unit: Optional[Unit] = None) -> "UncertainMeasurementArray":
+        """ Create an array from a collection of measurements, converting them and their uncertainties to a single unit.
+
+        Plain measurements are stored with an uncertainty of 0.
+        """
+
+        measurements = list(measurements)
+        values = MeasurementArray.from_measurements(measurements, unit)
+        uncertainties = np.fromiter((getattr(measurement, "uncertainty", 0.0) * abs(measurement.unit.conversion_factors(values.unit)[0])
+                                     for measurement in measurements), dtype=np.float64, count=len(measurements))
+        return cls(values.values, values.unit, uncertainties)
+
+    def _magnitude(self) -> np.ndarray:
+        return self.values
+
+    def _uncertainty(self) -> np.ndarray:
+        return self.uncertainties
+
+    def _result(self, values, uncertainties, unit: Unit) -> "UncertainMeasurementArray":
+        array = UncertainMeasurementArray.__new__(UncertainMeasurementArray)
+        array.values, array.unit = np.asarray(values, dtype=np.float64), unit
+        array.uncertainties = np.broadcast_to(uncertainties, array.values.shape).astype(np.float64, copy=False)
+        return array
+
+    def to_measurements(self) -> list[UncertainMeasurement]:
+        """ Convert the array to a list of uncertain measurements. """
+
+        return [UncertainMeasurement(value, self.unit, uncertainty)
+                for value, uncertainty in zip(self.values.tolist(), self.uncertainties.tolist())]
+
+    def convert_to(self, other: Unit) -> "UncertainMeasurementArray":
+        """ Convert every value and uncertainty in the array to a new unit, with a single vectorized pass. """
+
+        scale, offset = self.unit.conversion_factors(other)
+        return self._result(self.values * scale + offset if offset else self.values * scale, self.uncertainties * abs(scale), other)
+
+    # The NumPy protocols of MeasurementArray would drop the uncertainties, so NumPy functions and ufuncs raise a
+    # TypeError instead, and binary operators with NumPy arrays fall back to the reflected methods below
+    __array_ufunc__ = None
+
+    def __array_function__(self, func, types, args, kwargs):
+        return NotImplemented
+
+    __add__ = UncertainMeasurement.__add__
+    __sub__ = UncertainMeasurement.__sub__
+    __radd__ = UncertainMeasurement.__radd__
+    __rsub__ = UncertainMeasurement.__rsub__
+    __truediv__ = UncertainMeasurement.__truediv__
+    __rtruediv__ = UncertainMeasurement.__rtruediv__
+    __pow__ = UncertainMeasurement.__pow__
+    __neg__ = UncertainMeasurement.__neg__
+
+    def __abs__(self):
+        return self._result(np.abs(self.values), self.uncertainties, self.unit)
+
+    def __mul__(self, other):
+        if isinstance(other, np.ndarray):
+            return self._result(self.values * other, self.uncertainties * np.abs(other), self.unit)
+        return UncertainMeasurement.__mul__(self, other)
+
+    def __rmul__(self, other):
+        if isinstance(other, np.ndarray):
+            return self * other
+        return UncertainMeasurement.__rmul__(self, other)
+
+    def __eq__(self, other) -> np.ndarray:
+        split = _split(self, other) if isinstance(other, (Measurement, MeasurementArray)) else None
+        if split is None:
+            return NotImplemented
+        value, uncertainty, unit = split
+        scale, offset = unit.conversion_factors(self.unit)
+        return (self.values == value * scale + offset) & (self.uncertainties == uncertainty * abs(scale))
+
+    def __ne__(self, other) -> np.ndarray:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else ~equal
+
+    def __iter__(self):
+        for value, uncertainty in zip(self.values.tolist(), self.uncertainties.tolist()):
+            yield UncertainMeasurement(value, self.unit, uncertainty)
+
+    def __getitem__(self, index) -> "UncertainMeasurement | UncertainMeasurementArray":
+        values = self.values[index]
+        if np.ndim(values) == 0:
+            return UncertainMeasurement(float(values), self.unit, float(self.uncertainties[index]))
+        return self._result(values, self.uncertainties[index], self.unit)
+
+    def __str__(self):
+        return f"{self.values} ± {self.uncertainties} {self.unit.symbol}"
+
+    def __repr__(self):
+        return f"UncertainMeasurementArray({self.values} ± {self.uncertainties}, {self.unit})"
@@ -1,6 +1,6 @@
 from .quantity import FundamentalQuantity
 from .fundamental_unit import FundamentalQuantityUnit
-from typing import Union, Self
+from typing import Optional, Union, Self
 from ..exceptions import IncompatibleUnitsError, InvalidUnitError, InvalidOperationError, InvalidValueError
 
 
@@ -8,11 +8,22 @@ DimensionValue = dict["unit": FundamentalQuantityUnit, "power": int]
 " A type alias for a dictionary that represents a dimension value in a unit. "
 
 
+_QUANTITY_ORDER = {quantity: index for index, quantity in enumerate(FundamentalQuantity)}
+" The position of every quantity in the FundamentalQuantity enum, the order of a unit's dimensionality. "
+
+_CONSTRUCTION_CACHE_SIZE = 4096
+" The most units kept by the cache of `Unit.from_fundamental_units` before it is cleared. "
+
+
 class Unit:
     """ A class that represents a unit of measurement.
 
+    Units are immutable, and two units made of the same fundamental units raised to the same powers are equal 
+    and hash the same, so units can be used as dictionary keys.
+
     Attributes:
-        dimension (dict[FundamentalQuantity: DimensionValue]): A dictionary that represents the dimensions of the unit.
+        dimension (dict[FundamentalQuantity: DimensionValue]): The fundamental unit and power of every quantity 
+            present in the unit. Quantities that are not part of the unit are left out.
 
     Examples:
         >>> from ucalcx.common import Unit
@@ -24,14 +35,36 @@ class Unit:
         Unit(length (m/km))
     """
 
-    def __init__(self, dimension: dict[FundamentalQuantity: DimensionValue]=dict()):
-        self.dimension: dict[FundamentalQuantity: DimensionValue] = dimension
-        self.dimension.update({quantity: {"unit": None, "power": 0} for quantity in FundamentalQuantity if quantity not in self.dimension})
+    __slots__ = ("dimension", "_components", "_terms", "_key", "_dimensionality")
+
+    _conversion_cache: dict[tuple, tuple[float, float]] = {}
+    " The scale and offset of every conversion computed so far, keyed by the components of both units. "
+
+    _construction_cache: dict[tuple, "Unit"] = {}
+    " The units built by `from_fundamental_units`, keyed by the class and the units and powers they were built from. "
+
+    def __init__(self, dimension: Optional[dict[FundamentalQuantity: DimensionValue]] = None):
+        # The values are copied too, so a unit never shares a dictionary that its caller may change later
+        self.dimension: dict[FundamentalQuantity: DimensionValue] = {} if dimension is None else {
+            quantity: {"unit": value["unit"], "power": value["power"]} for quantity, value in dimension.items()
+            if value["unit"] is not None and value["power"] != 0
+        }
+        self._components = list(self.dimension.values())
+        # The terms keep the order the unit was written in, for its name and symbol, while the key is sorted by
+        # quantity so that units like m*s and s*m compare and hash equal
+        self._terms = tuple((component["unit"], component["power"]) for component in self._components)
+        self._key = tuple(sorted(self._terms, key=lambda term: _QUANTITY_ORDER[term[0].quantity]))
+        self._dimensionality = tuple(sorted(((quantity, value["power"]) for quantity, value in self.dimension.items()),
+                                            key=lambda item: _QUANTITY_ORDER[item[0]]))
     
     @classmethod
     def from_fundamental_units(cls, *units_and_powers: tuple[FundamentalQuantityUnit, int]) -> Self:
         """ Create a new unit from a list of fundamental units and their powers. 
         
+        Powers of the same quantity are added together, keeping the first fundamental unit given for it. Units 
+        are cached per list of units and powers, so building the same unit again returns the same instance 
+        without checking the arguments again.
+
         Args:
             *units_and_powers (tuple[FundamentalQuantityUnit, int]): A list of tuples that contain a fundamental unit and a power.
             
@@ -50,23 +83,129 @@ class Unit:
             Unit(meter / second (m/s))
         """
 
+        key = (cls, units_and_powers)
+        try:
+            return Unit._construction_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments are never valid units or powers, they are reported by the checks below
+            key = None
+
         dimensions = {}
         for unit, power in units_and_powers:
             if not isinstance(unit, FundamentalQuantityUnit):
                 raise InvalidUnitError(f"{unit} is not a valid unit.")
             if not isinstance(power, int):
                 raise InvalidValueError(f"The power of a unit must be an integer, not {power} of type {type(power)}.")
-            if power == 0 and unit is not None:
-                dimensions[unit.quantity] = {"unit": None, "power": 0}
-            elif unit is not None and unit.quantity in dimensions:
+            if unit.quantity in dimensions:
                 dimensions[unit.quantity]["power"] += power
             else:
                 dimensions[unit.quantity] = {"unit": unit, "power": power}
-        return cls(dimensions)
+
+        unit = cls(dimensions)
+        if key is not None:
+            if len(Unit._construction_cache) >= _CONSTRUCTION_CACHE_SIZE:
+                Unit._construction_cache.clear()
+            # When threads build the same unit at once, the first one cached is returned to all of them
+            unit = Unit._construction_cache.setdefault(key, unit)
+        return unit
+
+    @classmethod
+    def from_string(cls, text: str) -> "Unit":
+        """ Parse a unit expression like `kg*m^2/s^3`, made of unit symbols or names, `*`, `/`, `^` and parentheses.
+
+        Parsed units are kept in a cache keyed on the string with its spacing normalized, so strings that
+        repeat, like the units in configuration files or CSV headers, are lexed once and always resolve to the 
+        same `Unit` instance. See `ucalcx.input.unit_cache_info` for the statistics of the cache.
+
+        Args:
+            text (str): The unit expression.
+
+        Returns:
+            Unit: The unit.
+
+        Raises:
+            InvalidUnitError: If the expression contains an unknown or ambiguous unit.
+            InvalidValueError: If the expression is malformed.
+
+        Examples:
+            >>> Unit.from_string("kg*m^2/s^3")
+            Unit(kilogram*meter^2/second^3 (kg*m^2/s^3))
+            >>> Unit.from_string("km / h") is Unit.from_string("km/h")
+            True
+        """
+
+        from ..input.parsing import parse_unit_cached
+        return parse_unit_cached(text)
+
+    @classmethod
+    def coerce(cls, unit: "Unit | FundamentalQuantityUnit") -> "Unit":
+        """ Get a unit as a `Unit`, wrapping a fundamental unit like `meter` in a unit of power 1.
+
+        Args:
+            unit (Unit | FundamentalQuantityUnit): The unit.
+
+        Returns:
+            Unit: The unit itself, or the unit of the fundamental unit.
+
+        Raises:
+            InvalidUnitError: If the unit is neither a `Unit` nor a `FundamentalQuantityUnit`.
+
+        Examples:
+            >>> from ucalcx.length import meter
+            >>> Unit.coerce(meter).symbol
+            'm'
+            >>> Unit.coerce(meter) is Unit.from_string("m")
+            True
+        """
+
+        if isinstance(unit, Unit):
+            return unit
+        if isinstance(unit, FundamentalQuantityUnit):
+            return Unit.from_fundamental_units((unit, 1,))
+        raise InvalidUnitError(f"{unit} is not a valid unit, has type {type(unit)}.")
 
     @property
-    def components(self) -> list[FundamentalQuantity]:
-        return [component for component in self.dimension.values() if component["unit"] is not None and component["power"] != 0]
+    def components(self) -> list[DimensionValue]:
+        """ The fundamental unit and power of every quantity in the unit. """
+
+        return self._components
+
+    @property
+    def key(self) -> tuple[tuple[FundamentalQuantityUnit, int], ...]:
+        """ The fundamental units and powers of the unit, in the order of their quantities in `FundamentalQuantity`.
+
+        This is the hashable value that units are compared by, so it does not depend on the order the unit was
+        written in, `meter * second` and `second * meter` have the same key.
+        
+        Examples:
+            >>> (meter / second).key
+            ((FQUnit(meter, m, FundamentalQuantity.Length), 1), (FQUnit(second, s, FundamentalQuantity.Time), -1))
+        """
+
+        return self._key
+
+    @property
+    def dimensionality(self) -> tuple[tuple[FundamentalQuantity, int], ...]:
+        """ The quantities and powers that make up the unit, independent of the units used for each quantity. 
+        
+        Two units with the same dimensionality measure the same kind of thing and can be converted between.
+
+        Examples:
+            >>> (meter / second).dimensionality
+            ((FundamentalQuantity.Length, 1), (FundamentalQuantity.Time, -1))
+        """
+
+        return self._dimensionality
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Unit):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     @property
     def name(self) -> str:
@@ -95,7 +234,7 @@ class Unit:
         return f"{'*'.join(numerator)}{'/' + '*'.join(denominator) if denominator else ''}".replace("-", "")
     
     def convert_to(self, other: "Unit", value: float) -> float:
-        """ Convert a value from this unit to another unit.
+        """ Convert a value from this unit to another unit, using the cached scale and offset of the conversion.
 
         Args:
             other (Unit): The unit to convert to.
@@ -116,28 +255,69 @@ class Unit:
             3.6
         """
 
-        if isinstance(other, FundamentalQuantityUnit):
-            if self.dimension[other.quantity] is None:
-                raise IncompatibleUnitsError(f"Cannot convert {self} to {other}. {other.quantity} is missing from the source unit.")
-            elif len(self.components) > 1:
-                raise IncompatibleUnitsError(f"Cannot convert {self} to {other}. The source unit has multiple components.")
-            elif self.dimension[other.quantity]["power"] != 1:
-                raise IncompatibleUnitsError(f"Cannot convert {self} to {other}. {self.dimension[other.quantity]} is not a fundamental unit, having a power of {self.dimension[other.quantity]['power']}.")
-            return self.dimension[other.quantity]["unit"].convert_to(other, value)
-        elif isinstance(other, Unit):
-            for component in self.components:
-                other_component = other.dimension[component["unit"].quantity]
-                if other_component is None:
-                    raise IncompatibleUnitsError(f"Cannot convert {self} to {other}. {component["unit"].quantity} is missing from the target unit.")
-                elif not component["unit"].can_convert_to(other_component["unit"]):
-                    raise IncompatibleUnitsError(f"Cannot convert {self} to {other}. {component["unit"].quantity} is incompatible.")
-                elif component["power"] != other_component["power"]:
-                    raise IncompatibleUnitsError(f"Cannot convert {self} to {other}. {component["unit"].quantity} has a power of {component["power"]} in the source unit and {other_component["power"]} in the target unit.")
-                value = component["unit"].convert_to(other_component["unit"], value)
-            return value
-        else:
-            raise InvalidUnitError(f"{other} is not a valid unit, has type {type(other)}.")
+        scale, offset = self.conversion_factors(other)
+        return value * scale + offset
+
+    def conversion_factors(self, other: "Unit") -> tuple[float, float]:
+        """ Get the scale and offset that convert values from this unit to another unit.
 
+        A value is converted with `value * scale + offset`. The scale is the product of the conversion factor of 
+        every component raised to the power of that component, e.g. the scale from m/s^2 to ft/min^2 is 
+        `(m -> ft) * (s -> min) ** -2`. The offset is only non-zero when both units are a single unit with an 
+        offset zero point like celsius and fahrenheit, raised to the power 1. Within a compound unit like J/°C 
+        only the size of the degree matters, so the offset is dropped.
+
+        The factors for each pair of units are computed once and cached, so converting many values costs a 
+        single multiply and add each, rather than a conversion per component.
+
+        Args:
+            other (Unit): The unit to convert to.
+
+        Returns:
+            tuple[float, float]: The scale and offset of the conversion.
+
+        Raises:
+            IncompatibleUnitsError: If the units are incompatible.
+            InvalidUnitError: If the other unit is not a valid unit.
+
+        Examples:
+            >>> from ucalcx.length import meter, kilometer
+            >>> Unit.from_fundamental_units((kilometer, 1)).conversion_factors(meter)
+            (1000.0, 0.0)
+            >>> (meter ** 2).conversion_factors(foot ** 2)
+            (10.763910416709722, 0.0)
+        """
+
+        other = Unit.coerce(other)
+        key = (self._key, other._key)
+        factors = Unit._conversion_cache.get(key)
+        if factors is None:
+            factors = Unit._conversion_cache.setdefault(key, self._compute_conversion_factors(other))
+        return factors
+
+    def _compute_conversion_factors(self, other: "Unit") -> tuple[float, float]:
+        """ Check that two units are compatible and compute the scale and offset between them. """
+
+        if self.dimensionality != other.dimensionality:
+            raise IncompatibleUnitsError(f"Cannot convert {self} to {other}, as they measure different quantities.")
+
+        components = self.components
+        if len(components) == 1 and components[0]["power"] == 1:
+            # A single unit is converted directly, this keeps offsets like celsius to fahrenheit correct
+            unit = components[0]["unit"]
+            return unit.conversion_factors(other.dimension[unit.quantity]["unit"])
+
+        scale = 1.0
+        for component in components:
+            unit = component["unit"]
+            factor, _ = unit.conversion_factors(other.dimension[unit.quantity]["unit"])
+            scale *= factor ** component["power"]
+        return scale, 0.0
+
+    def __reduce__(self):
+        """ Pickle the unit as its fundamental units and powers, rather than the full dimension dictionary. """
+
+        return (Unit.from_fundamental_units, self._terms)
 
     def __str__(self):
         return f"{self.name} ({self.symbol})"
@@ -155,21 +335,12 @@ class Unit:
             InvalidOperationError: If the other value is not a unit.
         """
 
-        new_unit = Unit(dict(self.dimension))
         if isinstance(other, FundamentalQuantityUnit):
-            for quantity in FundamentalQuantity:
-                if other.quantity == quantity:
-                    new_unit.dimension[quantity]["power"] = 1 + self.dimension[quantity]["power"]
-                    new_unit.dimension[quantity]["unit"] = other if self.dimension[quantity]["unit"] is None else self.dimension[quantity]["unit"]
-        elif isinstance(other, Unit):
-            for quantity in FundamentalQuantity:
-                if other.dimension[quantity]["unit"] is not None:
-                    new_unit.dimension[quantity]["unit"] = other.dimension[quantity]["unit"]
-                    new_unit.dimension[quantity]["power"] += other.dimension[quantity]["power"]
-        else:
-            raise InvalidOperationError("Cannot multiply a unit by a non-unit, has type {type(other)}, moving the unit to the right side of the multiplication operation, with a scalar value will result in a measurment object.")
+            other = Unit.from_fundamental_units((other, 1,))
+        elif not isinstance(other, Unit):
+            raise InvalidOperationError(f"Cannot multiply a unit by a non-unit, has type {type(other)}, moving the unit to the right side of the multiplication operation, with a scalar value will result in a measurment object.")
         
-        return new_unit
+        return self._combine(other, 1)
     
     def __truediv__(self, other: Union[FundamentalQuantityUnit, "Unit"]) -> "Unit":
         """ Divide the unit by another unit or a fundamental unit.
@@ -184,21 +355,82 @@ class Unit:
             InvalidOperationError: If the other value is not a unit.
         """
 
-        new_unit = Unit(dict(self.dimension))
         if isinstance(other, FundamentalQuantityUnit):
-            new_unit.dimension[other.quantity]["power"] -= 1
-        elif isinstance(other, Unit):
-            for quantity in FundamentalQuantity:
-                if other.dimension[quantity]["unit"] is not None:
-                    new_unit.dimension[quantity]["unit"] = other.dimension[quantity]["unit"]
-                    new_unit.dimension[quantity]["power"] -= other.dimension[quantity]["power"]
-                if new_unit.dimension[quantity]["power"] == 0:
-                    new_unit.dimension[quantity]["unit"] = None
-        else:
-            raise InvalidOperationError("Cannot multiply a unit by a non-unit, has type {type(other)}, moving the unit to the right side of the multiplication operation, with a scalar value will result in a measurment object.")
+            other = Unit.from_fundamental_units((other, 1,))
+        elif not isinstance(other, Unit):
+            raise InvalidOperationError(f"Cannot divide a unit by a non-unit, has type {type(other)}, moving the unit to the right side of the division operation, with a scalar value will result in a measurment object.")
         
-        return new_unit
+        return self._combine(other, -1)
+
+    def _combine(self, other: "Unit", sign: int) -> "Unit":
+        """ Multiply (sign 1) or divide (sign -1) this unit by another unit, without modifying either unit.
+        
+        Quantities present in both units keep the fundamental unit of this (the left-hand side) unit, and 
+        quantities whose powers cancel out are removed.
+        """
+
+        return Unit.from_fundamental_units(*self._terms, *((unit, sign * power) for unit, power in other._terms))
+
+    def aligned_with(self, other: "Unit") -> "Unit":
+        """ Get this unit with each quantity it shares with another unit expressed in the other unit's fundamental unit. 
+        
+        This is used when multiplying or dividing measurements, where shared quantities are converted to the 
+        units of the left-hand side before the values are combined.
+
+        Examples:
+            >>> (kilometer / second).aligned_with(meter * meter)
+            Unit(meter/second (m/s))
+        """
+
+        return Unit.from_fundamental_units(*((other.dimension.get(component["unit"].quantity, {}).get("unit") or component["unit"], component["power"]) 
+                                              for component in self.components))
     
+    def __pow__(self, power: int) -> "Unit":
+        """ Raise the unit to an integer power, multiplying the power of every component. 
+        
+        Args:
+            power (int): The power to raise the unit to.
+
+        Returns:
+            Unit: The new unit.
+
+        Raises:
+            InvalidValueError: If the power is not an integer.
+
+        Examples:
+            >>> (meter / second) ** 2
+            Unit(meter^2/second^2 (m^2/s^2))
+        """
+
+        if not isinstance(power, int):
+            raise InvalidValueError("The power of a unit must be an integer")
+        return Unit.from_fundamental_units(*((component["unit"], component["power"] * power) for component in self.components))
+
+    def root(self, degree: int) -> "Unit":
+        """ Take a root of the unit, dividing the power of every component by the degree of the root.
+
+        Args:
+            degree (int): The degree of the root, e.g. 2 for the square root.
+
+        Returns:
+            Unit: The new unit.
+
+        Raises:
+            InvalidValueError: If the degree is not a positive integer.
+            InvalidOperationError: If the power of a component is not divisible by the degree.
+
+        Examples:
+            >>> (meter ** 2).root(2)
+            Unit(meter (m))
+        """
+
+        if not isinstance(degree, int) or degree < 1:
+            raise InvalidValueError("The degree of the root of a unit must be a positive integer")
+        if any(power % degree for _, power in self._key):
+            raise InvalidOperationError(f"Cannot take the root of degree {degree} of {self.symbol}, the powers of its units "\
+                                        f"are not all divisible by {degree}.")
+        return Unit.from_fundamental_units(*((unit, power // degree) for unit, power in self._terms))
+
     def __rmul__(self, other: float | int) -> "Measurement":
         """ Multiply the unit by a scalar value.
         
@@ -3,6 +3,8 @@ from abc import abstractmethod, ABC
 
 class FundamentalCurrentUnit(FundamentalQuantityUnit, ABC):
     """ A base class for units of electric current. This class should not be instantiated directly. """
+
+    __slots__ = ()
     
     def __init__(self, name: str, symbol: str):
         super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Current)
@@ -20,6 +22,8 @@ class FundamentalCurrentUnit(FundamentalQuantityUnit, ABC):
 
 class Ampere(FundamentalCurrentUnit):
     """ Represents an ampere. """
+
+    __slots__ = ("metric_prefix",)
     
     def __init__(self, metric_prefix: MetricPrefix=MetricPrefix.Base):
         super().__init__(name="ampere", symbol="A")
@@ -39,6 +43,8 @@ class Ampere(FundamentalCurrentUnit):
     
 class Abampere(FundamentalCurrentUnit):
     """ Represents an abampere. """
+
+    __slots__ = ()
     
     def __init__(self):
         super().__init__(name="abampere", symbol="abA")
@@ -48,6 +54,8 @@ class Abampere(FundamentalCurrentUnit):
     
 class Statampere(FundamentalCurrentUnit):
     """ Represents a statampere. """
+
+    __slots__ = ()
     
     def __init__(self):
         super().__init__(name="statampere", symbol="statA")
@@ -32,4 +32,11 @@ class InvalidUnitError(UCalcXError):
     """ Raised when an invalid unit is passed to a function. """
     
     def __init__(self, message, *args, **kwargs):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+class CircularReferenceError(UCalcXError):
+    """ Raised when a worksheet cell would depend on itself, directly or through other cells. """
+    
+    def __init__(self, message, *args, **kwargs):
+        super().__init__(message)
@@ -0,0 +1,7 @@
+from .lexing import Lexer, Token, Vocabulary
+from .parsing import (Parser, parse_unit, parse_measurement, parse_unit_cached, parse_measurement_cached, normalize_unit_string,
+                      unit_cache_info, clear_unit_cache)
+
+
+__all__ = ["Lexer", "Token", "Vocabulary", "Parser", "parse_unit", "parse_measurement", "parse_unit_cached", "parse_measurement_cached",
+           "normalize_unit_string", "unit_cache_info", "clear_unit_cache"]
@@ -3,71 +3,90 @@ import re
 
 
 class Vocabulary:
-    NUMBER = re.compile(r"\d+((\.\d+)|(e\d+))?")  # 123, 123.456, 123e4
+    NUMBER = re.compile(r"(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?")  # 123, 123.456, .5, 123e4, 1.5e-3
     ADDOPS = re.compile(r"\+|-") # +, -
     MULOPS = re.compile(r"\*|/") # *, /
     LPAREN = re.compile(r"\(") # (
     RPAREN = re.compile(r"\)") # )
     POW = re.compile(r"\^") # ^
-    IDENTFIERS = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*") # x, y, z, x1, y2, z_3
+    IDENTIFIERS = re.compile(r"°?[^\W\d]\w*") # x, y, z, x1, y2, z_3, °C, μm
     WHITESPACE = re.compile(r"\s+")
     EOF = re.compile(r"\Z")
-    
+    KEYWORDS = [
+        re.compile(r"\b(sin|cos|tan)\b"), # sin, cos, tan
+        re.compile(r"\b(pi|e)\b"), # pi, e
+        re.compile(r"\b(sqrt|log|ln)\b"), # sqrt, log, ln
+        re.compile(r"\b(abs|ceil|floor)\b"), # abs, ceil, floor
+        re.compile(r"\b(min|max)\b"), # min, max
+        re.compile(r"\b(to|as)\b|->"), # to, as, ->
+    ]
+
     @property
     def keywords(self):
-        return [
-            re.compile(r"sin|cos|tan"), # sin, cos, tan
-            re.compile(r"pi|e"), # pi, e
-            re.compile(r"sqrt|log|ln"), # sqrt, log, ln
-            re.compile(r"abs|ceil|floor"), # abs, ceil, floor
-            re.compile(r"min|max"), # min, max
-            re.compile(r"to|as|->"), # to, as, ->
-        ]
+        return self.KEYWORDS
 
     @property
     def ignore(self):
         return [self.WHITESPACE]
-    
-    
+
+    @property
+    def tokens(self):
+        """ The token types of the vocabulary, and the patterns that match them, in the order they are tried. """
+
+        return [
+            ("NUMBER", self.NUMBER),
+            ("ADDOPS", self.ADDOPS),
+            ("MULOPS", self.MULOPS),
+            ("LPAREN", self.LPAREN),
+            ("RPAREN", self.RPAREN),
+            ("POW", self.POW),
+            ("IDENTIFIER", self.IDENTIFIERS),
+        ]
+
+
 class Token:
     def __init__(self, value: str, type: str = None):
         self.value = value
         self.type = type
-        
+
     def __str__(self):
         return f"Token({self.value, self.type})"
-    
+
     def __repr__(self):
         return str(self)
 
 
 class Lexer:
     def __init__(self, vocabulary: Vocabulary):
-        self.vcoabulary = vocabulary
-        
+        self.vocabulary = vocabulary
+
     def lex(self, input: str) -> list[Token]:
         tokens = []
-        while input:
-            for pattern in self.vcoabulary.ignore:
-                match = pattern.match(input)
+        ignore = self.vocabulary.ignore
+        keywords = self.vocabulary.keywords
+        patterns = self.vocabulary.tokens
+        position = 0
+        while position < len(input):
+            for pattern in ignore:
+                match = pattern.match(input, position)
                 if match:
-                    input = input[match.end():]
+                    position = match.end()
                     break
             else:
-                for pattern in self.vcoabulary.keywords:
-                    match = pattern.match(input)
+                for pattern in keywords:
+                    match = pattern.match(input, position)
                     if match:
                         tokens.append(Token(match.group(), "KEYWORD"))
-                        input = input[match.end():]
+                        position = match.end()
                         break
                 else:
-                    for pattern in self.vcoabulary.__annotations__.values():
-                        match = pattern.match(input)
+                    for type, pattern in patterns:
+                        match = pattern.match(input, position)
                         if match:
-                            tokens.append(Token(match.group(), pattern.pattern))
-                            input = input[match.end():]
+                            tokens.append(Token(match.group(), type))
+                            position = match.end()
                             break
                     else:
-                        raise ValueError(f"Unexpected character: {input[0]}")
+                        raise ValueError(f"Unexpected character: {input[position]}")
         return tokens
-        
\ No newline at end of file
+
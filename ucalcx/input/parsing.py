@@ -0,0 +1,219 @@
+import functools
+import re
+from typing import Optional
+from .lexing import Lexer, Token, Vocabulary
+from ..common import FundamentalQuantityUnit, Measurement, Unit
+from ..exceptions import InvalidUnitError, InvalidValueError
+
+
+CONVERSION_KEYWORDS = ("to", "as", "->")
+" The keywords that separate a measurement from the unit it should be converted to. "
+
+UNIT_CACHE_SIZE = 4096
+" The most unit strings kept by the cache of `parse_unit_cached`. "
+
+_parsed_units: dict[str, Unit] = {}
+" The unit of every string parsed so far, up to `UNIT_CACHE_SIZE`, and those loaded by `ucalcx.cache`. "
+
+_unit_cache_statistics = [0, 0]
+" The hits and misses of the unit string cache. "
+
+_OPERATOR_SPACING = re.compile(r"\s*([*/^()])\s*")
+_LEADING_NUMBER = re.compile(r"\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)(.*)", re.DOTALL)
+
+
+class Parser:
+    """ A recursive descent parser for unit expressions and measurements, built on the tokens of the `Lexer`.
+
+    Unit expressions are made of unit symbols or names, joined by `*` and `/`, raised to integer powers with `^`
+    and grouped with parentheses, e.g. `kg*m^2/s^3` or `1/(m*s)`. A measurement is a number followed by a unit
+    expression, e.g. `9.81 m/s^2`.
+
+    Args:
+        tokens (list[Token]): The tokens to parse.
+    """
+
+    def __init__(self, tokens: list[Token]):
+        self.tokens = tokens
+        self.position = 0
+
+    @classmethod
+    def from_string(cls, text: str) -> "Parser":
+        """ Lex a string and create a parser for its tokens. """
+
+        return cls(Lexer(Vocabulary()).lex(text))
+
+    def peek(self) -> Optional[Token]:
+        """ Get the next token without consuming it, or None at the end of the input. """
+
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def advance(self) -> Token:
+        """ Consume the next token. """
+
+        token = self.peek()
+        if token is None:
+            raise InvalidValueError("Unexpected end of input.")
+        self.position += 1
+        return token
+
+    def expect_end(self):
+        """ Raise an error if there are tokens left to parse. """
+
+        if self.peek() is not None:
+            raise InvalidValueError(f"Unexpected {self.peek().value} at token {self.position}.")
+
+    def at_conversion(self) -> bool:
+        """ Check if the next token is a conversion keyword like `to`. """
+
+        token = self.peek()
+        return token is not None and token.type == "KEYWORD" and token.value in CONVERSION_KEYWORDS
+
+    def parse_unit(self) -> Unit:
+        """ Parse a unit expression, factors joined by `*` and `/`. """
+
+        unit = self.parse_unit_factor()
+        while (token := self.peek()) is not None and token.type == "MULOPS":
+            self.advance()
+            factor = self.parse_unit_factor()
+            self._check_consistent(unit, factor)
+            unit = unit * factor if token.value == "*" else unit / factor
+        return unit
+
+    def parse_unit_factor(self) -> Unit:
+        """ Parse a single unit, a parenthesized unit expression, or a `1` numerator, raised to an optional power. """
+
+        token = self.advance()
+        if token.type == "LPAREN":
+            unit = self.parse_unit()
+            if self.advance().type != "RPAREN":
+                raise InvalidValueError("Expected a closing parenthesis.")
+        elif token.type == "NUMBER" and float(token.value) == 1:
+            unit = Unit.from_fundamental_units()
+        elif token.type in ("IDENTIFIER", "KEYWORD"):
+            # Keywords are allowed as units, so symbols like min (minute) can be used
+            unit = Unit.from_fundamental_units((FundamentalQuantityUnit.lookup(token.value), 1,))
+        else:
+            raise InvalidUnitError(f"Expected a unit, got {token.value}.")
+
+        if (token := self.peek()) is not None and token.type == "POW":
+            self.advance()
+            sign = 1
+            if self.peek() is not None and self.peek().type == "ADDOPS":
+                sign = -1 if self.advance().value == "-" else 1
+            exponent = self.advance()
+            if exponent.type != "NUMBER" or not exponent.value.isdigit():
+                raise InvalidValueError(f"The power of a unit must be an integer, not {exponent.value}.")
+            unit = unit ** (sign * int(exponent.value))
+        return unit
+
+    def parse_measurement(self) -> Measurement:
+        """ Parse a number followed by an optional unit expression. """
+
+        sign = 1
+        if self.peek() is not None and self.peek().type == "ADDOPS":
+            sign = -1 if self.advance().value == "-" else 1
+        token = self.advance()
+        if token.type != "NUMBER":
+            raise InvalidValueError(f"Expected a number, got {token.value}.")
+        value = sign * float(token.value)
+        if self.peek() is None or self.at_conversion():
+            return Measurement(value, Unit.from_fundamental_units())
+        return Measurement(value, self.parse_unit())
+
+    def parse_conversion(self) -> tuple[Measurement, Optional[Unit]]:
+        """ Parse a measurement, optionally followed by a conversion keyword and a target unit, e.g. `1500 m to km`. """
+
+        measurement = self.parse_measurement()
+        target = None
+        if self.at_conversion():
+            self.advance()
+            target = self.parse_unit()
+        self.expect_end()
+        return measurement, target
+
+    @staticmethod
+    def _check_consistent(left: Unit, right: Unit):
+        """ Ensure two parts of a unit expression don't use different units for the same quantity, e.g. `km*m`. """
+
+        for component in right.components:
+            other = left.dimension.get(component["unit"].quantity)
+            if other is not None and other["unit"] is not None and other["unit"] is not component["unit"]:
+                raise InvalidUnitError(f"A unit expression cannot combine {other['unit'].symbol} and {component['unit'].symbol}, "\
+                                       f"as they are different units of {component['unit'].quantity.quantity_name}.")
+
+
+def parse_unit(text: str) -> Unit:
+    """ Parse a unit expression like `kg*m^2/s^3`. """
+
+    parser = Parser.from_string(text)
+    unit = parser.parse_unit()
+    parser.expect_end()
+    return unit
+
+
+def parse_measurement(text: str) -> Measurement:
+    """ Parse a measurement like `9.81 m/s^2`. """
+
+    parser = Parser.from_string(text)
+    measurement = parser.parse_measurement()
+    parser.expect_end()
+    return measurement
+
+
+def normalize_unit_string(text: str) -> str:
+    """ Normalize the spacing of a unit expression, so `kg * m / s^2` and `kg*m/s^2` share a cache entry. """
+
+    return _OPERATOR_SPACING.sub(r"\1", " ".join(text.split()))
+
+
+def parse_unit_cached(text: str) -> Unit:
+    """ Parse a unit expression, caching the unit per string.
+
+    Strings are cached as given, and spelling variants that only differ in spacing resolve to the entry of their
+    normalized string, so every variant returns the same `Unit` instance and is only lexed and parsed once.
+
+    Examples:
+        >>> parse_unit_cached("kg * m / s^2") is parse_unit_cached("kg*m/s^2")
+        True
+    """
+
+    unit = _parsed_units.get(text)
+    if unit is not None:
+        _unit_cache_statistics[0] += 1
+        return unit
+    _unit_cache_statistics[1] += 1
+    normalized = normalize_unit_string(text)
+    unit = parse_unit_cached(normalized) if normalized != text else parse_unit(text)
+    if len(_parsed_units) < UNIT_CACHE_SIZE:
+        # When threads parse the same string at once, the first unit cached is returned to all of them
+        unit = _parsed_units.setdefault(text, unit)
+    return unit
+
+
+def parse_measurement_cached(text: str) -> Measurement:
+    """ Parse a measurement, reading the number directly and the unit expression through `parse_unit_cached`. """
+
+    match = _LEADING_NUMBER.match(text)
+    if match is None:
+        # Report the error with the position of the invalid token
+        return parse_measurement(text)
+    unit = match.group(2).strip()
+    return Measurement(float(match.group(1)), parse_unit_cached(unit) if unit else Unit.from_fundamental_units())
+
+
+def unit_cache_info() -> functools._CacheInfo:
+    """ Get the hits, misses and size of the unit string cache. 
+    
+    A spelling variant that is not cached yet counts as a miss for the variant and a hit for its normalized string.
+    """
+
+    hits, misses = _unit_cache_statistics
+    return functools._CacheInfo(hits, misses, UNIT_CACHE_SIZE, len(_parsed_units))
+
+
+def clear_unit_cache():
+    """ Empty the unit string cache and reset its statistics. """
+
+    _parsed_units.clear()
+    _unit_cache_statistics[:] = [0, 0]
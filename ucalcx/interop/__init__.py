@@ -0,0 +1,5 @@
+""" Integrations between ucalcx and other libraries.
+
+Each module in this package depends on an optional third party library, and is not imported by `ucalcx` itself.
+Import the module for the library you need directly, e.g. `import ucalcx.interop.pandas`.
+"""
@@ -0,0 +1,261 @@
+""" Apache Arrow and Parquet readers and writers that keep the unit of every column in the schema.
+
+The unit of a column is stored in the metadata of its Arrow field, as the registry key (quantity and unit name) and
+power of each of its fundamental units, so it survives a round trip through Parquet files and any other Arrow
+consumer. Reading a column gives a `MeasurementArray` that wraps the Arrow buffer without copying it where Arrow
+allows it. Columns can be converted on read, the conversion factors are resolved once per column, and applied
+with one vectorized multiply (and, for temperatures, one add) per record batch.
+
+This module requires pyarrow, which is not a dependency of ucalcx itself.
+
+Examples:
+    >>> from ucalcx import MeasurementArray
+    >>> from ucalcx.interop import arrow
+    >>> from ucalcx.length import meter, kilometer
+    >>> arrow.write_parquet("readings.parquet", {"distance": MeasurementArray([1500, 2500], meter)})
+    >>> arrow.read_parquet("readings.parquet", units={"distance": kilometer})
+    {'distance': MeasurementArray([1.5 2.5], kilometer (km))}
+"""
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as error:
+    raise ImportError("ucalcx.interop.arrow requires pyarrow, install it with `pip install ucalcx[arrow]`.") from error
+import json
+from typing import Iterable, Iterator, Mapping, Optional
+from ..common import MeasurementArray, Unit, FundamentalQuantityUnit
+from ..common.fundamental_unit import _restore_unit
+from ..exceptions import InvalidUnitError
+
+
+UNIT_METADATA_KEY = b"ucalcx.unit"
+" The key of the unit of a column in the metadata of its Arrow field. "
+
+SYMBOL_METADATA_KEY = b"ucalcx.symbol"
+" The key of the symbol of the unit of a column, stored for readers that do not use ucalcx. "
+
+Units = Mapping[str, Unit | FundamentalQuantityUnit]
+" The units to convert columns to on read, by column name. "
+
+
+def serialize_unit(unit: Unit | FundamentalQuantityUnit) -> bytes:
+    """ Serialize a unit as a JSON list of the quantity, unit name and power of each of its fundamental units.
+
+    Examples:
+        >>> serialize_unit(meter / second)
+        b'[["Length", "meter", 1], ["Time", "second", -1]]'
+    """
+
+    return json.dumps([[*unit.registry_key, power] for unit, power in Unit.coerce(unit)._terms]).encode()
+
+
+def deserialize_unit(data: bytes) -> Unit:
+    """ Deserialize a unit serialized with `serialize_unit`.
+
+    Raises:
+        InvalidUnitError: If the data is malformed, or names a unit that is not registered and is not a prefixed
+            unit of a registered unit class.
+    """
+
+    try:
+        # Units are resolved like unpickled units, so prefixes that this process has not constructed yet still resolve
+        return Unit.from_fundamental_units(*((_restore_unit(quantity, name), power) for quantity, name, power in json.loads(data)))
+    except (ValueError, TypeError):
+        raise InvalidUnitError(f"{data!r} is not a serialized unit.") from None
+
+
+def field(name: str, unit: Unit | FundamentalQuantityUnit, type: pa.DataType = pa.float64()) -> pa.Field:
+    """ Create an Arrow field that records the unit of its values. """
+
+    return pa.field(name, type, metadata={UNIT_METADATA_KEY: serialize_unit(unit), SYMBOL_METADATA_KEY: Unit.coerce(unit).symbol.encode()})
+
+
+def field_unit(field: pa.Field) -> Optional[Unit]:
+    """ The unit recorded in an Arrow field, or None if the field has no unit. """
+
+    metadata = field.metadata or {}
+    if UNIT_METADATA_KEY not in metadata:
+        return None
+    return deserialize_unit(metadata[UNIT_METADATA_KEY])
+
+
+def with_units(table: pa.Table, units: Units) -> pa.Table:
+    """ Record the units of columns of an existing table in its schema, without touching the values.
+
+    Raises:
+        KeyError: If a column does not exist.
+    """
+
+    schema = table.schema
+    for name, unit in units.items():
+        index = schema.get_field_index(name)
+        if index < 0:
+            raise KeyError(f"The table has no column named {name}.")
+        schema = schema.set(index, field(name, unit, schema.field(index).type))
+    return pa.Table.from_arrays(table.columns, schema=schema)
+
+
+def to_table(columns: Mapping[str, MeasurementArray]) -> pa.Table:
+    """ Create an Arrow table from measurement arrays, the values are wrapped without copying them. """
+
+    arrays = [pa.array(column.values) for column in columns.values()]
+    schema = pa.schema([field(name, column.unit) for name, column in columns.items()])
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _conversions(schema: pa.Schema, units: Optional[Units]) -> dict[int, tuple[Unit, float, float]]:
+    """ The target unit, scale and offset of every column of a schema that is converted on read. """
+
+    conversions = {}
+    for name, unit in (units or {}).items():
+        index = schema.get_field_index(name)
+        if index < 0:
+            raise KeyError(f"The table has no column named {name}.")
+        source = field_unit(schema.field(index))
+        if source is None:
+            raise InvalidUnitError(f"The column {name} has no unit, and cannot be converted to {Unit.coerce(unit).symbol}.")
+        unit = Unit.coerce(unit)
+        conversions[index] = (unit, *source.conversion_factors(unit))
+    return conversions
+
+
+def _converted_schema(schema: pa.Schema, conversions: dict[int, tuple[Unit, float, float]]) -> pa.Schema:
+    for index, (unit, _, _) in conversions.items():
+        schema = schema.set(index, field(schema.field(index).name, unit))
+    return schema
+
+
+def _convert_array(array: pa.Array, scale: float, offset: float) -> pa.Array:
+    """ Apply a conversion to an Arrow array, with one vectorized multiply and add. Missing values stay missing. """
+
+    array = array.cast(pa.float64())
+    if scale != 1:
+        array = pc.multiply(array, pa.scalar(scale))
+    if offset:
+        array = pc.add(array, pa.scalar(offset))
+    return array
+
+
+def convert_batch(batch: pa.RecordBatch, units: Units) -> pa.RecordBatch:
+    """ Convert columns of a record batch to new units.
+
+    Args:
+        batch (pa.RecordBatch): The record batch, with the units of the converted columns in its schema.
+        units (Mapping[str, Unit]): The unit to convert each column to, by column name.
+
+    Returns:
+        pa.RecordBatch: The converted record batch, with the new units in its schema.
+
+    Raises:
+        KeyError: If a column does not exist.
+        InvalidUnitError: If a converted column has no unit.
+        IncompatibleUnitsError: If a column cannot be converted to its new unit.
+    """
+
+    conversions = _conversions(batch.schema, units)
+    return _convert_batch(batch, conversions, _converted_schema(batch.schema, conversions))
+
+
+def _convert_batch(batch: pa.RecordBatch, conversions: dict[int, tuple[Unit, float, float]], schema: pa.Schema) -> pa.RecordBatch:
+    arrays = list(batch.columns)
+    for index, (_, scale, offset) in conversions.items():
+        arrays[index] = _convert_array(arrays[index], scale, offset)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def convert_table(table: pa.Table, units: Units) -> pa.Table:
+    """ Convert columns of a table to new units, one vectorized multiply per chunk. See `convert_batch`. """
+
+    conversions = _conversions(table.schema, units)
+    columns = list(table.columns)
+    for index, (_, scale, offset) in conversions.items():
+        columns[index] = pa.chunked_array([_convert_array(chunk, scale, offset) for chunk in columns[index].chunks], pa.float64())
+    return pa.Table.from_arrays(columns, schema=_converted_schema(table.schema, conversions))
+
+
+def to_measurement_arrays(table: pa.Table) -> dict[str, MeasurementArray]:
+    """ Get the columns of a table that have a unit as measurement arrays.
+
+    A column stored in a single chunk of float64 values without missing values is wrapped without copying it, the
+    resulting array is read-only. Other columns are copied, with missing values as NaN. Columns without a unit
+    are left out.
+    """
+
+    arrays = {}
+    for field_, column in zip(table.schema, table.columns):
+        unit = field_unit(field_)
+        if unit is None:
+            continue
+        chunk = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        values = chunk.cast(pa.float64()).to_numpy(zero_copy_only=False)
+        arrays[field_.name] = MeasurementArray(values, unit)
+    return arrays
+
+
+def write_parquet(where, columns: Mapping[str, MeasurementArray] | pa.Table, **kwargs):
+    """ Write measurement arrays, or an Arrow table with units in its schema, to a Parquet file.
+
+    Args:
+        where: The path or file-like object to write to.
+        columns (Mapping[str, MeasurementArray] | pa.Table): The columns to write.
+        **kwargs: Passed to `pyarrow.parquet.write_table`, e.g. `compression`.
+    """
+
+    table = columns if isinstance(columns, pa.Table) else to_table(columns)
+    pq.write_table(table, where, **kwargs)
+
+
+def read_table(source, units: Optional[Units] = None, columns: Optional[Iterable[str]] = None) -> pa.Table:
+    """ Read a Parquet file into an Arrow table, converting columns to new units on read. See `convert_table`. """
+
+    table = pq.read_table(source, columns=list(columns) if columns is not None else None)
+    return convert_table(table, units) if units else table
+
+
+def read_parquet(source, units: Optional[Units] = None, columns: Optional[Iterable[str]] = None) -> dict[str, MeasurementArray]:
+    """ Read the columns of a Parquet file that have a unit into measurement arrays.
+
+    Args:
+        source: The path or file-like object to read from.
+        units (Optional[Mapping[str, Unit]]): The unit to convert each column to on read, by column name. Other
+            columns keep the unit they were written with.
+        columns (Optional[Iterable[str]]): The columns to read. Defaults to all of them.
+
+    Returns:
+        dict[str, MeasurementArray]: The columns that have a unit, by name.
+
+    Raises:
+        KeyError: If a converted column does not exist.
+        InvalidUnitError: If a converted column has no unit, or its unit is not registered.
+        IncompatibleUnitsError: If a column cannot be converted to its new unit.
+    """
+
+    return to_measurement_arrays(read_table(source, units, columns))
+
+
+def iter_batches(source, units: Optional[Units] = None, columns: Optional[Iterable[str]] = None,
+                 batch_size: int = 65536) -> Iterator[pa.RecordBatch]:
+    """ Stream the record batches of a Parquet file, converting columns to new units as each batch is read.
+
+    The conversion factors are resolved once from the file's schema, each batch then costs one vectorized
+    multiply (and add, for temperatures) per converted column.
+
+    Args:
+        source: The path or file-like object to read from.
+        units (Optional[Mapping[str, Unit]]): The unit to convert each column to, by column name.
+        columns (Optional[Iterable[str]]): The columns to read. Defaults to all of them.
+        batch_size (int): The largest number of rows in a batch.
+
+    Yields:
+        pa.RecordBatch: The converted record batches.
+    """
+
+    parquet = pq.ParquetFile(source)
+    conversions, schema = None, None
+    for batch in parquet.iter_batches(batch_size=batch_size, columns=list(columns) if columns is not None else None):
+        if conversions is None:
+            conversions = _conversions(batch.schema, units)
+            schema = _converted_schema(batch.schema, conversions)
+        yield _convert_batch(batch, conversions, schema) if conversions else batch
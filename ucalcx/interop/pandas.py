@@ -0,0 +1,456 @@
+""" A pandas extension dtype for columns of measurements that share a single unit.
+
+A `UnitArray` stores its values in a float64 numpy array and its unit once, in its `UnitDtype`, so tracking
+the unit of a column costs nothing per row. Arithmetic between columns propagates units with the same rules
+as `Unit.__mul__` and `Unit.__truediv__`, and reductions and groupby aggregations run on the float values.
+
+This module requires pandas, which is not a dependency of ucalcx itself.
+
+Examples:
+    >>> import pandas as pd
+    >>> from ucalcx.interop.pandas import UnitArray, UnitDtype
+    >>> from ucalcx.length import meter, kilometer
+    >>> distances = pd.Series(UnitArray([1500, 2500], meter))
+    >>> distances.astype(UnitDtype(kilometer))
+    0    1.5
+    1    2.5
+    dtype: unit[km]
+    >>> pd.Series([10, 20], dtype="unit[m/s]")
+    0    10.0
+    1    20.0
+    dtype: unit[m/s]
+"""
+
+try:
+    import pandas as pd
+except ImportError as error:
+    raise ImportError("ucalcx.interop.pandas requires pandas, install it with `pip install ucalcx[pandas]`.") from error
+import numbers
+import operator
+import numpy as np
+from typing import Any, Iterable, Optional, Sequence
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype, register_series_accessor, take
+from ..common import Measurement, MeasurementArray, Unit
+from ..exceptions import UCalcXError
+
+_GROUPBY_AGGREGATIONS = frozenset(["sum", "mean", "median", "min", "max", "first", "last", "std", "var", "sem"])
+" Groupby aggregations computed with NumPy on the float values, any other is left to the generic pandas path. "
+
+_GROUPBY_ACCUMULATIONS = {"cumsum": (np.add, np.add), "cummin": (np.fmin, np.minimum), "cummax": (np.fmax, np.maximum)}
+" Groupby transforms, with the ufuncs that accumulate them skipping and propagating missing values. "
+
+
+def _group_aggregate(values: np.ndarray, ids: np.ndarray, ngroups: int, how: str, *, min_count: int = -1, skipna: bool = True, ddof: int = 1) -> np.ndarray:
+    """ Aggregate the values of each group, rows with a negative id belong to no group. """
+
+    grouped = ids >= 0
+    values, ids = values[grouped], ids[grouped]
+    present = ~np.isnan(values)
+    missing = np.bincount(ids[~present], minlength=ngroups)
+    values, ids = values[present], ids[present]
+    counts = np.bincount(ids, minlength=ngroups)
+
+    if how in ("first", "last"):
+        order = slice(None) if how == "first" else slice(None, None, -1)
+        groups, index = np.unique(ids[order], return_index=True)
+        result = np.full(ngroups, np.nan)
+        result[groups] = values[order][index]
+    elif how in ("min", "max"):
+        result = np.full(ngroups, np.inf if how == "min" else -np.inf)
+        (np.minimum if how == "min" else np.maximum).at(result, ids, values)
+    elif how == "median":
+        # Sorted by group and then by value, with a trailing NaN for the lookups of empty groups
+        ordered = np.append(values[np.lexsort((values, ids))], np.nan)
+        starts = np.cumsum(counts) - counts
+        result = (ordered[starts + (counts - 1) // 2] + ordered[starts + counts // 2]) / 2
+    else:
+        sums = np.bincount(ids, weights=values, minlength=ngroups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+            if how == "sum":
+                result = sums
+            elif how == "mean":
+                result = means
+            else:
+                squares = np.bincount(ids, weights=(values - means[ids]) ** 2, minlength=ngroups)
+                result = np.where(counts > ddof, squares / (counts - ddof), np.nan)
+                if how != "var":
+                    result = np.sqrt(result) if how == "std" else np.sqrt(result / counts)
+
+    if how != "sum":
+        result[counts == 0] = np.nan
+    if not skipna:
+        result[missing > 0] = np.nan
+    if min_count > 0:
+        result[counts < min_count] = np.nan
+    return result
+
+
+def _group_positions(values: np.ndarray, ids: np.ndarray, ngroups: int, how: str) -> np.ndarray:
+    """ The position of the first smallest or largest present value in each group, or -1 for a group without any. """
+
+    positions = np.flatnonzero((ids >= 0) & ~np.isnan(values))
+    keys = values[positions] if how == "idxmin" else -values[positions]
+    order = positions[np.lexsort((positions, keys, ids[positions]))]
+    groups, index = np.unique(ids[order], return_index=True)
+    result = np.full(ngroups, -1, dtype=np.intp)
+    result[groups] = order[index]
+    return result
+
+
+def _group_accumulate(values: np.ndarray, ids: np.ndarray, how: str, *, skipna: bool = True) -> np.ndarray:
+    """ Accumulate the values within each group, in the order of the rows. Rows with a negative id are NaN. """
+
+    skipping, propagating = _GROUPBY_ACCUMULATIONS[how]
+    accumulate = skipping if skipna else propagating
+    missing = np.isnan(values)
+    if skipna and how == "cumsum":
+        values = np.where(missing, 0.0, values)
+    result = np.full(len(values), np.nan)
+    order = np.argsort(ids, kind="stable")
+    for positions in np.split(order, np.flatnonzero(np.diff(ids[order])) + 1):
+        if len(positions) and ids[positions[0]] >= 0:
+            result[positions] = accumulate.accumulate(values[positions])
+    if skipna:
+        result[missing] = np.nan
+    return result
+
+
+@register_extension_dtype
+class UnitDtype(ExtensionDtype):
+    """ The dtype of a column of measurements in a single unit.
+
+    Args:
+        unit (Unit | str): The unit of the values in the column, or a unit expression like `m/s`.
+    """
+
+    type = Measurement
+    kind = "f"
+    na_value = np.nan
+    _metadata = ("_unit_key",)
+
+    def __init__(self, unit: Optional[Unit | str] = None):
+        if isinstance(unit, str):
+            unit = Unit.from_string(unit)
+        self.unit = Unit.coerce(unit) if unit is not None else Unit.from_fundamental_units()
+
+    @property
+    def _unit_key(self) -> tuple:
+        return self.unit.key
+
+    @property
+    def name(self) -> str:
+        return f"unit[{self.unit.symbol}]"
+
+    @property
+    def _is_numeric(self) -> bool:
+        return True
+
+    @classmethod
+    def construct_array_type(cls) -> "type[UnitArray]":
+        return UnitArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> "UnitDtype":
+        if not isinstance(string, str):
+            raise TypeError(f"'construct_from_string' expects a string, got {type(string)}")
+        if string == "unit[]":
+            return cls()
+        if string.startswith("unit[") and string.endswith("]"):
+            try:
+                return cls(Unit.from_string(string[5:-1]))
+            except UCalcXError as error:
+                raise TypeError(f"Cannot construct a 'UnitDtype' from '{string}', {error}") from None
+        raise TypeError(f"Cannot construct a 'UnitDtype' from '{string}'")
+
+    def _get_common_dtype(self, dtypes: list) -> Optional["UnitDtype"]:
+        """ Columns of the same dimensionality combine into the unit of the first column. """
+
+        if all(isinstance(dtype, UnitDtype) and dtype.unit.dimensionality == self.unit.dimensionality for dtype in dtypes):
+            return dtypes[0]
+        return None
+
+
+class UnitArray(ExtensionArray):
+    """ A pandas extension array of measurements that share a single unit.
+
+    Args:
+        values (Iterable[float]): The values of the measurements, missing values are stored as NaN.
+        unit (Unit): The unit of the values.
+    """
+
+    def __init__(self, values: Iterable[float], unit: Unit):
+        self._values = np.asarray(values, dtype=np.float64)
+        self._dtype = unit if isinstance(unit, UnitDtype) else UnitDtype(unit)
+
+    @classmethod
+    def from_measurement_array(cls, array: MeasurementArray) -> "UnitArray":
+        """ Wrap the values of a measurement array, without copying them. """
+
+        return cls(array.values, array.unit)
+
+    def to_measurement_array(self) -> MeasurementArray:
+        """ Get the values of this array as a measurement array, without copying them. """
+
+        return MeasurementArray(self._values, self.unit)
+
+    @property
+    def unit(self) -> Unit:
+        """ The unit of the values in the array. """
+
+        return self._dtype.unit
+
+    def convert_to(self, unit: Unit) -> "UnitArray":
+        """ Convert every value in the array to a new unit, with a single vectorized multiply and add. """
+
+        return UnitArray.from_measurement_array(self.to_measurement_array().convert_to(unit))
+
+    # Construction
+
+    @classmethod
+    def _from_sequence(cls, scalars: Sequence[Any], *, dtype: Optional[UnitDtype] = None, copy: bool = False) -> "UnitArray":
+        unit = dtype.unit if isinstance(dtype, UnitDtype) else None
+        if isinstance(scalars, UnitArray):
+            array = scalars.convert_to(unit) if unit is not None else scalars
+            return array.copy() if copy else array
+        if isinstance(scalars, MeasurementArray):
+            array = cls.from_measurement_array(scalars.convert_to(unit) if unit is not None else scalars)
+            return array.copy() if copy else array
+
+        scalars = list(scalars)
+        positions = [index for index, scalar in enumerate(scalars) if isinstance(scalar, Measurement)]
+        if unit is None:
+            if not positions:
+                raise TypeError("Cannot infer the unit of a UnitArray from values without units, pass a UnitDtype.")
+            unit = scalars[positions[0]].unit
+        values = np.array([np.nan if scalar is None or scalar is pd.NA else scalar for scalar in scalars], dtype=object)
+        if positions:
+            values[positions] = MeasurementArray.from_measurements([scalars[index] for index in positions], unit).values
+        return cls(values.astype(np.float64), unit)
+
+    @classmethod
+    def _from_factorized(cls, values: np.ndarray, original: "UnitArray") -> "UnitArray":
+        return cls(values, original.unit)
+
+    # Array interface
+
+    @property
+    def dtype(self) -> UnitDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._values.nbytes
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, item):
+        if isinstance(item, numbers.Integral):
+            value = self._values[item]
+            return self._dtype.na_value if np.isnan(value) else Measurement(float(value), self.unit)
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return UnitArray(self._values[item], self._dtype)
+
+    def __setitem__(self, key, value):
+        if isinstance(value, (Measurement, MeasurementArray)):
+            value = value.unit.convert_to(self.unit, value.value) if isinstance(value, Measurement) else value.convert_to(self.unit).values
+        elif isinstance(value, UnitArray):
+            value = value.convert_to(self.unit)._values
+        self._values[key] = value
+
+    def isna(self) -> np.ndarray:
+        return np.isnan(self._values)
+
+    def take(self, indices: Sequence[int], *, allow_fill: bool = False, fill_value: Any = None) -> "UnitArray":
+        if allow_fill and fill_value is not None and not (isinstance(fill_value, float) and np.isnan(fill_value)):
+            fill_value = fill_value.unit.convert_to(self.unit, fill_value.value) if isinstance(fill_value, Measurement) else fill_value
+        result = take(self._values, indices, allow_fill=allow_fill, fill_value=np.nan if fill_value is None else fill_value)
+        return UnitArray(result, self._dtype)
+
+    def copy(self) -> "UnitArray":
+        return UnitArray(self._values.copy(), self._dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["UnitArray"]) -> "UnitArray":
+        unit = to_concat[0].unit
+        return cls(np.concatenate([array.convert_to(unit)._values for array in to_concat]), unit)
+
+    def astype(self, dtype, copy: bool = True):
+        if isinstance(dtype, UnitDtype):
+            return self.convert_to(dtype.unit)
+        return super().astype(dtype, copy=copy)
+
+    def to_numpy(self, dtype=None, copy: bool = False, na_value=pd.api.extensions.no_default) -> np.ndarray:
+        """ Get the float values of the array, without copying them unless a copy is requested. """
+
+        values = self._values
+        if na_value is not pd.api.extensions.no_default and not pd.isna(na_value):
+            values = np.where(np.isnan(values), na_value, values)
+        if copy:
+            return np.array(values, dtype=dtype)
+        # NumPy 2 raises for copy=False when the dtype needs a copy, asarray only copies when it has to
+        return np.asarray(values, dtype=dtype)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self._values, dtype=dtype)
+        return np.asarray(self._values, dtype=dtype)
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, float]:
+        return self._values, np.nan
+
+    def _formatter(self, boxed: bool = False):
+        symbol = self.unit.symbol
+        return lambda value: "NaN" if not isinstance(value, Measurement) else f"{value.value} {symbol}"
+
+    # Comparisons and arithmetic
+
+    def _other_values(self, other) -> Any:
+        """ Convert the other operand of a comparison to the unit of this array. """
+
+        if isinstance(other, UnitArray):
+            return other.convert_to(self.unit)._values
+        if isinstance(other, MeasurementArray):
+            return other.convert_to(self.unit).values
+        if isinstance(other, Measurement):
+            return other.unit.convert_to(self.unit, other.value)
+        return other
+
+    def __eq__(self, other) -> np.ndarray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return self._values == self._other_values(other)
+
+    def __ne__(self, other) -> np.ndarray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return self._values != self._other_values(other)
+
+    def __lt__(self, other) -> np.ndarray:
+        return self._values < self._other_values(other)
+
+    def __le__(self, other) -> np.ndarray:
+        return self._values <= self._other_values(other)
+
+    def __gt__(self, other) -> np.ndarray:
+        return self._values > self._other_values(other)
+
+    def __ge__(self, other) -> np.ndarray:
+        return self._values >= self._other_values(other)
+
+    def _arithmetic(self, other, op) -> "UnitArray":
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, UnitArray):
+            other = other.to_measurement_array()
+        return UnitArray.from_measurement_array(op(self.to_measurement_array(), other))
+
+    def __add__(self, other) -> "UnitArray":
+        return self._arithmetic(other, operator.add)
+
+    def __sub__(self, other) -> "UnitArray":
+        return self._arithmetic(other, operator.sub)
+
+    def __mul__(self, other) -> "UnitArray":
+        return self._arithmetic(other, operator.mul)
+
+    def __rmul__(self, other) -> "UnitArray":
+        return self._arithmetic(other, lambda array, scalar: scalar * array)
+
+    def __truediv__(self, other) -> "UnitArray":
+        return self._arithmetic(other, operator.truediv)
+
+    def __rtruediv__(self, other) -> "UnitArray":
+        return self._arithmetic(other, lambda array, scalar: scalar / array)
+
+    def __neg__(self) -> "UnitArray":
+        return UnitArray(-self._values, self._dtype)
+
+    def __abs__(self) -> "UnitArray":
+        return UnitArray(np.abs(self._values), self._dtype)
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs, **kwargs):
+        """ Apply NumPy ufuncs through `MeasurementArray`, so `np.abs(series)` and `np.sqrt(series)` keep a unit. """
+
+        if "out" in kwargs or any(isinstance(value, (pd.Series, pd.Index, pd.DataFrame)) for value in inputs):
+            return NotImplemented
+        inputs = tuple(value.to_measurement_array() if isinstance(value, UnitArray) else value for value in inputs)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        return UnitArray.from_measurement_array(result) if isinstance(result, MeasurementArray) else result
+
+    def round(self, decimals: int = 0, *args, **kwargs) -> "UnitArray":
+        """ Round the values to a number of decimals, in the unit of the array. """
+
+        return UnitArray(np.round(self._values, decimals), self._dtype)
+
+    # Reductions
+
+    def _reduce(self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs):
+        """ Reduce the values to a measurement, or to the missing value when fewer than `min_count` are present. """
+
+        functions = {
+            "sum": np.nansum if skipna else np.sum,
+            "mean": np.nanmean if skipna else np.mean,
+            "median": np.nanmedian if skipna else np.median,
+            "min": np.nanmin if skipna else np.min,
+            "max": np.nanmax if skipna else np.max,
+            "std": np.nanstd if skipna else np.std,
+            "var": np.nanvar if skipna else np.var,
+        }
+        if name not in functions:
+            raise TypeError(f"'{type(self).__name__}' with dtype {self.dtype} does not support reduction '{name}'")
+        arguments = {"ddof": kwargs.get("ddof", 1)} if name in ("std", "var") else {}
+        if np.count_nonzero(~np.isnan(self._values)) < kwargs.get("min_count", 0):
+            value = np.nan
+        else:
+            value = float(functions[name](self._values, **arguments))
+        unit = self.unit * self.unit if name == "var" else self.unit
+        if keepdims:
+            return UnitArray([value], unit)
+        return self._dtype.na_value if np.isnan(value) else Measurement(value, unit)
+
+    def _quantile(self, qs: np.ndarray, interpolation: str) -> "UnitArray":
+        """ The quantiles of the values, in the unit of the array. Missing values are skipped. """
+
+        if self.isna().all():
+            return UnitArray(np.full(len(qs), np.nan), self._dtype)
+        return UnitArray(np.nanquantile(self._values, qs, method=interpolation), self._dtype)
+
+    def _groupby_op(self, *, how: str, has_dropped_na: bool, min_count: int, ngroups: int, ids: np.ndarray, **kwargs):
+        """ Aggregate or accumulate each group with NumPy, in the unit of the array. Other operations raise
+        NotImplementedError, so pandas falls back to aggregating each group through the public array interface.
+        """
+
+        skipna = kwargs.get("skipna", True)
+        if how in _GROUPBY_ACCUMULATIONS:
+            return UnitArray(_group_accumulate(self._values, ids, how, skipna=skipna), self._dtype)
+        if how in ("idxmin", "idxmax"):
+            return _group_positions(self._values, ids, ngroups, how)
+        if how in ("any", "all"):
+            raise TypeError(f"'{type(self).__name__}' with dtype {self.dtype} does not support groupby operation '{how}'")
+        if how not in _GROUPBY_AGGREGATIONS:
+            raise NotImplementedError(f"'{type(self).__name__}' does not implement groupby operation '{how}'")
+        result = _group_aggregate(self._values, ids, ngroups, how, min_count=min_count, skipna=skipna, ddof=kwargs.get("ddof", 1))
+        return UnitArray(result, self.unit * self.unit if how == "var" else self.unit)
+
+
+@register_series_accessor("ucx")
+class UnitSeriesAccessor:
+    """ Unit operations on a series with a `UnitDtype`, available as `series.ucx`. """
+
+    def __init__(self, series: pd.Series):
+        if not isinstance(series.dtype, UnitDtype):
+            raise AttributeError("The .ucx accessor is only available on series with a UnitDtype.")
+        self._series = series
+
+    @property
+    def unit(self) -> Unit:
+        """ The unit of the series. """
+
+        return self._series.dtype.unit
+
+    def convert_to(self, unit: Unit) -> pd.Series:
+        """ Convert the series to a new unit. """
+
+        return pd.Series(self._series.array.convert_to(unit), index=self._series.index, name=self._series.name)
@@ -0,0 +1,155 @@
+""" SQLite functions that convert measurements inside queries.
+
+`register` adds unit conversion functions and aggregates to a `sqlite3.Connection`, so reporting queries can
+convert and aggregate readings stored with a unit column without pulling the rows into Python first. Unit strings
+are parsed with `Unit.from_string`, and the scale and offset of every pair of unit strings is computed once and
+cached, so converting a row costs a cache lookup, a multiply and an add. The functions are registered as
+deterministic, so SQLite evaluates calls with constant arguments, like `ucalcx_factor('ft', 'm')`, once per
+statement.
+
+Functions (with the default prefix):
+
+- `ucalcx_convert(value, source, target)`: The value converted from the source unit to the target unit.
+- `ucalcx_factor(source, target)` and `ucalcx_offset(source, target)`: The scale and offset of a conversion.
+- `ucalcx_sum(value, unit, target)`, `ucalcx_avg(...)`, `ucalcx_min(...)` and `ucalcx_max(...)`: Aggregates over
+  values whose unit is given per row, in the target unit. Rows are grouped by unit, and each group is converted once
+  when the aggregate is finished.
+
+NULL values and units give NULL results, and are skipped by the aggregates. Units that cannot be parsed or
+converted raise an error, which SQLite reports as an `sqlite3.OperationalError`.
+
+Examples:
+    >>> import sqlite3
+    >>> from ucalcx.interop import sqlite
+    >>> connection = sqlite3.connect(":memory:")
+    >>> sqlite.register(connection)
+    >>> connection.execute("SELECT ucalcx_convert(5280, 'ft', 'mi')").fetchone()
+    (1.0,)
+    >>> _ = connection.execute("CREATE TABLE readings (value REAL, unit TEXT)")
+    >>> _ = connection.executemany("INSERT INTO readings VALUES (?, ?)", [(1, "km"), (500, "m"), (1000, "ft")])
+    >>> connection.execute("SELECT ucalcx_sum(value, unit, 'm') FROM readings").fetchone()
+    (1804.8,)
+"""
+
+import functools
+import math
+import sqlite3
+from typing import Optional
+from ..common import Unit
+
+
+FACTOR_CACHE_SIZE = 4096
+" The most pairs of unit strings whose conversion factors are cached. "
+
+
+@functools.lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def conversion_factors(source: str, target: str) -> tuple[float, float]:
+    """ The scale and offset that convert values from one unit string to another, cached per pair of strings.
+
+    Raises:
+        InvalidUnitError: If a unit string contains an unknown or ambiguous unit.
+        IncompatibleUnitsError: If the units measure different quantities.
+    """
+
+    return Unit.from_string(source).conversion_factors(Unit.from_string(target))
+
+
+def _convert(value: Optional[float], source: Optional[str], target: Optional[str]) -> Optional[float]:
+    if value is None or source is None or target is None:
+        return None
+    scale, offset = conversion_factors(source, target)
+    return value * scale + offset
+
+
+def _factor(source: Optional[str], target: Optional[str]) -> Optional[float]:
+    if source is None or target is None:
+        return None
+    return conversion_factors(source, target)[0]
+
+
+def _offset(source: Optional[str], target: Optional[str]) -> Optional[float]:
+    if source is None or target is None:
+        return None
+    return conversion_factors(source, target)[1]
+
+
+class _GroupedAggregate:
+    """ The base of the aggregates, which accumulate the values of each unit separately, in their own unit.
+
+    Sums are accumulated with Neumaier's compensated summation, so they match `math.fsum` closely without keeping
+    every value.
+    """
+
+    def __init__(self):
+        self.target: Optional[str] = None
+        self.groups: dict[str, list[float]] = {}
+
+    def step(self, value: Optional[float], unit: Optional[str], target: Optional[str]):
+        if value is None or unit is None or target is None:
+            return
+        self.target = target
+        group = self.groups.get(unit)
+        if group is None:
+            # Look the units up on the first row of each unit, so unknown units are reported straight away
+            conversion_factors(unit, target)
+            group = self.groups[unit] = [0.0, 0.0, 0, math.inf, -math.inf]
+        total = group[0] + value
+        if abs(group[0]) >= abs(value):
+            group[1] += (group[0] - total) + value
+        else:
+            group[1] += (value - total) + group[0]
+        group[0] = total
+        group[2] += 1
+        if value < group[3]:
+            group[3] = value
+        if value > group[4]:
+            group[4] = value
+
+    def _factors(self):
+        for unit, (total, compensation, count, smallest, largest) in self.groups.items():
+            yield (*conversion_factors(unit, self.target), total + compensation, count, smallest, largest)
+
+    def _total(self) -> tuple[float, int]:
+        parts = [(scale * total + offset * count, count) for scale, offset, total, count, _, _ in self._factors()]
+        return math.fsum(part for part, _ in parts), sum(count for _, count in parts)
+
+
+class _Sum(_GroupedAggregate):
+    def finalize(self) -> Optional[float]:
+        return self._total()[0] if self.groups else None
+
+
+class _Average(_GroupedAggregate):
+    def finalize(self) -> Optional[float]:
+        total, count = self._total()
+        return total / count if count else None
+
+
+class _Minimum(_GroupedAggregate):
+    def finalize(self) -> Optional[float]:
+        # A negative scale reverses the order of the values within a group
+        extremes = [(smallest if scale >= 0 else largest) * scale + offset for scale, offset, _, _, smallest, largest in self._factors()]
+        return min(extremes, default=None)
+
+
+class _Maximum(_GroupedAggregate):
+    def finalize(self) -> Optional[float]:
+        extremes = [(largest if scale >= 0 else smallest) * scale + offset for scale, offset, _, _, smallest, largest in self._factors()]
+        return max(extremes, default=None)
+
+
+def register(connection: sqlite3.Connection, prefix: str = "ucalcx"):
+    """ Register the unit conversion functions and aggregates on a connection.
+
+    Args:
+        connection (sqlite3.Connection): The connection to register the functions on.
+        prefix (str): The prefix of the function names. Defaults to `ucalcx`, e.g. `ucalcx_convert`.
+    """
+
+    connection.create_function(f"{prefix}_convert", 3, _convert, deterministic=True)
+    connection.create_function(f"{prefix}_factor", 2, _factor, deterministic=True)
+    connection.create_function(f"{prefix}_offset", 2, _offset, deterministic=True)
+    connection.create_aggregate(f"{prefix}_sum", 3, _Sum)
+    connection.create_aggregate(f"{prefix}_avg", 3, _Average)
+    connection.create_aggregate(f"{prefix}_min", 3, _Minimum)
+    connection.create_aggregate(f"{prefix}_max", 3, _Maximum)
@@ -4,6 +4,9 @@ METERS_PER_INCH = 0.0254
 
 class ImperialFundamentalLengthUnit(FundamentalLengthUnit):
     """ Represents an imperial fundamental length unit. """
+
+    __slots__ = ("inches_per_unit",)
+
     _name: str
     _symbol: str
 
@@ -10,6 +10,8 @@ class FundamentalLengthUnit(FundamentalQuantityUnit, ABC):
         name (str): The name of the unit (e.g. meter, inch, etc.)
         symbol (str): The symbol of the unit (e.g. m for meters, in for inches, etc.)
     """
+
+    __slots__ = ()
     
     def __init__(self, name: str, symbol: str):
         super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Length)
@@ -9,6 +9,8 @@ class Meter(FundamentalLengthUnit):
         metric_prefix (MetricPrefix): The metric prefix to use with the meter unit. Defaults to 
             MetricPrefix.Base.
     """
+
+    __slots__ = ("metric_prefix",)
     
     def __init__(self, metric_prefix: MetricPrefix=MetricPrefix.Base):
         super().__init__(name="meter", symbol="m")
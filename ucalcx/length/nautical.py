@@ -2,6 +2,8 @@ from .length_unit import FundamentalLengthUnit
 
 class NauticalFundamentalLengthUnit(FundamentalLengthUnit):
     """ Represents a nautical fundamental length unit. """
+
+    __slots__ = ("_meters_per_unit",)
     
     def __init__(self, name: str, symbol: str, meters_per_unit: float):
         super().__init__(name=name, symbol=symbol)
@@ -3,9 +3,11 @@ from abc import abstractmethod, ABC
 
 class FundamentalLuminousUnit(FundamentalQuantityUnit, ABC):
     """ A base class for units of luminous intensity. This class should not be instantiated directly. """
+
+    __slots__ = ()
     
     def __init__(self, name: str, symbol: str):
-        super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Current)
+        super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.LuminousIntensity)
 
     def _conversion_method(self, other: "FundamentalLuminousUnit", value: float) -> float:
         if not isinstance(other, FundamentalLuminousUnit):
@@ -20,6 +22,8 @@ class FundamentalLuminousUnit(FundamentalQuantityUnit, ABC):
 
 class Candela(FundamentalLuminousUnit):
     """ Represents a candela. """
+
+    __slots__ = ("metric_prefix",)
     
     def __init__(self, metric_prefix: MetricPrefix=MetricPrefix.Base):
         super().__init__(name="candela", symbol="cd")
@@ -1,22 +1,27 @@
 from .mass_unit import FundamentalMassUnit
 
+GRAMS_PER_OUNCE = 28.349523125
+" The international avoirdupois ounce, in grams. "
+
 class ImperialMassUnit(FundamentalMassUnit):
     """ Represents an imperial mass unit. 
     
     Converts to ounces for conversion, if the other unit is not an imperial mass unit,
-    converts to ouces, grams, and then the other unit.
+    converts to ounces, grams, and then the other unit.
     """
+
+    __slots__ = ("ounces_per_unit",)
     
     def __init__(self, name: str, symbol: str, ounces_per_unit: float):
         super().__init__(name=name, symbol=symbol)
         self.ounces_per_unit = ounces_per_unit
 
     def grams_per_unit(self) -> float:
-        return self.ounces_per_unit * 28.3495
+        return self.ounces_per_unit * GRAMS_PER_OUNCE
     
-    def _conversion_method(self, other: "ImperialMassUnit", value: float) -> float:
+    def _conversion_method(self, other: FundamentalMassUnit, value: float) -> float:
         if not isinstance(other, ImperialMassUnit):
-            raise ValueError(f"Tried to convert {self} to {other}. Expected two mass units.")
+            return super()._conversion_method(other, value)
                 
         return value * self.ounces_per_unit / other.ounces_per_unit
     
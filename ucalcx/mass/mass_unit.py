@@ -3,6 +3,8 @@ from abc import abstractmethod, ABC
 
 class FundamentalMassUnit(FundamentalQuantityUnit, ABC):
     """ A base class for units of mass. This class should not be instantiated directly. """
+
+    __slots__ = ()
     
     def __init__(self, name: str, symbol: str):
         super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Mass)
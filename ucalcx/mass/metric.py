@@ -4,6 +4,8 @@ from .mass_unit import FundamentalMassUnit
 
 class Gram(FundamentalMassUnit):
     """ Represents a gram, the base unit of mass in the metric system. """
+
+    __slots__ = ("metric_prefix",)
     
     def __init__(self, metric_prefix: MetricPrefix=MetricPrefix.Base):
         super().__init__(name="gram", symbol="g")
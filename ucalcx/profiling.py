@@ -0,0 +1,196 @@
+""" Opt-in instrumentation of the conversion and arithmetic hot paths.
+
+While profiling is enabled, calls to unit conversions, unit and measurement arithmetic and the expression lexer
+are counted and timed, aggregated per operation and per pair of units. Profiling works by replacing the
+instrumented methods with timed wrappers, and `disable` puts the original methods back, so there is no
+overhead at all while profiling is disabled. Only the outermost instrumented call of each thread is recorded, so
+a measurement conversion is counted once, not again for the unit conversions it makes.
+
+Examples:
+    >>> from ucalcx import profiling
+    >>> from ucalcx.length import meter, kilometer
+    >>> with profiling.profile():
+    ...     (5 * meter).convert_to(kilometer)
+    >>> profiling.snapshot()
+    {('Unit.convert_to', 'm', 'km'): CallStats(calls=1, total_seconds=2.1e-06, max_seconds=2.1e-06), ...}
+    >>> print(profiling.to_prometheus())
+"""
+
+import contextlib
+import functools
+import threading
+import time
+from typing import Callable, Iterator, NamedTuple
+from .common import FundamentalQuantityUnit, Unit, Measurement
+from .input.lexing import Lexer
+
+
+class CallStats(NamedTuple):
+    """ The number of calls to an operation, and the total and longest time spent in it. """
+
+    calls: int
+    total_seconds: float
+    max_seconds: float
+
+
+_lock = threading.Lock()
+_stats: dict[tuple[str, str, str], list[int]] = {}
+_originals: dict[tuple[type, str], Callable] = {}
+_local = threading.local()
+" The depth of the instrumented calls each thread is in, calls made inside another instrumented call are not recorded. "
+
+
+def _label(operand: object) -> str:
+    """ A short label for an operand, the symbol of units and measurements. """
+
+    if isinstance(operand, (Unit, FundamentalQuantityUnit)):
+        return operand.symbol
+    if isinstance(operand, Measurement):
+        return operand.unit.symbol
+    return type(operand).__name__
+
+
+def _record(key: tuple[str, str, str], elapsed: int):
+    """ Add the time of a call, in nanoseconds, to the statistics of its operation and units. """
+
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            _stats[key] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+
+def _instrument(owner: type, name: str, labels: Callable[..., tuple[str, str]]):
+    """ Replace a method with a wrapper that records the time of every outermost call. """
+
+    original = owner.__dict__[name]
+    operation = f"{owner.__qualname__}.{name}"
+
+    @functools.wraps(original)
+    def wrapper(*arguments, **keywords):
+        depth = getattr(_local, "depth", 0)
+        _local.depth = depth + 1
+        start = time.perf_counter_ns()
+        try:
+            return original(*arguments, **keywords)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            _local.depth = depth
+            if not depth:
+                _record((operation, *labels(*arguments, **keywords)), elapsed)
+
+    _originals[(owner, name)] = original
+    setattr(owner, name, wrapper)
+
+
+def _binary_labels(self, other, *arguments, **keywords) -> tuple[str, str]:
+    return _label(self), _label(other)
+
+
+def _no_labels(*arguments, **keywords) -> tuple[str, str]:
+    return "", ""
+
+
+def _unit_classes() -> Iterator[type]:
+    """ FundamentalQuantityUnit and all of its subclasses. """
+
+    pending = [FundamentalQuantityUnit]
+    while pending:
+        cls = pending.pop()
+        yield cls
+        pending.extend(cls.__subclasses__())
+
+
+def is_enabled() -> bool:
+    """ Check if profiling is enabled. """
+
+    return bool(_originals)
+
+
+def enable():
+    """ Start counting and timing calls to the instrumented operations. Enabling twice has no effect. """
+
+    with _lock:
+        if _originals:
+            return
+        for cls in _unit_classes():
+            if "convert_to" in cls.__dict__:
+                _instrument(cls, "convert_to", _binary_labels)
+        for name in ("convert_to", "__mul__", "__truediv__"):
+            _instrument(Unit, name, _binary_labels)
+        for name in ("convert_to", "__add__", "__sub__", "__mul__", "__truediv__"):
+            _instrument(Measurement, name, _binary_labels)
+        _instrument(Lexer, "lex", _no_labels)
+
+
+def disable():
+    """ Stop profiling and restore the original methods. The collected statistics are kept until `reset`. """
+
+    with _lock:
+        for (owner, name), original in _originals.items():
+            setattr(owner, name, original)
+        _originals.clear()
+
+
+def reset():
+    """ Discard the collected statistics. """
+
+    with _lock:
+        _stats.clear()
+
+
+@contextlib.contextmanager
+def profile():
+    """ Profile the calls made inside a `with` block. """
+
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> dict[tuple[str, str, str], CallStats]:
+    """ Get the statistics collected so far.
+
+    Returns:
+        dict[tuple[str, str, str], CallStats]: The statistics, keyed by the operation and the symbols of its
+            source and target units (empty for operations without units).
+    """
+
+    with _lock:
+        return {key: CallStats(calls, total / 1e9, longest / 1e9) for key, (calls, total, longest) in _stats.items()}
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def to_prometheus(prefix: str = "ucalcx") -> str:
+    """ Export the collected statistics in the Prometheus text exposition format.
+
+    Args:
+        prefix (str): The prefix of the metric names. Defaults to "ucalcx".
+
+    Returns:
+        str: The calls, total seconds and longest call of every operation, labelled by operation, source and target.
+    """
+
+    metrics = [
+        ("calls_total", "counter", "Number of calls to instrumented ucalcx operations.", lambda stats: stats.calls),
+        ("call_seconds_total", "counter", "Total time spent in instrumented ucalcx operations.", lambda stats: stats.total_seconds),
+        ("call_seconds_max", "gauge", "Longest single call to instrumented ucalcx operations.", lambda stats: stats.max_seconds),
+    ]
+    current = snapshot()
+    lines = []
+    for name, kind, description, value in metrics:
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for (operation, source, target), stats in current.items():
+            labels = f"operation=\"{_escape(operation)}\",source=\"{_escape(source)}\",target=\"{_escape(target)}\""
+            lines.append(f"{prefix}_{name}{{{labels}}} {value(stats)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,210 @@
+""" An asyncio conversion service speaking a JSON lines protocol over a local TCP or Unix socket.
+
+Each request is a JSON object on its own line, and each response is a JSON object on its own line carrying the
+`id` of its request. Responses are sent as soon as they are ready, so they may arrive out of order.
+
+Requests:
+    {"id": 1, "op": "convert", "value": 1.5, "from": "km", "to": "m"}
+    {"id": 2, "op": "evaluate", "expression": "9.81 m/s^2 to ft/s^2"}
+
+Responses:
+    {"id": 1, "value": 1500.0}
+    {"id": 2, "value": 32.185..., "unit": "ft/s^2"}
+    {"id": 3, "error": "..."}
+
+Concurrent `convert` requests for the same pair of units are coalesced into micro-batches, the conversion
+factors for each pair are resolved once and cached, and every batch is converted with one vectorized
+multiply and add.
+
+Run the service with `python -m ucalcx.service --port 8765` or `python -m ucalcx.service --unix /tmp/ucalcx.sock`.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import numpy as np
+from typing import Any, Optional
+from .exceptions import UCalcXError
+from .common import Unit
+from .input.parsing import Parser
+
+
+@functools.lru_cache(maxsize=4096)
+def conversion_factors(source: str, target: str) -> tuple[float, float]:
+    """ Get the scale and offset that convert values between two unit expressions, cached per pair of strings. """
+
+    return Unit.from_string(source).conversion_factors(Unit.from_string(target))
+
+
+class ConversionBatcher:
+    """ Coalesces concurrent conversions of the same pair of units into a single vectorized conversion.
+
+    A batch is opened by the first request for a pair of units, and converted `delay` seconds later, or as soon
+    as it holds `max_batch` values. With the default delay of zero, a batch collects every request for the pair
+    that arrives within the same iteration of the event loop.
+
+    Args:
+        delay (float): How long to wait for more requests before converting a batch, in seconds.
+        max_batch (int): The largest number of values in a batch.
+    """
+
+    def __init__(self, delay: float = 0.0, max_batch: int = 1024):
+        self.delay = delay
+        self.max_batch = max_batch
+        self.batches = 0
+        self.conversions = 0
+        self._pending: dict[tuple[str, str], list[tuple[float, asyncio.Future]]] = {}
+
+    async def convert(self, value: float, source: str, target: str) -> float:
+        """ Convert a value between two unit expressions, as part of a batch. """
+
+        loop = asyncio.get_running_loop()
+        key = (source, target)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            if self.delay > 0:
+                loop.call_later(self.delay, self._flush, key, batch)
+            else:
+                loop.call_soon(self._flush, key, batch)
+        future = loop.create_future()
+        batch.append((value, future))
+        if len(batch) >= self.max_batch:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: tuple[str, str], batch: list[tuple[float, asyncio.Future]]):
+        """ Convert every value in a batch and resolve its futures. """
+
+        if self._pending.get(key) is not batch:
+            # The batch was already converted when it became full
+            return
+        del self._pending[key]
+        self.batches += 1
+        self.conversions += len(batch)
+        try:
+            scale, offset = conversion_factors(*key)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        values = np.fromiter((value for value, _ in batch), dtype=np.float64, count=len(batch)) * scale + offset
+        for (_, future), value in zip(batch, values.tolist()):
+            if not future.done():
+                future.set_result(value)
+
+
+class ConversionService:
+    """ Handles JSON lines requests from clients of the conversion service.
+
+    Args:
+        batcher (Optional[ConversionBatcher]): The batcher used for conversions. Defaults to a new batcher.
+    """
+
+    def __init__(self, batcher: Optional[ConversionBatcher] = None):
+        self.batcher = batcher if batcher is not None else ConversionBatcher()
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """ Handle a single decoded request, returning the response. """
+
+        response = {"id": request.get("id")}
+        try:
+            operation = request.get("op")
+            if operation == "convert":
+                value = request["value"]
+                if isinstance(value, list):
+                    scale, offset = conversion_factors(request["from"], request["to"])
+                    response["value"] = (np.asarray(value, dtype=np.float64) * scale + offset).tolist()
+                else:
+                    response["value"] = await self.batcher.convert(float(value), request["from"], request["to"])
+            elif operation == "evaluate":
+                measurement, target = Parser.from_string(request["expression"]).parse_conversion()
+                if target is not None:
+                    measurement = measurement.convert_to(target)
+                response["value"] = measurement.value
+                response["unit"] = measurement.unit.symbol
+            else:
+                raise ValueError(f"Unknown operation {operation}, expected convert or evaluate.")
+        except KeyError as error:
+            response["error"] = f"Missing field {error.args[0]}."
+        except (UCalcXError, ValueError, TypeError) as error:
+            response["error"] = str(error)
+        except Exception as error:
+            response["error"] = f"Internal error: {type(error).__name__}: {error}"
+        return response
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object.")
+        except ValueError as error:
+            response = {"id": None, "error": f"Invalid request: {error}"}
+        else:
+            response = await self.handle_request(request)
+        if not writer.is_closing():
+            writer.write(json.dumps(response).encode() + b"\n")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """ Serve the requests of a single client connection, answering them concurrently. """
+
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                if writer.transport.get_write_buffer_size() > 1 << 20:
+                    await writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, path: Optional[str] = None,
+                service: Optional[ConversionService] = None) -> asyncio.AbstractServer:
+    """ Start the conversion service.
+
+    Args:
+        host (str): The address to listen on. Defaults to the local host only.
+        port (int): The TCP port to listen on. Defaults to 8765.
+        path (Optional[str]): The path of a Unix socket to listen on instead of a TCP port.
+        service (Optional[ConversionService]): The service that handles requests. Defaults to a new service.
+
+    Returns:
+        asyncio.AbstractServer: The running server.
+    """
+
+    service = service if service is not None else ConversionService()
+    if path is not None:
+        return await asyncio.start_unix_server(service.handle_connection, path=path)
+    return await asyncio.start_server(service.handle_connection, host=host, port=port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the ucalcx conversion service.")
+    parser.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    parser.add_argument("--port", type=int, default=8765, help="The TCP port to listen on.")
+    parser.add_argument("--unix", default=None, help="The path of a Unix socket to listen on instead of a TCP port.")
+    parser.add_argument("--batch-delay", type=float, default=0.0, help="How long to wait for more requests in a batch, in seconds.")
+    arguments = parser.parse_args()
+
+    async def run():
+        service = ConversionService(ConversionBatcher(delay=arguments.batch_delay))
+        server = await serve(arguments.host, arguments.port, arguments.unix, service)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+""" Systems of units, like SI, CGS and US customary, and the conversion of measurements into them.
+
+A unit system names a unit for every fundamental quantity, and optionally a preferred unit for some dimensions,
+like miles per hour rather than feet per second for speeds in US customary units. A measurement is converted to
+a system by replacing the unit of each of its quantities with the unit of the system, keeping the powers, unless
+the system prefers another unit for the measurement's dimension.
+
+The target unit and the conversion factors for each source unit are resolved once and cached by the system, so
+converting a stream of records in mixed units costs one dictionary lookup, a multiply and an add per record.
+
+Examples:
+    >>> from ucalcx import Measurement, Unit
+    >>> from ucalcx.systems import US_CUSTOMARY, CGS
+    >>> Measurement(100, Unit.from_string("km/h")).to_system(US_CUSTOMARY)
+    Measurement(62.13711922373341, mile/hour (mi/h))
+    >>> Measurement(9.81, Unit.from_string("m/s^2")).to_system(CGS)
+    Measurement(981.0, centimeter/second^2 (cm/s^2))
+"""
+
+from typing import Iterable, Mapping
+from .common import FundamentalQuantity, FundamentalQuantityUnit, Measurement, MeasurementArray, Unit
+from .length import meter, centimeter, imperial, nautical
+from .mass import kilogram, gram, pound
+from .time_quantity import second
+from .time_quantity.time_unit import hour
+from .temperature import kelvin, celsius, fahrenheit
+from .electric_current import ampere, abampere
+from .luminous_intensity import candela
+from .amount_of_substance import mole
+
+
+Plan = tuple[Unit, float, float]
+" The target unit, scale and offset of the conversion of a unit to a system. "
+
+
+class UnitSystem:
+    """ A system of units, with a unit for every fundamental quantity and preferred units for some dimensions.
+
+    Args:
+        name (str): The name of the system.
+        units (Mapping[FundamentalQuantity, FundamentalQuantityUnit]): The unit of each fundamental quantity.
+            Quantities without a unit keep the unit they are measured in.
+        preferred (Iterable[Unit]): Units to use for their dimension instead of the combination of the units
+            of its quantities, e.g. `mile / hour` for speeds.
+
+    Examples:
+        >>> from ucalcx.length import imperial
+        >>> from ucalcx.time_quantity.time_unit import hour
+        >>> road = UnitSystem("road", {FundamentalQuantity.Length: imperial.mile, FundamentalQuantity.Time: hour})
+        >>> road.target(Unit.from_string("m/s")).symbol
+        'mi/h'
+    """
+
+    def __init__(self, name: str, units: Mapping[FundamentalQuantity, FundamentalQuantityUnit], preferred: Iterable[Unit] = ()):
+        self.name = name
+        self.units = dict(units)
+        self.preferred = {unit.dimensionality: unit for unit in preferred}
+        self._plans: dict[tuple, Plan] = {}
+
+    def plan(self, unit: Unit | FundamentalQuantityUnit) -> Plan:
+        """ The target unit in this system of a unit, and the scale and offset of the conversion, cached per unit.
+
+        Raises:
+            InvalidUnitError: If the unit is not a valid unit.
+        """
+
+        try:
+            return self._plans[unit.key]
+        except KeyError:
+            pass
+        except AttributeError:
+            unit = Unit.coerce(unit)
+        plan = self._plans.get(unit.key)
+        if plan is None:
+            target = self.preferred.get(unit.dimensionality)
+            if target is None:
+                target = Unit.from_fundamental_units(*((self.units.get(unit_.quantity, unit_), power) for unit_, power in unit._terms))
+            plan = self._plans[unit.key] = (target, *unit.conversion_factors(target))
+        return plan
+
+    def target(self, unit: Unit | FundamentalQuantityUnit) -> Unit:
+        """ The unit that measurements in a unit are converted to in this system. """
+
+        return self.plan(unit)[0]
+
+    def convert(self, measurement: Measurement) -> Measurement:
+        """ Convert a measurement to this system. See `Measurement.to_system`. """
+
+        target, scale, offset = self.plan(measurement.unit)
+        if type(measurement) is not Measurement:
+            # Subclasses carry more than a value, like an uncertainty, and convert it themselves
+            return measurement.convert_to(target)
+        # The target is always a valid unit, so the checks of the constructor are skipped
+        converted = Measurement.__new__(Measurement)
+        converted._value = measurement.value * scale + offset
+        converted._unit = target
+        converted._normalized_key = None
+        return converted
+
+    def convert_array(self, array: MeasurementArray) -> MeasurementArray:
+        """ Convert every value of an array to this system, with one vectorized multiply and add. """
+
+        return array.convert_to(self.target(array.unit))
+
+    def convert_all(self, measurements: Iterable[Measurement]) -> list[Measurement]:
+        """ Convert measurements in any mix of units to this system. """
+
+        return [self.convert(measurement) for measurement in measurements]
+
+    def clear_cache(self):
+        """ Forget the conversion plans, after the units of the system have been changed. """
+
+        self._plans.clear()
+
+    def __repr__(self) -> str:
+        return f"UnitSystem({self.name})"
+
+
+SI = UnitSystem("SI", {FundamentalQuantity.Length: meter, FundamentalQuantity.Mass: kilogram, FundamentalQuantity.Time: second,
+                       FundamentalQuantity.Current: ampere, FundamentalQuantity.Temperature: kelvin,
+                       FundamentalQuantity.AmountOfSubstance: mole, FundamentalQuantity.LuminousIntensity: candela})
+" The International System of Units, in its base units. "
+
+CGS = UnitSystem("CGS", {**SI.units, FundamentalQuantity.Length: centimeter, FundamentalQuantity.Mass: gram,
+                         FundamentalQuantity.Current: abampere})
+" The centimeter-gram-second system, with currents in abamperes (the electromagnetic variant). "
+
+US_CUSTOMARY = UnitSystem("US customary", {**SI.units, FundamentalQuantity.Length: imperial.foot, FundamentalQuantity.Mass: pound,
+                                           FundamentalQuantity.Temperature: fahrenheit},
+                          preferred=[imperial.mile / hour])
+" United States customary units, feet, pounds and degrees Fahrenheit, with speeds in miles per hour. "
+
+IMPERIAL = US_CUSTOMARY
+" British imperial units, which share the units of length, mass and temperature available here with US customary units. "
+
+NAUTICAL = UnitSystem("nautical", {**SI.units, FundamentalQuantity.Length: nautical.nautical_mile, FundamentalQuantity.Temperature: celsius},
+                      preferred=[nautical.nautical_mile / hour])
+" Nautical units, distances in nautical miles, speeds in knots (nautical miles per hour) and temperatures in degrees Celsius. "
@@ -1,12 +1,30 @@
 from .common import FundamentalQuantityUnit, FundamentalQuantity
 from abc import abstractmethod, ABC
+from fractions import Fraction
 
 class FundamentalTemperatureUnit(FundamentalQuantityUnit, ABC):
     """ A base class for units of temperature. This class should not be instantiated directly. """
+
+    __slots__ = ()
+
+    _degree: Fraction = Fraction(1)
+    " The size of a degree of the unit, in degrees Celsius. "
+
+    _freezing_point: Fraction = Fraction(0)
+    " The reading of the unit at 0 °C. "
     
     def __init__(self, name: str, symbol: str):
         super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Temperature)
 
+    def conversion_factors(self, other: "FundamentalTemperatureUnit") -> tuple[float, float]:
+        """ Get the scale and offset that convert values from this unit to another, from the exact size and zero point
+        of the degrees of both units, so each factor is only rounded once. """
+
+        if not isinstance(other, FundamentalTemperatureUnit):
+            return super().conversion_factors(other)
+        scale = self._degree / other._degree
+        return float(scale), float(other._freezing_point - self._freezing_point * scale)
+
     def _conversion_method(self, other: "FundamentalTemperatureUnit", value: float) -> float:
         if not isinstance(other, FundamentalTemperatureUnit):
             raise ValueError(f"Tried to convert {self} to {other}. Expected two mass units.")
@@ -24,6 +42,8 @@ class FundamentalTemperatureUnit(FundamentalQuantityUnit, ABC):
 
 class Celsius(FundamentalTemperatureUnit):
     """ Represents a degree Celsius. """
+
+    __slots__ = ()
     
     def __init__(self):
         super().__init__(name="celsius", symbol="°C")
@@ -37,6 +57,10 @@ class Celsius(FundamentalTemperatureUnit):
 
 class Fahrenheit(FundamentalTemperatureUnit):
     """ Represents a degree Fahrenheit. """
+
+    __slots__ = ()
+    _degree = Fraction(5, 9)
+    _freezing_point = Fraction(32)
     
     def __init__(self):
         super().__init__(name="fahrenheit", symbol="°F")
@@ -50,18 +74,25 @@ class Fahrenheit(FundamentalTemperatureUnit):
 
 class Kelvin(FundamentalTemperatureUnit):
     """ Represents the unit of temperature Kelvin. """
+
+    __slots__ = ()
+    _freezing_point = Fraction("273.15")
     
     def __init__(self):
         super().__init__(name="kelvin", symbol="K")
 
     def to_celsius(self, value: float) -> float:
-        return value + 273.15
+        return value - 273.15
     
     def from_celsius(self, value: float) -> float:
-        return value - 273.15
+        return value + 273.15
     
 class Rankine(FundamentalTemperatureUnit):
     """ Represents the unit of temperature Rankine. """
+
+    __slots__ = ()
+    _degree = Fraction(5, 9)
+    _freezing_point = Fraction("491.67")
     
     def __init__(self):
         super().__init__(name="rankine", symbol="°R")
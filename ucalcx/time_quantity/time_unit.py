@@ -3,6 +3,8 @@ from ..common import FundamentalQuantity, FundamentalQuantityUnit, MetricPrefix
 
 class FundamentalTimeUnit(FundamentalQuantityUnit):
     """ A base class for units of time. This class should not be instantiated directly. """
+
+    __slots__ = ("_seconds_per_unit",)
     
     def __init__(self, name: str, symbol: str, seconds_per_unit):
         super().__init__(name=name, symbol=symbol, quantity=FundamentalQuantity.Time)
@@ -20,6 +22,8 @@ class FundamentalTimeUnit(FundamentalQuantityUnit):
 
 class Second(FundamentalTimeUnit):
     """ Represents a second. """
+
+    __slots__ = ("metric_prefix",)
     
     def __init__(self, metric_prefix=MetricPrefix.Base):
         super().__init__(name="second", symbol="s", seconds_per_unit=1.0)
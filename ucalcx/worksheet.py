@@ -0,0 +1,444 @@
+""" Worksheets of named, interdependent unit expressions that are re-evaluated incrementally.
+
+A worksheet is a set of named cells, each holding a measurement or an expression over measurements and other
+cells, e.g. `load = mass * 9.81 m/s^2`. The worksheet tracks which cells reference which, and when a cell changes
+it re-evaluates only the cells downstream of it, in dependency order, stopping early along any path where a
+result did not change. Editing an input of a large worksheet costs time in proportion to the cells it affects,
+not to the size of the worksheet.
+
+Every cell is parsed once, when it is set. The first time a cell is evaluated with a given combination of units
+in the cells it references, the units of its result and of every intermediate step are inferred, and the cell
+is compiled into a function over plain floats with all conversion factors folded in. The compiled function is
+cached per combination of units, so re-evaluating a cell after its inputs change value, but not unit, does no
+unit arithmetic at all.
+
+Expressions are made of numbers with optional units, cell names, `+`, `-`, `*`, `/`, integer powers with `^`,
+parentheses, and a trailing conversion like `to ft`. An identifier directly after a number is a unit, anywhere
+else it is the name of a cell.
+
+Examples:
+    >>> from ucalcx.worksheet import Worksheet
+    >>> sheet = Worksheet()
+    >>> sheet["width"] = "3 m"
+    >>> sheet["depth"] = "250 cm"
+    >>> sheet["area"] = "width * depth to ft^2"
+    >>> sheet["area"]
+    Measurement(80.729..., foot^2 (ft^2))
+    >>> sheet.set("depth", "4 m")
+    ['depth', 'area']
+"""
+
+from typing import Callable, Iterator, Optional, Union
+from .common import FundamentalQuantityUnit, Measurement, Unit
+from .exceptions import CircularReferenceError, InvalidUnitError, InvalidValueError, UCalcXError
+from .input.lexing import Vocabulary
+from .input.parsing import Parser
+
+
+Expression = tuple
+" A node of a parsed expression, a tuple of the node's kind followed by its operands. "
+
+CompiledCell = tuple[Callable[[tuple[float, ...]], float], Unit]
+" A cell compiled for the units of its references, a function of the values of the references and the unit of its result. "
+
+
+class ExpressionParser(Parser):
+    """ A parser for worksheet expressions, arithmetic over measurements and cell names.
+
+    Args:
+        tokens (list[Token]): The tokens to parse.
+    """
+
+    def parse_expression(self) -> Expression:
+        """ Parse a full cell expression, a sum of terms with an optional trailing conversion. """
+
+        tree = self.parse_sum()
+        if self.at_conversion():
+            self.advance()
+            tree = ("convert", tree, self.parse_unit())
+        self.expect_end()
+        return tree
+
+    def parse_sum(self) -> Expression:
+        tree = self.parse_term()
+        while (token := self.peek()) is not None and token.type == "ADDOPS":
+            self.advance()
+            tree = ("add" if token.value == "+" else "subtract", tree, self.parse_term())
+        return tree
+
+    def parse_term(self) -> Expression:
+        tree = self.parse_signed()
+        while (token := self.peek()) is not None and token.type == "MULOPS":
+            self.advance()
+            tree = ("multiply" if token.value == "*" else "divide", tree, self.parse_signed())
+        return tree
+
+    def parse_signed(self) -> Expression:
+        token = self.peek()
+        if token is not None and token.type == "ADDOPS":
+            self.advance()
+            operand = self.parse_signed()
+            return ("negate", operand) if token.value == "-" else operand
+        return self.parse_power()
+
+    def parse_power(self) -> Expression:
+        tree = self.parse_atom()
+        if (token := self.peek()) is not None and token.type == "POW":
+            self.advance()
+            sign = 1
+            if self.peek() is not None and self.peek().type == "ADDOPS":
+                sign = -1 if self.advance().value == "-" else 1
+            exponent = self.advance()
+            if exponent.type != "NUMBER" or not exponent.value.isdigit():
+                raise InvalidValueError(f"Measurements can only be raised to integer powers, not {exponent.value}.")
+            tree = ("power", tree, sign * int(exponent.value))
+        return tree
+
+    def parse_atom(self) -> Expression:
+        token = self.advance()
+        if token.type == "NUMBER":
+            value = float(token.value)
+            if self._at_unit(self.position):
+                return ("constant", value, self.parse_literal_unit())
+            return ("constant", value, Unit.from_fundamental_units())
+        if token.type == "IDENTIFIER":
+            return ("reference", token.value)
+        if token.type == "LPAREN":
+            tree = self.parse_sum()
+            if self.advance().type != "RPAREN":
+                raise InvalidValueError("Expected a closing parenthesis.")
+            return tree
+        raise InvalidValueError(f"Unexpected {token.value} at token {self.position - 1}.")
+
+    def parse_literal_unit(self) -> Unit:
+        """ Parse the unit of a number, stopping at the first `*` or `/` that is not followed by a unit. """
+
+        unit = self.parse_unit_factor()
+        while (token := self.peek()) is not None and token.type == "MULOPS" and self._at_unit(self.position + 1):
+            self.advance()
+            factor = self.parse_unit_factor()
+            self._check_consistent(unit, factor)
+            unit = unit * factor if token.value == "*" else unit / factor
+        return unit
+
+    def _at_unit(self, position: int) -> bool:
+        """ Check if the token at a position starts a unit, a unit symbol or a parenthesis around one. """
+
+        while position < len(self.tokens) and self.tokens[position].type == "LPAREN":
+            position += 1
+        if position >= len(self.tokens) or self.tokens[position].type not in ("IDENTIFIER", "KEYWORD"):
+            return False
+        try:
+            FundamentalQuantityUnit.lookup(self.tokens[position].value)
+        except InvalidUnitError:
+            return False
+        return True
+
+
+def references(tree: Expression) -> tuple[str, ...]:
+    """ The names of the cells referenced by an expression, in order of first appearance. """
+
+    found = {}
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        if node[0] == "reference":
+            found.setdefault(node[1])
+        else:
+            pending.extend(reversed([operand for operand in node[1:] if isinstance(operand, tuple)]))
+    return tuple(found)
+
+
+def compile_expression(tree: Expression, names: tuple[str, ...], units: tuple[Unit, ...]) -> CompiledCell:
+    """ Infer the unit of an expression, and compile it into a function over plain floats.
+
+    Args:
+        tree (Expression): The parsed expression.
+        names (tuple[str, ...]): The names of the cells referenced by the expression.
+        units (tuple[Unit, ...]): The units of the referenced cells, in the same order.
+
+    Returns:
+        CompiledCell: A function taking the values of the referenced cells in the same order, and the unit of its result.
+
+    Raises:
+        IncompatibleUnitsError: If the expression adds, subtracts or converts incompatible units.
+    """
+
+    kind = tree[0]
+    if kind == "constant":
+        _, value, unit = tree
+        return (lambda values: value), unit
+    if kind == "reference":
+        index = names.index(tree[1])
+        return (lambda values: values[index]), units[index]
+    if kind == "negate":
+        operand, unit = compile_expression(tree[1], names, units)
+        return (lambda values: -operand(values)), unit
+    if kind == "power":
+        operand, unit = compile_expression(tree[1], names, units)
+        power = tree[2]
+        return (lambda values: operand(values) ** power), unit ** power
+    if kind == "convert":
+        operand, unit = compile_expression(tree[1], names, units)
+        scale, offset = unit.conversion_factors(tree[2])
+        return (lambda values: operand(values) * scale + offset), tree[2]
+
+    left, left_unit = compile_expression(tree[1], names, units)
+    right, right_unit = compile_expression(tree[2], names, units)
+    if kind in ("add", "subtract"):
+        # The right-hand side is converted to the unit of the left-hand side, as in Measurement.__add__
+        scale, offset = right_unit.conversion_factors(left_unit)
+        if kind == "add":
+            return (lambda values: left(values) + (right(values) * scale + offset)), left_unit
+        return (lambda values: left(values) - (right(values) * scale + offset)), left_unit
+
+    # Shared quantities are converted to the units of the left-hand side, as in Measurement.__mul__
+    aligned = right_unit.aligned_with(left_unit)
+    scale, _ = right_unit.conversion_factors(aligned)
+    if kind == "multiply":
+        return (lambda values: left(values) * (right(values) * scale)), left_unit * aligned
+    return (lambda values: left(values) / (right(values) * scale)), left_unit / aligned
+
+
+class Cell:
+    """ A named cell of a worksheet.
+
+    Attributes:
+        name (str): The name of the cell.
+        expression (str): The expression of the cell, as it was set.
+        tree (Expression): The parsed expression.
+        references (tuple[str, ...]): The names of the cells the expression references.
+        value (Optional[Measurement]): The result of the last evaluation, None if it failed.
+        error (Optional[UCalcXError]): The error of the last evaluation, None if it succeeded.
+        plans (dict[tuple[Unit, ...], CompiledCell]): The compiled expression for every combination of units of
+            the referenced cells seen so far.
+    """
+
+    def __init__(self, name: str, expression: str, tree: Expression):
+        self.name = name
+        self.expression = expression
+        self.tree = tree
+        self.references = references(tree)
+        self.value: Optional[Measurement] = None
+        self.error: Optional[UCalcXError] = None
+        self.plans: dict[tuple[Unit, ...], CompiledCell] = {}
+
+    def __repr__(self):
+        return f"Cell({self.name} = {self.expression}: {self.value if self.error is None else self.error})"
+
+
+class Worksheet:
+    """ A set of named cells that are re-evaluated incrementally when a cell changes.
+
+    Attributes:
+        evaluations (int): The number of cell evaluations so far.
+        compilations (int): The number of times a cell was compiled for a new combination of units.
+    """
+
+    def __init__(self):
+        self._cells: dict[str, Cell] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self.evaluations = 0
+        self.compilations = 0
+
+    def set(self, name: str, expression: Union[str, Measurement]) -> list[str]:
+        """ Set the expression of a cell, and re-evaluate the cells affected by the change.
+
+        Args:
+            name (str): The name of the cell.
+            expression (Union[str, Measurement]): An expression, or a measurement for an input cell.
+
+        Returns:
+            list[str]: The names of the cells that were re-evaluated, in the order they were evaluated.
+
+        Raises:
+            InvalidValueError: If the name is not a valid cell name or the expression is malformed.
+            InvalidUnitError: If the expression contains an unknown unit.
+            CircularReferenceError: If the cell would depend on itself. The worksheet is left unchanged.
+        """
+
+        self._check_name(name)
+        if isinstance(expression, Measurement):
+            cell = Cell(name, str(expression), ("constant", expression.value, expression.unit))
+        else:
+            cell = Cell(name, expression, ExpressionParser.from_string(expression).parse_expression())
+        self._check_cycles(name, cell.references)
+
+        previous = self._cells.get(name)
+        if previous is not None:
+            for reference in previous.references:
+                self._dependents[reference].discard(name)
+        for reference in cell.references:
+            self._dependents.setdefault(reference, set()).add(name)
+        self._cells[name] = cell
+        return self._propagate(name, self._result(previous) if previous is not None else ())
+
+    def remove(self, name: str) -> list[str]:
+        """ Remove a cell, and re-evaluate the cells that referenced it, which will report an error.
+
+        Returns:
+            list[str]: The names of the cells that were re-evaluated.
+        """
+
+        cell = self._cells.pop(name)
+        for reference in cell.references:
+            self._dependents[reference].discard(name)
+        return self._propagate(name)
+
+    def recalculate(self) -> list[str]:
+        """ Re-evaluate every cell, in dependency order.
+
+        Returns:
+            list[str]: The names of the cells, in the order they were evaluated.
+        """
+
+        order = []
+        visited = set()
+        for name in self._cells:
+            if name not in visited:
+                order.extend(self._downstream(name, visited))
+        order = [name for name in reversed(order) if name in self._cells]
+        for name in order:
+            self._evaluate(self._cells[name])
+        return order
+
+    def dependencies(self, name: str) -> tuple[str, ...]:
+        """ The names of the cells referenced by a cell. """
+
+        return self._cells[name].references
+
+    def dependents(self, name: str) -> "set[str]":
+        """ The names of the cells that reference a cell. """
+
+        return set(self._dependents.get(name, ()))
+
+    def cell(self, name: str) -> Cell:
+        """ Get a cell, with its expression, references, value and error. """
+
+        return self._cells[name]
+
+    def _check_name(self, name: str):
+        vocabulary = Vocabulary()
+        if not isinstance(name, str) or not vocabulary.IDENTIFIERS.fullmatch(name) or name.startswith("°") or \
+                any(keyword.fullmatch(name) for keyword in vocabulary.keywords):
+            raise InvalidValueError(f"{name} is not a valid cell name, cell names must be identifiers and not keywords.")
+
+    def _check_cycles(self, name: str, references: tuple[str, ...]):
+        """ Ensure that none of the references of a cell depend on the cell. """
+
+        pending = list(references)
+        visited = set()
+        while pending:
+            reference = pending.pop()
+            if reference == name:
+                raise CircularReferenceError(f"Setting {name} would create a circular reference.")
+            if reference not in visited and reference in self._cells:
+                visited.add(reference)
+                pending.extend(self._cells[reference].references)
+
+    def _downstream(self, name: str, visited: "set[str]") -> list[str]:
+        """ The cells downstream of a cell, including itself, in reverse dependency order (a depth first post-order). """
+
+        visited.add(name)
+        order = []
+        stack = [(name, iter(self._dependents.get(name, ())))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(self._dependents.get(child, ()))))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+        return order
+
+    def _propagate(self, name: str, previous: tuple = ()) -> list[str]:
+        """ Re-evaluate a changed cell and the cells downstream of it, skipping cells whose references did not change.
+
+        Args:
+            name (str): The name of the cell that changed.
+            previous (tuple): The result of the cell before it changed, used to stop early when it is unchanged.
+        """
+
+        changed = set()
+        evaluated = []
+        for node in reversed(self._downstream(name, set())):
+            cell = self._cells.get(node)
+            if cell is None:
+                # The cell was removed, everything that references it is affected
+                changed.add(node)
+                continue
+            if node == name:
+                before = previous
+            elif changed.isdisjoint(cell.references):
+                continue
+            else:
+                before = self._result(cell)
+            self._evaluate(cell)
+            evaluated.append(node)
+            if self._result(cell) != before:
+                changed.add(node)
+        return evaluated
+
+    @staticmethod
+    def _result(cell: Cell) -> tuple:
+        if cell.error is not None:
+            return (cell.error,)
+        return (cell.value.value, cell.value.unit) if cell.value is not None else ()
+
+    def _evaluate(self, cell: Cell):
+        """ Evaluate a cell from the current values of its references, compiling it for new units. """
+
+        self.evaluations += 1
+        cell.value, cell.error = None, None
+        inputs = []
+        for reference in cell.references:
+            source = self._cells.get(reference)
+            if source is None:
+                cell.error = InvalidValueError(f"{cell.name} references {reference}, which is not defined.")
+                return
+            if source.error is not None:
+                cell.error = InvalidValueError(f"{cell.name} depends on {reference}, which failed: {source.error}")
+                return
+            inputs.append(source.value)
+
+        units = tuple(measurement.unit for measurement in inputs)
+        try:
+            plan = cell.plans.get(units)
+            if plan is None:
+                plan = cell.plans[units] = compile_expression(cell.tree, cell.references, units)
+                self.compilations += 1
+            function, unit = plan
+            cell.value = Measurement(function(tuple(measurement.value for measurement in inputs)), unit)
+        except UCalcXError as error:
+            cell.error = error
+        except (ArithmeticError, ValueError) as error:
+            cell.error = InvalidValueError(f"Cannot evaluate {cell.name}: {error}")
+
+    def __setitem__(self, name: str, expression: Union[str, Measurement]):
+        self.set(name, expression)
+
+    def __getitem__(self, name: str) -> Measurement:
+        """ Get the value of a cell, raising the error of the cell if its evaluation failed. """
+
+        cell = self._cells[name]
+        if cell.error is not None:
+            raise cell.error
+        return cell.value
+
+    def __delitem__(self, name: str):
+        self.remove(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._cells
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __repr__(self):
+        return f"Worksheet({list(self._cells.values())})"